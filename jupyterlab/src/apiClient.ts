@@ -1,17 +1,25 @@
 import {
   APIClient,
   APIMeta,
+  ArtifactDeletionJob,
+  BatchUpdateTrialsResponse,
   CompareStudiesPlotType,
   CreateNewStudyResponse,
+  DeleteStudyResponse,
   FeedbackComponentType,
   GeneratePlotlyGraphQueryRequest,
   GeneratePlotlyGraphQueryResponse,
+  ListTrialsQuery,
+  ListTrialsResponse,
+  Note,
   ParamImportancesResponse,
   PlotResponse,
   PlotType,
   ReGeneratePlotlyGraphQueryRequest,
   ReGeneratePlotlyGraphQueryResponse,
   RenameStudyResponse,
+  RenamedStudy,
+  StudyCopyJob,
   StudyDetail,
   StudyDetailResponse,
   StudySummariesResponse,
@@ -19,6 +27,9 @@ import {
   Trial,
   TrialFilterQueryRequest,
   TrialFilterQueryResponse,
+  TrialPage,
+  TrialUpdate,
+  TrialUpdateResult,
   UploadArtifactAPIResponse,
 } from "@optuna/optuna-dashboard"
 import * as Optuna from "@optuna/types"
@@ -116,31 +127,54 @@ export class JupyterlabAPIClient extends APIClient {
   deleteStudy = (
     studyId: number,
     removeAssociatedArtifacts: boolean
-  ): Promise<void> =>
-    requestAPI<void>(`/api/studies/${studyId}`, {
+  ): Promise<ArtifactDeletionJob | null> =>
+    requestAPI<DeleteStudyResponse>(`/api/studies/${studyId}`, {
       method: "DELETE",
       body: JSON.stringify({
         remove_associated_artifacts: removeAssociatedArtifacts,
       }),
-    }).then(() => {
-      return
+    }).then((res) => {
+      return res.artifact_deletion_job ?? null
     })
-  renameStudy = (studyId: number, studyName: string): Promise<StudySummary> =>
+  getArtifactDeletionJob = (jobId: string): Promise<ArtifactDeletionJob> =>
+    requestAPI<ArtifactDeletionJob>(`/api/artifact_deletion_jobs/${jobId}`, {
+      method: "GET",
+    }).then((res) => res)
+  renameStudy = (studyId: number, studyName: string): Promise<RenamedStudy> =>
     requestAPI<RenameStudyResponse>(`/api/studies/${studyId}/rename`, {
       body: JSON.stringify({ study_name: studyName }),
       method: "POST",
     }).then((res) => {
       return {
-        study_id: res.study_id,
-        study_name: res.study_name,
-        directions: res.directions,
-        user_attrs: res.user_attrs,
-        is_preferential: res.is_prefential,
-        datetime_start: res.datetime_start
-          ? new Date(res.datetime_start)
-          : undefined,
+        study: {
+          study_id: res.study_id,
+          study_name: res.study_name,
+          directions: res.directions,
+          user_attrs: res.user_attrs,
+          is_preferential: res.is_prefential,
+          datetime_start: res.datetime_start
+            ? new Date(res.datetime_start)
+            : undefined,
+        },
+        studyCopyJob: res.study_copy_job ?? null,
       }
     })
+  getStudyCopyJob = (jobId: string): Promise<StudyCopyJob> =>
+    requestAPI<StudyCopyJob>(`/api/study_copy_jobs/${jobId}`, {
+      method: "GET",
+    }).then((res) => res)
+  getStudyNote = (studyId: number, cacheVersion: string): Promise<Note> =>
+    requestAPI<Note>(
+      `/api/studies/${studyId}/note?version=${cacheVersion}`
+    ).then((res) => res)
+  getTrialNote = (
+    studyId: number,
+    trialId: number,
+    cacheVersion: string
+  ): Promise<Note> =>
+    requestAPI<Note>(
+      `/api/studies/${studyId}/notes/${trialId}?version=${cacheVersion}`
+    ).then((res) => res)
   saveStudyNote = (
     studyId: number,
     note: { version: number; body: string }
@@ -165,16 +199,15 @@ export class JupyterlabAPIClient extends APIClient {
   uploadTrialArtifact = (
     studyId: number,
     trialId: number,
-    fileName: string,
-    dataUrl: string
+    file: File
   ): Promise<UploadArtifactAPIResponse> =>
     requestAPI<UploadArtifactAPIResponse>(
-      `/api/artifacts/${studyId}/${trialId}`,
+      `/api/artifacts/${studyId}/${trialId}?filename=${encodeURIComponent(
+        file.name
+      )}`,
       {
-        body: JSON.stringify({
-          file: dataUrl,
-          filename: fileName,
-        }),
+        body: file,
+        headers: { "Content-Type": "application/octet-stream" },
         method: "POST",
       }
     ).then((res) => {
@@ -182,16 +215,16 @@ export class JupyterlabAPIClient extends APIClient {
     })
   uploadStudyArtifact = (
     studyId: number,
-    fileName: string,
-    dataUrl: string
+    file: File
   ): Promise<UploadArtifactAPIResponse> =>
-    requestAPI<UploadArtifactAPIResponse>(`/api/artifacts/${studyId}`, {
-      body: JSON.stringify({
-        file: dataUrl,
-        filename: fileName,
-      }),
-      method: "POST",
-    }).then((res) => {
+    requestAPI<UploadArtifactAPIResponse>(
+      `/api/artifacts/${studyId}?filename=${encodeURIComponent(file.name)}`,
+      {
+        body: file,
+        headers: { "Content-Type": "application/octet-stream" },
+        method: "POST",
+      }
+    ).then((res) => {
       return res
     })
   deleteTrialArtifact = (
@@ -210,6 +243,10 @@ export class JupyterlabAPIClient extends APIClient {
     }).then(() => {
       return
     })
+  listTrials = (studyId: number, query: ListTrialsQuery): Promise<TrialPage> =>
+    requestAPI<ListTrialsResponse>(
+      `/api/studies/${studyId}/trials?${this.convertListTrialsQuery(query)}`
+    ).then((res) => this.convertTrialPage(res))
   tellTrial = async (
     trialId: number,
     state: Optuna.TrialStateFinished,
@@ -237,6 +274,11 @@ export class JupyterlabAPIClient extends APIClient {
     })
     return
   }
+  batchUpdateTrials = (updates: TrialUpdate[]): Promise<TrialUpdateResult[]> =>
+    requestAPI<BatchUpdateTrialsResponse>("/api/trials/batch", {
+      body: JSON.stringify({ updates }),
+      method: "POST",
+    }).then((res) => res.results)
   getParamImportances = (
     studyId: number
   ): Promise<Optuna.ParamImportance[][]> =>
@@ -298,6 +340,16 @@ export class JupyterlabAPIClient extends APIClient {
     requestAPI<PlotResponse>(
       `/api/studies/${studyId}/plot/${plotType}`
     ).then<PlotResponse>((res) => res)
+  getPlotlyGraphObject = (
+    studyId: number,
+    graphObjectId: string,
+    version: string
+  ): Promise<PlotResponse> =>
+    requestAPI<PlotResponse>(
+      `/api/studies/${studyId}/plotly/${encodeURIComponent(
+        graphObjectId
+      )}?version=${version}`
+    ).then<PlotResponse>((res) => res)
   getCompareStudiesPlot = (
     studyIds: number[],
     plotType: CompareStudiesPlotType
@@ -6,6 +6,7 @@ import functools
 import importlib
 import io
 from itertools import chain
+import json
 import logging
 import mimetypes
 import os
@@ -28,8 +29,12 @@ from optuna.trial import TrialState
 from . import _note as note
 from ._bottle_util import BottleViewReturn
 from ._bottle_util import json_api_view
-from ._custom_plot_data import get_plotly_graph_objects
+from ._bottle_util import set_versioned_cache_headers
+from ._cached_study import CachedStudy
+from ._custom_plot_data import get_plotly_graph_object
+from ._distribution_table import get_distribution_table
 from ._importance import get_param_importance_from_trials_cache
+from ._importance import ImportanceConfig
 from ._inmemory_cache import get_cached_extra_study_property
 from ._inmemory_cache import InMemoryCache
 from ._pareto_front import get_pareto_front_trials
@@ -41,19 +46,38 @@ from ._preferential_history import report_history
 from ._preferential_history import restore_history
 from ._rdb_migration import register_rdb_migration_route
 from ._serializer import serialize_frozen_study
+from ._serializer import serialize_frozen_trial
 from ._serializer import serialize_study_detail
+from ._storage import apply_trial_updates
+from ._storage import ConcurrentWriteError
 from ._storage import create_new_study
 from ._storage import get_studies
 from ._storage import get_study
 from ._storage import get_trials
+from ._storage import rename_study_in_place
+from ._storage import TrialUpdate
 from ._storage_url import get_storage
-from .artifact._backend import delete_all_artifacts
+from ._study_copy import COPY_BATCH_SIZE
+from ._study_copy import copy_study
+from ._study_copy import StudyCopyJobManager
+from ._system_attrs_view import StudySystemAttrsView
+from ._trial_columns import get_trial_columns
+from ._trial_query import compile_filters
+from ._trial_query import DEFAULT_LIMIT
+from ._trial_query import get_trial_column_index
+from ._trial_query import InvalidTrialQuery
+from ._trial_query import parse_states
+from ._trial_query import query_trials
+from .artifact._backend import list_artifact_ids
 from .artifact._backend import register_artifact_route
 from .artifact._backend_to_store import to_artifact_store
+from .artifact._deletion import ArtifactDeletionJobManager
+from .artifact._deletion import MAX_SYNC_DELETION_SIZE
+from .artifact._deletion import remove_artifacts
+from .artifact._index import invalidate_artifact_index
 from .llm._api_views import register_llm_route
 from .preferential._study import _SYSTEM_ATTR_PREFERENTIAL_STUDY
 from .preferential._study import get_best_trials as get_best_preferential_trials
-from .preferential._system_attrs import get_skipped_trial_ids
 from .preferential._system_attrs import report_skip
 
 
@@ -88,9 +112,18 @@ def create_app(
     debug: bool = False,
     jupyterlab_extension_context: JupyterLabExtensionContext | None = None,
     allow_unsafe: bool = False,
+    importance_config: ImportanceConfig | None = None,
+    compress_notes: bool = False,
+    compact_trials: bool = False,
+    trial_columns: bool = False,
 ) -> Bottle:
     app = Bottle()
-    app._inmemory_cache = InMemoryCache()
+    app._inmemory_cache = InMemoryCache(
+        enable_trial_columns=trial_columns, compact_trials=compact_trials
+    )
+    app._artifact_deletion_jobs = ArtifactDeletionJobManager()
+    app._study_copy_jobs = StudyCopyJobManager()
+    importance_config = importance_config or ImportanceConfig()
 
     @app.hook("before_request")
     def remove_trailing_slashes_hook() -> None:
@@ -191,54 +224,100 @@ def create_app(
             response.status = 400  # Bad request
             return {"reason": "You need to set study_name and direction"}
 
-        src_study_name = storage.get_study_name_from_id(study_id)
         try:
-            src_study = optuna.load_study(storage=storage, study_name=src_study_name)
+            storage.get_study_name_from_id(study_id)
         except KeyError:
             response.status = 404  # Not found
             return {"reason": f"study_id={study_id} is not found"}
 
         try:
-            dst_study = optuna.create_study(
-                storage=storage, study_name=dst_study_name, directions=src_study.directions
+            if rename_study_in_place(storage, study_id, dst_study_name):
+                renamed_study = get_study(storage, study_id)
+                if renamed_study is None:
+                    response.status = 500
+                    return {"reason": "Failed to load the renamed study"}
+                response.status = 201
+                return serialize_frozen_study(renamed_study)
+
+            # The other storages cannot rename studies, so the study is copied.
+            dst_study_id = storage.create_new_study(
+                storage.get_study_directions(study_id), study_name=dst_study_name
             )
-            dst_study.add_trials(src_study.get_trials(deepcopy=False))
-            for key, value in src_study.user_attrs.items():
-                dst_study.set_user_attr(key, value)
-            note.copy_notes(storage, src_study, dst_study)
         except DuplicatedStudyError:
             response.status = 400  # Bad request
             return {"reason": "Study name already exists."}
+
+        n_trials = storage.get_n_trials(study_id)
+        if n_trials > COPY_BATCH_SIZE:
+            # Large studies are copied in the background to avoid timeouts.
+            job = app._study_copy_jobs.start(storage, study_id, dst_study_id, n_trials)
+            new_study = get_study(storage, dst_study_id)
+            if new_study is None:
+                response.status = 500
+                return {"reason": "Failed to load the new study"}
+            response.status = 202  # Accepted
+            return {**serialize_frozen_study(new_study), "study_copy_job": job.to_dict()}
+
+        try:
+            copy_study(storage, study_id, dst_study_id)
         except Exception:
             logger.exception("Unexpected error:")
             response.status = 500
-            storage.delete_study(dst_study._study_id)
             return {"reason": "Failed to rename study."}
-        new_study = get_study(storage, dst_study._study_id)
+        new_study = get_study(storage, dst_study_id)
         if new_study is None:
             response.status = 500
             return {"reason": "Failed to load the new study"}
 
-        storage.delete_study(src_study._study_id)
+        storage.delete_study(study_id)
         response.status = 201
         return serialize_frozen_study(new_study)
 
+    @app.get("/api/study_copy_jobs/<job_id>")
+    @json_api_view
+    def get_study_copy_job(job_id: str) -> dict[str, Any]:
+        job = app._study_copy_jobs.get(job_id)
+        if job is None:
+            response.status = 404  # Not found
+            return {"reason": f"job_id={job_id} is not found"}
+        return job.to_dict()
+
     @app.delete("/api/studies/<study_id:int>")
     @json_api_view
     def delete_study(study_id: int) -> dict[str, Any]:
         data = request.json or {}
         remove_associated_artifacts = data.get("remove_associated_artifacts", True)
 
-        if artifact_store is not None and remove_associated_artifacts:
-            delete_all_artifacts(artifact_store, storage, study_id)
-
+        artifact_ids = []
         try:
+            if artifact_store is not None and remove_associated_artifacts:
+                artifact_ids = list_artifact_ids(storage, study_id)
             storage.delete_study(study_id)
         except KeyError:
             response.status = 404  # Not found
             return {"reason": f"study_id={study_id} is not found"}
-        response.status = 204  # No content
-        return {}
+        invalidate_artifact_index(app._inmemory_cache, study_id)
+
+        if artifact_store is None or len(artifact_ids) == 0:
+            response.status = 204  # No content
+            return {}
+        if len(artifact_ids) <= MAX_SYNC_DELETION_SIZE:
+            remove_artifacts(artifact_store, artifact_ids)
+            response.status = 204  # No content
+            return {}
+        # Many artifacts are removed in the background since it may take a long time.
+        job = app._artifact_deletion_jobs.start(artifact_store, study_id, artifact_ids)
+        response.status = 202  # Accepted
+        return {"artifact_deletion_job": job.to_dict()}
+
+    @app.get("/api/artifact_deletion_jobs/<job_id>")
+    @json_api_view
+    def get_artifact_deletion_job(job_id: str) -> dict[str, Any]:
+        job = app._artifact_deletion_jobs.get(job_id)
+        if job is None:
+            response.status = 404  # Not found
+            return {"reason": f"job_id={job_id} is not found"}
+        return job.to_dict()
 
     @app.get("/api/studies/<study_id:int>")
     @json_api_view
@@ -258,15 +337,22 @@ def create_app(
         trials = get_trials(app._inmemory_cache, storage, study_id)
 
         system_attrs = getattr(study, "system_attrs", {})
+        system_attrs_view = StudySystemAttrsView(system_attrs)
         is_preferential = system_attrs.get(_SYSTEM_ATTR_PREFERENTIAL_STUDY, False)
+        columns = get_trial_columns(app._inmemory_cache, study_id, trials)
         # TODO(c-bata): Cache best_trials
         if is_preferential:
             best_trials = get_best_preferential_trials(study_id, storage)
         elif len(study.directions) == 1:
-            if len([t for t in trials if t.state == TrialState.COMPLETE]) == 0:
+            if columns is not None:
+                best_trial = columns.get_best_trial(study.directions[0])
+                best_trials = [best_trial] if best_trial is not None else []
+            elif len([t for t in trials if t.state == TrialState.COMPLETE]) == 0:
                 best_trials = []
             else:
                 best_trials = [storage.get_best_trial(study_id)]
+        elif columns is not None:
+            best_trials = columns.get_pareto_front_trials(study.directions)
         else:
             best_trials = get_pareto_front_trials(trials=trials, directions=study.directions)
         (
@@ -278,9 +364,13 @@ def create_app(
             has_intermediate_values,
         ) = get_cached_extra_study_property(app._inmemory_cache, study_id, trials)
 
-        plotly_graph_objects = get_plotly_graph_objects(system_attrs)
-        skipped_trial_ids = get_skipped_trial_ids(system_attrs)
-        skipped_trial_numbers = [t.number for t in trials if t._trial_id in skipped_trial_ids]
+        if columns is not None:
+            skipped_trial_numbers = columns.get_numbers_of_trial_ids(
+                system_attrs_view.skipped_trial_ids
+            )
+        else:
+            skipped_trial_ids = set(system_attrs_view.skipped_trial_ids)
+            skipped_trial_numbers = [t.number for t in trials if t._trial_id in skipped_trial_ids]
         return serialize_study_detail(
             study,
             best_trials,
@@ -289,15 +379,61 @@ def create_app(
             union,
             union_user_attrs,
             has_intermediate_values,
-            plotly_graph_objects,
+            system_attrs_view.plotly_graph_object_versions,
             skipped_trial_numbers,
+            system_attrs_view,
+            get_distribution_table(app._inmemory_cache, study_id),
         )
 
+    @app.get("/api/studies/<study_id:int>/trials")
+    @json_api_view
+    def list_trials(study_id: int) -> dict[str, Any]:
+        study = get_study(storage, study_id)
+        if study is None:
+            response.status = 404  # Not found
+            return {"reason": f"study_id={study_id} is not found"}
+
+        index = get_trial_column_index(app._inmemory_cache, storage, study_id)
+        try:
+            try:
+                limit = int(request.params.get("limit", DEFAULT_LIMIT))
+                filters = json.loads(request.params.get("filters", "[]"))
+            except ValueError:
+                raise InvalidTrialQuery("limit and filters must be an integer and a JSON.")
+            trials, next_cursor = query_trials(
+                index,
+                states=parse_states(request.params.get("states", "")),
+                filters=compile_filters(index, filters),
+                sort_by=request.params.get("sort_by", "number"),
+                order=request.params.get("order", "asc"),
+                limit=limit,
+                cursor=request.params.get("cursor"),
+            )
+        except InvalidTrialQuery as e:
+            response.status = 400  # Bad request
+            return {"reason": str(e)}
+
+        system_attrs_view = StudySystemAttrsView(getattr(study, "system_attrs", {}))
+        distribution_table = get_distribution_table(app._inmemory_cache, study_id)
+        return {
+            "trials": [
+                serialize_frozen_trial(
+                    study_id,
+                    trial,
+                    system_attrs_view.trial_attrs(trial._trial_id),
+                    distribution_table,
+                )
+                for trial in trials
+            ],
+            "next_cursor": next_cursor,
+            "n_trials": len(index.trials),
+        }
+
     @app.get("/api/studies/<study_id:int>/param_importances")
     @json_api_view
     def get_param_importances(study_id: int) -> dict[str, Any]:
         try:
-            n_directions = len(storage.get_study_directions(study_id))
+            directions = storage.get_study_directions(study_id)
         except KeyError:
             response.status = 404  # Study is not found
             return {"reason": f"study_id={study_id} is not found"}
@@ -307,12 +443,13 @@ def create_app(
             importances = [
                 get_param_importance_from_trials_cache(
                     app._inmemory_cache,
-                    storage,
                     study_id,
+                    directions,
                     objective_id,
                     trials,
+                    importance_config,
                 )
-                for objective_id in range(n_directions)
+                for objective_id in range(len(directions))
             ]
             return {"param_importances": importances}
         except ValueError as e:
@@ -323,8 +460,12 @@ def create_app(
     @app.get("/api/studies/<study_id:int>/plot/<plot_type>")
     @json_api_view
     def get_plot(study_id: int, plot_type: str) -> dict[str, Any]:
-        study = optuna.load_study(
-            study_name=storage.get_study_name_from_id(study_id), storage=storage
+        frozen_study = get_study(storage, study_id)
+        if frozen_study is None:
+            response.status = 404  # Not found
+            return {"reason": f"study_id={study_id} is not found"}
+        study = CachedStudy.from_frozen_study(
+            frozen_study, get_trials(app._inmemory_cache, storage, study_id)
         )
         if plot_type == "contour":
             fig = optuna.visualization.plot_contour(study)
@@ -354,11 +495,18 @@ def create_app(
     @app.get("/api/compare-studies/plot/<plot_type>")
     @json_api_view
     def get_compare_studies_plot(plot_type: str) -> dict[str, Any]:
-        study_ids = map(int, request.query.getall("study_ids[]"))
-        studies = [
-            optuna.load_study(study_name=storage.get_study_name_from_id(study_id), storage=storage)
-            for study_id in study_ids
-        ]
+        study_ids = list(map(int, request.query.getall("study_ids[]")))
+        studies: list[optuna.Study] = []
+        for study_id in study_ids:
+            frozen_study = get_study(storage, study_id)
+            if frozen_study is None:
+                response.status = 404  # Not found
+                return {"reason": "Some of the specified studies are not found."}
+            studies.append(
+                CachedStudy.from_frozen_study(
+                    frozen_study, get_trials(app._inmemory_cache, storage, study_id)
+                )
+            )
         if plot_type == "edf":
             fig = optuna.visualization.plot_edf(studies)
         else:
@@ -384,7 +532,24 @@ def create_app(
                 "note": note.get_note_from_system_attrs(system_attrs, None),
             }
 
-        note.save_note_with_version(storage, study_id, None, req_note_ver, req_note_body)
+        try:
+            note.save_note_with_version(
+                storage,
+                study_id,
+                None,
+                req_note_ver,
+                req_note_body,
+                system_attrs,
+                compress=compress_notes,
+            )
+        except ConcurrentWriteError:
+            response.status = 409  # Conflict
+            system_attrs = storage.get_study_system_attrs(study_id)
+            return {
+                "reason": "The text you are editing has changed. "
+                "Please copy your edits and refresh the page.",
+                "note": note.get_note_from_system_attrs(system_attrs, None),
+            }
         response.status = 204  # No content
         return {}
 
@@ -473,31 +638,11 @@ def create_app(
     @app.post("/api/trials/<trial_id:int>/tell")
     @json_api_view
     def tell_trial(trial_id: int) -> dict[str, Any]:
-        if "state" not in request.json:
-            response.status = 400  # Bad request
-            return {"reason": "state must be specified."}
-
         try:
-            state = TrialState[request.json["state"].upper()]
-        except Exception:  # To catch KeyError and Exception by non str case.
-            response.status = 400  # Bad request
-            return {"reason": "state must be either 'Complete' or 'Fail'."}
-
-        if state not in [TrialState.COMPLETE, TrialState.FAIL]:
+            state, values = _parse_tell_request(request.json)
+        except ValueError as e:
             response.status = 400  # Bad request
-            return {"reason": "state must be either 'Complete' or 'Fail'."}
-
-        values = None
-        if state == TrialState.COMPLETE:
-            vs = request.json.get("values")
-            if vs is None:
-                response.status = 400  # Bad request
-                return {"reason": "values attribute is required when state is 'Complete'."}
-            try:
-                values = [float(v) for v in vs]
-            except (ValueError, TypeError):
-                response.status = 400  # Bad request
-                return {"reason": "values attribute must be an array of numbers"}
+            return {"reason": str(e)}
 
         storage.set_trial_state_values(trial_id, state, values)
 
@@ -518,6 +663,32 @@ def create_app(
         response.status = 204
         return {}
 
+    @app.post("/api/trials/batch")
+    @json_api_view
+    def batch_update_trials() -> dict[str, Any]:
+        items = request.json.get("updates")
+        if not isinstance(items, list) or not items:
+            response.status = 400  # Bad request
+            return {"reason": "updates must be a non-empty array."}
+
+        # Invalid items are reported without stopping the other updates.
+        results: list[dict[str, Any]] = [{} for _ in items]
+        updates: list[TrialUpdate] = []
+        update_indices: list[int] = []
+        for i, item in enumerate(items):
+            try:
+                updates.append(_parse_trial_update(item))
+            except ValueError as e:
+                item_trial_id = item.get("trial_id") if isinstance(item, dict) else None
+                results[i] = {"trial_id": item_trial_id, "error": str(e)}
+            else:
+                update_indices.append(i)
+
+        errors = apply_trial_updates(storage, updates)
+        for i, update, error in zip(update_indices, updates, errors):
+            results[i] = {"trial_id": update.trial_id, "error": error}
+        return {"results": results}
+
     @app.post("/api/studies/<study_id:int>/<trial_id:int>/skip")
     @json_api_view
     def skip_trial(study_id: int, trial_id: int) -> dict[str, Any]:
@@ -554,10 +725,78 @@ def create_app(
                 "note": note.get_note_from_system_attrs(system_attrs, trial_id),
             }
 
-        note.save_note_with_version(storage, study_id, trial_id, req_note_ver, req_note_body)
+        try:
+            note.save_note_with_version(
+                storage,
+                study_id,
+                trial_id,
+                req_note_ver,
+                req_note_body,
+                system_attrs,
+                compress=compress_notes,
+            )
+        except ConcurrentWriteError:
+            response.status = 409  # Conflict
+            system_attrs = storage.get_study_system_attrs(study_id)
+            return {
+                "reason": "The text you are editing has changed. "
+                "Please copy your edits and refresh the page.",
+                "note": note.get_note_from_system_attrs(system_attrs, trial_id),
+            }
         response.status = 204  # No content
         return {}
 
+    @app.get("/api/studies/<study_id:int>/note")
+    @json_api_view
+    def get_study_note(study_id: int) -> dict[str, Any] | str:
+        return _get_note(study_id, None)
+
+    @app.get("/api/studies/<study_id:int>/notes/<trial_id:int>")
+    @json_api_view
+    def get_trial_note(study_id: int, trial_id: int) -> dict[str, Any] | str:
+        return _get_note(study_id, trial_id)
+
+    def _get_note(study_id: int, trial_id: int | None) -> dict[str, Any] | str:
+        try:
+            system_attrs = storage.get_study_system_attrs(study_id)
+        except KeyError:
+            response.status = 404  # Not found
+            return {"reason": f"study_id={study_id} is not found"}
+        if trial_id is not None:
+            try:
+                trial_number = storage.get_trial(trial_id).number
+                found = (
+                    storage.get_trial_id_from_study_id_trial_number(study_id, trial_number)
+                    == trial_id
+                )
+            except KeyError:
+                found = False
+            if not found:
+                response.status = 404  # Not found
+                return {"reason": f"trial_id={trial_id} is not found in study_id={study_id}"}
+        if set_versioned_cache_headers(note.get_note_cache_version(system_attrs, trial_id)):
+            response.status = 304  # Not modified
+            return ""
+        return dict(note.get_note_from_system_attrs(system_attrs, trial_id))
+
+    @app.get("/api/studies/<study_id:int>/plotly/<graph_object_id>")
+    @json_api_view
+    def get_plotly_graph_object_json(study_id: int, graph_object_id: str) -> dict[str, Any] | str:
+        try:
+            system_attrs = storage.get_study_system_attrs(study_id)
+        except KeyError:
+            response.status = 404  # Not found
+            return {"reason": f"study_id={study_id} is not found"}
+        graph_object = get_plotly_graph_object(system_attrs, graph_object_id)
+        if graph_object is None:
+            response.status = 404  # Not found
+            return {"reason": f"graph_object_id={graph_object_id} is not found"}
+        version, graph_object_json = graph_object
+        if set_versioned_cache_headers(version):
+            response.status = 304  # Not modified
+            return ""
+        return graph_object_json
+
     @app.get("/csv/<study_id:int>")
     def download_csv(study_id: int) -> BottleViewReturn:
         trial_ids_str = request.query.get("trial_ids", "")
@@ -570,20 +809,25 @@ def create_app(
                 return {"reason": "Invalid trial_ids format. Expected comma-separated integers"}
 
         # Create a CSV file
-        try:
-            study_name = storage.get_study_name_from_id(study_id)
-            study = optuna.load_study(storage=storage, study_name=study_name)
-        except KeyError:
+        frozen_study = get_study(storage, study_id)
+        if frozen_study is None:
             response.status = 404  # Not found
             return {"reason": f"study_id={study_id} is not found"}
+        study_name = frozen_study.study_name
+        # Trials are read from the cache as they are, since the CSV does not need Optuna's APIs.
+        trials = get_trials(app._inmemory_cache, storage, study_id)
+        study = CachedStudy.from_frozen_study(frozen_study, [])
 
         if trial_ids is not None:
-            trials = [t for t in study.trials if t.number in trial_ids]
+            columns = get_trial_columns(app._inmemory_cache, study_id, trials)
+            if columns is not None:
+                trials = columns.get_trials_of_numbers(trial_ids)
+            else:
+                trial_id_set = set(trial_ids)
+                trials = [t for t in trials if t.number in trial_id_set]
             if not trials:
                 response.status = 404
                 return {"reason": "all specified trial_ids is not found"}
-        else:
-            trials = study.trials
 
         param_names = sorted(set(chain.from_iterable([t.params.keys() for t in trials])))
         user_attr_names = sorted(set(chain.from_iterable([t.user_attrs.keys() for t in trials])))
@@ -603,8 +847,11 @@ def create_app(
         writer.writerow(column_names)
         for frozen_trial in trials:
             row = [frozen_trial.number, frozen_trial.state.name]
-            row.extend(frozen_trial.values if frozen_trial.values is not None else [None] * n_objs)
-            row.extend([frozen_trial.params.get(name, None) for name in param_names])
+            values = frozen_trial.values
+            row.extend(values if values is not None else [None] * n_objs)
+            # Cached trials may build the params on every access.
+            params = frozen_trial.params
+            row.extend([params.get(name, None) for name in param_names])
             row.extend([frozen_trial.user_attrs.get(name, None) for name in user_attr_names])
             writer.writerow(row)
 
@@ -644,6 +891,48 @@ def create_app(
     return app
 
 
+def _parse_tell_request(body: dict[str, Any]) -> tuple[TrialState, list[float] | None]:
+    if "state" not in body:
+        raise ValueError("state must be specified.")
+
+    try:
+        state = TrialState[body["state"].upper()]
+    except Exception:  # To catch KeyError and Exception by non str case.
+        raise ValueError("state must be either 'Complete' or 'Fail'.")
+
+    if state not in [TrialState.COMPLETE, TrialState.FAIL]:
+        raise ValueError("state must be either 'Complete' or 'Fail'.")
+
+    values = None
+    if state == TrialState.COMPLETE:
+        vs = body.get("values")
+        if vs is None:
+            raise ValueError("values attribute is required when state is 'Complete'.")
+        try:
+            values = [float(v) for v in vs]
+        except (ValueError, TypeError):
+            raise ValueError("values attribute must be an array of numbers")
+    return state, values
+
+
+def _parse_trial_update(item: Any) -> TrialUpdate:
+    if not isinstance(item, dict):
+        raise ValueError("Each update must be an object.")
+    trial_id = item.get("trial_id")
+    if not isinstance(trial_id, int) or isinstance(trial_id, bool):
+        raise ValueError("trial_id must be an integer.")
+    user_attrs = item.get("user_attrs", {})
+    if not isinstance(user_attrs, dict):
+        raise ValueError("user_attrs must be an object.")
+
+    update = TrialUpdate(trial_id, user_attrs=user_attrs)
+    if "state" in item:
+        update.state, update.values = _parse_tell_request(item)
+    elif not user_attrs:
+        raise ValueError("Either user_attrs or state must be specified.")
+    return update
+
+
 def run_server(
     storage: str | BaseStorage,
     host: str = "localhost",
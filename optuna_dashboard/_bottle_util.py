@@ -14,12 +14,13 @@ from typing import Union
 
 from bottle import BaseResponse
 from bottle import HTTPError
+from bottle import request
 from bottle import response
 
 
 BottleViewReturn = Union[str, bytes, Dict[str, Any], BaseResponse]
 BottleView = TypeVar("BottleView", bound=Callable[..., BottleViewReturn])
-BottleAPIView = TypeVar("BottleAPIView", bound=Callable[..., Dict[str, Any]])
+BottleAPIView = TypeVar("BottleAPIView", bound=Callable[..., Union[str, Dict[str, Any]]])
 logger = logging.getLogger(__name__)
 
 
@@ -43,6 +44,23 @@ def json_api_view(view: BottleAPIView) -> BottleAPIView:
     return cast(BottleAPIView, decorated)
 
 
+def set_versioned_cache_headers(version: str) -> bool:
+    """Set the caching headers of a resource that never changes for the same ``version``.
+
+    Clients can request the resource with ``?version=<version>`` to cache it forever.
+    Returns :obj:`True` if the client already has this version, i.e. the view should
+    respond with 304 Not Modified.
+    """
+    etag = f'"{version}"'
+    response.set_header("ETag", etag)
+    if request.query.get("version") == version:
+        response.set_header("Cache-Control", "public, max-age=31536000, immutable")
+    else:
+        response.set_header("Cache-Control", "no-cache")
+    if_none_match = request.get_header("If-None-Match", "")
+    return etag in (t.strip() for t in if_none_match.split(","))
+
+
 def parse_data_uri(data_uri: str) -> tuple[str, bytes]:
     prefix, a = data_uri.split(":", 1)
     if prefix != "data":
@@ -0,0 +1,132 @@
+from __future__ import annotations
+
+from collections.abc import Container
+import copy
+from typing import TYPE_CHECKING
+
+from optuna.study import Study
+from optuna.study import StudyDirection
+from optuna.trial import TrialState
+
+from ._compact_trial import to_frozen_trials
+from ._named_objectives import SYSTEM_ATTR_METRIC_NAMES
+
+
+if TYPE_CHECKING:
+    from typing import Any
+    from typing import Optional
+
+    from optuna.study._frozen import FrozenStudy
+    from optuna.trial import FrozenTrial
+
+
+_CONSTRAINTS_KEY = "constraints"
+
+
+class CachedStudy(Study):
+    """A read-only Study that is built purely from cached trials.
+
+    Unlike ``optuna.load_study()``, this class never accesses the storage nor sets up a
+    sampler, so it is cheap to pass to Optuna's APIs like ``get_param_importances()``
+    and ``optuna.visualization``. Methods that write to the study are not supported.
+    """
+
+    def __init__(
+        self,
+        study_id: int,
+        study_name: str,
+        directions: list[StudyDirection],
+        trials: list[FrozenTrial],
+        *,
+        user_attrs: dict[str, Any] | None = None,
+        system_attrs: dict[str, Any] | None = None,
+    ) -> None:
+        # Study.__init__() is not called on purpose since it accesses the storage.
+        self.study_name = study_name
+        self._study_id = study_id
+        self._directions = list(directions)
+        # Optuna's APIs require FrozenTrial, so compact records of the cache are converted
+        # when they are read, only for the requested states.
+        self._cached_trials = trials
+        self._frozen_trials: dict[Optional[tuple[TrialState, ...]], list[FrozenTrial]] = {}
+        self._user_attrs = user_attrs or {}
+        self._system_attrs = system_attrs or {}
+
+    @classmethod
+    def from_frozen_study(cls, study: FrozenStudy, trials: list[FrozenTrial]) -> CachedStudy:
+        return cls(
+            study._study_id,
+            study.study_name,
+            study.directions,
+            trials,
+            user_attrs=study.user_attrs,
+            system_attrs=study.system_attrs,
+        )
+
+    @property
+    def user_attrs(self) -> dict[str, Any]:
+        return copy.deepcopy(self._user_attrs)
+
+    @property
+    def system_attrs(self) -> dict[str, Any]:
+        return copy.deepcopy(self._system_attrs)
+
+    @property
+    def metric_names(self) -> list[str] | None:
+        return self._system_attrs.get(SYSTEM_ATTR_METRIC_NAMES)
+
+    # The best trial is computed from the cached trials, since Study.best_trial reads it from
+    # the storage on Optuna 3.x.
+    @property
+    def best_trial(self) -> FrozenTrial:
+        return self._get_best_trial(deepcopy=True)
+
+    @property
+    def best_value(self) -> float:
+        best_value = self._get_best_trial(deepcopy=False).value
+        assert best_value is not None
+        return best_value
+
+    @property
+    def best_params(self) -> dict[str, Any]:
+        return self._get_best_trial(deepcopy=True).params
+
+    def _get_trials(
+        self,
+        deepcopy: bool = True,
+        states: Container[TrialState] | None = None,
+        use_cache: bool = False,
+    ) -> list[FrozenTrial]:
+        key = None if states is None else tuple(s for s in TrialState if s in states)
+        trials = self._frozen_trials.get(key)
+        if trials is None:
+            if key is None:
+                trials = to_frozen_trials(self._cached_trials)
+            elif None in self._frozen_trials:
+                trials = [t for t in self._frozen_trials[None] if t.state in key]
+            else:
+                trials = to_frozen_trials([t for t in self._cached_trials if t.state in key])
+            self._frozen_trials[key] = trials
+        return copy.deepcopy(trials) if deepcopy else trials
+
+    def _get_best_trial(self, deepcopy: bool) -> FrozenTrial:
+        if self._is_multi_objective():
+            raise RuntimeError(
+                "A single best trial cannot be retrieved from a multi-objective study. Consider "
+                "using Study.best_trials to retrieve a list containing the best trials."
+            )
+        # Only the best trial is converted to FrozenTrial.
+        trials = [
+            t
+            for t in self._cached_trials
+            if t.state == TrialState.COMPLETE
+            and all(c <= 0.0 for c in t.system_attrs.get(_CONSTRAINTS_KEY, []))
+        ]
+        if len(trials) == 0:
+            raise ValueError("No feasible trials are completed yet.")
+        if self.direction == StudyDirection.MAXIMIZE:
+            best_trial = max(trials, key=lambda t: t.values[0])
+        else:
+            best_trial = min(trials, key=lambda t: t.values[0])
+        best_trial = to_frozen_trials([best_trial])[0]
+        return copy.deepcopy(best_trial) if deepcopy else best_trial
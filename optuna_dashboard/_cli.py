@@ -16,6 +16,7 @@ from optuna.storages import RDBStorage
 from . import __version__
 from ._app import create_app
 from ._config import create_artifact_store_from_config
+from ._config import create_importance_config_from_config
 from ._config import create_llm_provider_from_config
 from ._config import DashboardConfig
 from ._config import load_config_from_toml
@@ -131,6 +132,24 @@ def main() -> None:
         help="Allow unsafe features such as 'rehypejs/rehype-raw'",
         action="store_true",
     )
+    parser.add_argument(
+        "--compress-notes",
+        help="Store notes edited on the dashboard in a compressed form",
+        action="store_true",
+        default=None,
+    )
+    parser.add_argument(
+        "--compact-trials",
+        help="Cache trials in a compact form to reduce the memory usage of large studies",
+        action="store_true",
+        default=None,
+    )
+    parser.add_argument(
+        "--trial-columns",
+        help="Cache trials in NumPy columns to speed up the computations over large studies",
+        action="store_true",
+        default=None,
+    )
     args = parser.parse_args()
 
     # Load and merge configuration
@@ -153,12 +172,17 @@ def main() -> None:
         artifact_store = FileSystemArtifactStore(config.artifact_dir)
 
     llm_provider = create_llm_provider_from_config(toml_config or {})
+    importance_config = create_importance_config_from_config(toml_config or {})
     app = create_app(
         storage,
         artifact_store=artifact_store,
         llm_provider=llm_provider,
         debug=DEBUG,
         allow_unsafe=config.allow_unsafe,
+        importance_config=importance_config,
+        compress_notes=config.compress_notes,
+        compact_trials=config.compact_trials,
+        trial_columns=config.trial_columns,
     )
 
     if DEBUG and isinstance(storage, RDBStorage):
@@ -0,0 +1,194 @@
+from __future__ import annotations
+
+from array import array
+import sys
+from typing import cast
+from typing import TYPE_CHECKING
+
+from optuna.trial import FrozenTrial
+
+from ._distribution_table import DistributionTable
+
+
+if TYPE_CHECKING:
+    from datetime import datetime
+    from datetime import timedelta
+    from typing import Any
+    from typing import Optional
+
+    from optuna.distributions import BaseDistribution
+    from optuna.trial import TrialState
+
+
+class CompactTrial:
+    """A read-only and memory-efficient record of a trial kept in ``InMemoryCache``.
+
+    It provides the read-only attributes of :class:`~optuna.trial.FrozenTrial` that the
+    dashboard uses, so it can be passed to the serializers and the other helpers as it is.
+    Param names and distributions are shared across the trials of a study by
+    :class:`TrialCompactor`, param values are stored in their internal representation, and
+    intermediate values are stored in arrays. Dicts are built on every attribute access, so
+    code that reads the attributes of the same trial many times, or passes trials to Optuna,
+    should use :meth:`to_frozen_trial`.
+    """
+
+    __slots__ = (
+        "_trial_id",
+        "number",
+        "state",
+        "_values",
+        "datetime_start",
+        "datetime_complete",
+        "_param_names",
+        "_param_values",
+        "_distributions",
+        "_user_attrs",
+        "_trial_system_attrs",
+        "_steps",
+        "_intermediate_values",
+    )
+
+    def __init__(
+        self,
+        trial: FrozenTrial,
+        param_names: tuple[str, ...],
+        distributions: tuple[BaseDistribution, ...],
+    ) -> None:
+        self._trial_id: int = trial._trial_id
+        self.number: int = trial.number
+        self.state: TrialState = trial.state
+        self._values = array("d", trial.values) if trial.values is not None else None
+        self.datetime_start: Optional[datetime] = trial.datetime_start
+        self.datetime_complete: Optional[datetime] = trial.datetime_complete
+        self._param_names = param_names
+        self._param_values = array(
+            "d", [d.to_internal_repr(trial.params[n]) for n, d in zip(param_names, distributions)]
+        )
+        self._distributions = distributions
+        # Most trials have no user attrs or system attrs, so empty dicts are not kept.
+        self._user_attrs = trial.user_attrs or None
+        self._trial_system_attrs = getattr(trial, "_system_attrs", None) or None
+        if trial.intermediate_values:
+            self._steps: Optional[array] = array("q", trial.intermediate_values.keys())
+            self._intermediate_values: Optional[array] = array(
+                "d", trial.intermediate_values.values()
+            )
+        else:
+            self._steps = None
+            self._intermediate_values = None
+
+    @property
+    def values(self) -> Optional[list[float]]:
+        return self._values.tolist() if self._values is not None else None
+
+    @property
+    def value(self) -> Optional[float]:
+        if self._values is None:
+            return None
+        if len(self._values) > 1:
+            raise RuntimeError(
+                "This attribute is not available during multi-objective optimization."
+            )
+        return self._values[0]
+
+    @property
+    def params(self) -> dict[str, Any]:
+        return {
+            name: distribution.to_external_repr(value)
+            for name, distribution, value in zip(
+                self._param_names, self._distributions, self._param_values
+            )
+        }
+
+    @property
+    def distributions(self) -> dict[str, BaseDistribution]:
+        return dict(zip(self._param_names, self._distributions))
+
+    @property
+    def user_attrs(self) -> dict[str, Any]:
+        return self._user_attrs if self._user_attrs is not None else {}
+
+    @property
+    def system_attrs(self) -> dict[str, Any]:
+        return self._system_attrs
+
+    @property
+    def _system_attrs(self) -> dict[str, Any]:
+        return self._trial_system_attrs if self._trial_system_attrs is not None else {}
+
+    @property
+    def intermediate_values(self) -> dict[int, float]:
+        if self._steps is None or self._intermediate_values is None:
+            return {}
+        return dict(zip(self._steps, self._intermediate_values))
+
+    @property
+    def last_step(self) -> Optional[int]:
+        return max(self._steps) if self._steps else None
+
+    @property
+    def duration(self) -> Optional[timedelta]:
+        if self.datetime_start is not None and self.datetime_complete is not None:
+            return self.datetime_complete - self.datetime_start
+        return None
+
+    def to_frozen_trial(self) -> FrozenTrial:
+        return FrozenTrial(
+            number=self.number,
+            state=self.state,
+            value=None,
+            values=self.values,
+            datetime_start=self.datetime_start,
+            datetime_complete=self.datetime_complete,
+            params=self.params,
+            distributions=self.distributions,
+            user_attrs=self.user_attrs,
+            system_attrs=self._system_attrs,
+            intermediate_values=self.intermediate_values,
+            trial_id=self._trial_id,
+        )
+
+
+class TrialCompactor:
+    """Converts the trials of a study to :class:`CompactTrial` sharing the common objects.
+
+    Param names are interned, and tuples of param names are shared across trials.
+    Distributions of the same type and JSON form are shared by the :class:`DistributionTable`
+    of the study, so that e.g. integer and boolean choices are never mixed up. Records of the
+    trials that were already finished are reused when the trials are compacted again, since
+    finished trials are immutable.
+    """
+
+    def __init__(self, distribution_table: Optional[DistributionTable] = None) -> None:
+        self._param_names: dict[tuple[str, ...], tuple[str, ...]] = {}
+        self._distribution_table = distribution_table or DistributionTable()
+        self._trials: list[CompactTrial] = []
+        self._n_finished = 0
+
+    def compact(self, trials: list[FrozenTrial]) -> list[FrozenTrial]:
+        """Return the compact records of the trials, which must extend the previous ones."""
+        n_finished = min(self._n_finished, len(trials))
+        compacted = self._trials[:n_finished]
+        compacted.extend(self._compact_trial(t) for t in trials[n_finished:])
+
+        while n_finished < len(compacted) and compacted[n_finished].state.is_finished():
+            n_finished += 1
+        self._trials = compacted
+        self._n_finished = n_finished
+        # CompactTrial provides the attributes of FrozenTrial that the dashboard reads.
+        return cast("list[FrozenTrial]", compacted)
+
+    def _compact_trial(self, trial: FrozenTrial) -> CompactTrial:
+        param_names = tuple(sys.intern(name) for name in trial.distributions)
+        param_names = self._param_names.setdefault(param_names, param_names)
+        distributions = tuple(
+            self._distribution_table.intern(d) for d in trial.distributions.values()
+        )
+        return CompactTrial(trial, param_names, distributions)
+
+
+def to_frozen_trials(trials: list[FrozenTrial]) -> list[FrozenTrial]:
+    """Convert compact records to ``FrozenTrial`` for the APIs of Optuna."""
+    if len(trials) == 0 or not isinstance(trials[0], CompactTrial):
+        return trials
+    return [cast(CompactTrial, t).to_frozen_trial() for t in trials]
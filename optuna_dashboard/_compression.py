@@ -0,0 +1,33 @@
+from __future__ import annotations
+
+import base64
+import hashlib
+import zlib
+
+
+# Payloads stored in study system attrs (notes and plotly figures) are split into chunks.
+# When compression is enabled, the joined payload is zlib-compressed, base64-encoded, and
+# prefixed with this marker so that uncompressed payloads can still be read as they are.
+COMPRESSED_PAYLOAD_PREFIX = "zlib+base64:v1:"
+
+
+def encode_payload(payload: str, compress: bool) -> str:
+    # Uncompressed payloads that happen to start with the marker are compressed anyway,
+    # so that they can be decoded unambiguously.
+    if not compress and not payload.startswith(COMPRESSED_PAYLOAD_PREFIX):
+        return payload
+    compressed = zlib.compress(payload.encode("utf-8"))
+    return COMPRESSED_PAYLOAD_PREFIX + base64.b64encode(compressed).decode("ascii")
+
+
+def decode_payload(payload: str) -> str:
+    if not payload.startswith(COMPRESSED_PAYLOAD_PREFIX):
+        return payload
+    compressed = base64.b64decode(payload[len(COMPRESSED_PAYLOAD_PREFIX) :])
+    return zlib.decompress(compressed).decode("utf-8")
+
+
+def payload_digest(payload: str) -> str:
+    # Payloads can be overwritten with the same version or ID, so the caches of the clients
+    # are keyed by the digest of the stored payload itself.
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()[:16]
@@ -11,6 +11,7 @@ from typing import Literal
 if TYPE_CHECKING:
     from optuna.artifacts._protocol import ArtifactStore
 
+    from ._importance import ImportanceConfig
     from .llm.provider import LLMProvider
 
 
@@ -53,6 +54,9 @@ class DashboardConfig:
     artifact_dir: str | None = None
     quiet: bool = False
     allow_unsafe: bool = False
+    compress_notes: bool = False
+    compact_trials: bool = False
+    trial_columns: bool = False
 
     @classmethod
     def build_from_sources(
@@ -146,3 +150,12 @@ def create_artifact_store_from_config(config: dict[str, Any]) -> ArtifactStore |
         raise ValueError("Unsupported artifact store configuration.")
 
     return artifact_store
+
+
+def create_importance_config_from_config(config: dict[str, Any]) -> ImportanceConfig:
+    from ._importance import ImportanceConfig
+
+    try:
+        return ImportanceConfig(**config.get("importance", {}))
+    except TypeError as e:
+        raise ValueError(f"Unsupported importance configuration: {e}")
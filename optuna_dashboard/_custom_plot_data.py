@@ -6,6 +6,11 @@ import uuid
 
 from optuna import Study
 
+from ._compression import decode_payload
+from ._compression import encode_payload
+from ._compression import payload_digest
+from ._storage import set_study_system_attrs
+
 
 if TYPE_CHECKING:
     from typing import Any
@@ -19,7 +24,7 @@ SYSTEM_ATTR_MAX_LENGTH = 2045
 
 
 def save_plotly_graph_object(
-    study: Study, figure: go.Figure, *, graph_object_id: str | None = None
+    study: Study, figure: go.Figure, *, graph_object_id: str | None = None, compress: bool = False
 ) -> str:
     """Save the user-defined plotly's graph object to the study.
 
@@ -49,6 +54,10 @@ def save_plotly_graph_object(
         graph_object_id:
             Unique identifier of the graph object. If specified, the graph object is overwritten.
             This must be a valid HTML id attribute value.
+        compress:
+            If :obj:`True`, the graph object is stored compressed. Plotly's JSON usually
+            compresses well, so this greatly reduces the number of system attributes.
+            Note that older versions of optuna-dashboard cannot read compressed graph objects.
 
     Returns:
         The graph object ID.
@@ -61,7 +70,7 @@ def save_plotly_graph_object(
 
     graph_object_id = graph_object_id or str(uuid.uuid4())
     key = SYSTEM_ATTR_PLOT_DATA + graph_object_id + ":"
-    plot_data_json_str = figure.to_json()
+    plot_data_json_str = encode_payload(figure.to_json(), compress)
     save_graph_object_json(storage, study_id, key, plot_data_json_str)
     return graph_object_id
 
@@ -70,15 +79,13 @@ def save_graph_object_json(
     storage: BaseStorage, study_id: int, key_prefix: str, plot_data_json_str: str
 ) -> None:
     plot_data_system_attrs = split_plot_data(plot_data_json_str, key_prefix)
-    for k, v in plot_data_system_attrs.items():
-        storage.set_study_system_attr(study_id, k, v)
 
     # Clear previous graph object attributes
     study_system_attrs = storage.get_study_system_attrs(study_id)
     all_plot_data_system_attrs = [k for k in study_system_attrs if k.startswith(key_prefix)]
-    if len(all_plot_data_system_attrs) > len(plot_data_system_attrs):
-        for i in range(len(plot_data_system_attrs), len(all_plot_data_system_attrs)):
-            storage.set_study_system_attr(study_id, f"{key_prefix}{i}", "")
+    for i in range(len(plot_data_system_attrs), len(all_plot_data_system_attrs)):
+        plot_data_system_attrs[f"{key_prefix}{i}"] = ""
+    set_study_system_attrs(storage, study_id, plot_data_system_attrs)
 
 
 def list_graph_object_ids(system_attrs: dict[str, Any]) -> list[str]:
@@ -97,12 +104,38 @@ def list_graph_object_ids(system_attrs: dict[str, Any]) -> list[str]:
 
 
 def get_plotly_graph_objects(system_attrs: dict[str, Any]) -> dict[str, str]:
-    graph_objects = {}
-    for title in list_graph_object_ids(system_attrs):
-        key_prefix = SYSTEM_ATTR_PLOT_DATA + title + ":"
-        plot_data_attrs = {k: v for k, v in system_attrs.items() if k.startswith(key_prefix)}
-        graph_objects[title] = concat_plot_data(plot_data_attrs, key_prefix)
-    return graph_objects
+    return {
+        title: decode_payload(_get_graph_object_payload(system_attrs, title))
+        for title in list_graph_object_ids(system_attrs)
+    }
+
+
+def get_plotly_graph_object_versions(system_attrs: dict[str, Any]) -> dict[str, str]:
+    """Return the content version of each graph object without decoding them."""
+    return {
+        title: graph_object_version(_get_graph_object_payload(system_attrs, title))
+        for title in list_graph_object_ids(system_attrs)
+    }
+
+
+def get_plotly_graph_object(
+    system_attrs: dict[str, Any], graph_object_id: str
+) -> tuple[str, str] | None:
+    """Return a pair of the version and the JSON string of the graph object."""
+    if graph_object_id not in list_graph_object_ids(system_attrs):
+        return None
+    payload = _get_graph_object_payload(system_attrs, graph_object_id)
+    return graph_object_version(payload), decode_payload(payload)
+
+
+def graph_object_version(payload: str) -> str:
+    return payload_digest(payload)
+
+
+def _get_graph_object_payload(system_attrs: dict[str, Any], graph_object_id: str) -> str:
+    key_prefix = SYSTEM_ATTR_PLOT_DATA + graph_object_id + ":"
+    plot_data_attrs = {k: v for k, v in system_attrs.items() if k.startswith(key_prefix)}
+    return concat_plot_data(plot_data_attrs, key_prefix)
 
 
 def split_plot_data(plot_data_str: str, key_prefix: str) -> dict[str, str]:
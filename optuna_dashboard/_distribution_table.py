@@ -0,0 +1,107 @@
+from __future__ import annotations
+
+import copy
+import json
+import threading
+from typing import TYPE_CHECKING
+
+
+if TYPE_CHECKING:
+    from typing import Optional
+
+    from optuna.distributions import BaseDistribution
+    from optuna.trial import FrozenTrial
+
+    from ._inmemory_cache import InMemoryCache
+    from ._serializer import DistributionJSON
+
+
+class DistributionTable:
+    """Interns the distributions of a study so that identical distributions share one object.
+
+    Distributions are keyed by their class and their JSON form, which includes the Python
+    types of categorical choices. ``==`` is not used since ``CategoricalDistribution([0, 1])``
+    equals ``CategoricalDistribution([False, True])``.
+
+    The JSON form of each interned distribution is computed once, and reused by the
+    serializer for every param of every trial. Interned distributions are looked up by their
+    ids, which is much cheaper than serializing them. The ids never collide since interned
+    distributions are kept alive by the table.
+    """
+
+    def __init__(self) -> None:
+        self._distributions: dict[tuple[type, str], BaseDistribution] = {}
+        self._json: dict[int, DistributionJSON] = {}
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._distributions)
+
+    def intern(self, distribution: BaseDistribution) -> BaseDistribution:
+        if id(distribution) in self._json:
+            return distribution
+        try:
+            serialized = _serialize_distribution(distribution)
+        except ValueError:
+            # Unknown distributions are not interned.
+            return distribution
+        key = (type(distribution), json.dumps(serialized, sort_keys=True))
+        with self._lock:
+            interned = self._distributions.get(key)
+            if interned is None:
+                interned = self._distributions[key] = distribution
+                self._json[id(distribution)] = serialized
+            return interned
+
+    def intern_trials(
+        self, trials: list[FrozenTrial], previous: Optional[list[FrozenTrial]] = None
+    ) -> list[FrozenTrial]:
+        """Return the trials whose distributions are replaced with the interned ones.
+
+        Trials returned by the storage are never modified, since they may be owned by the
+        storage, e.g. ``InMemoryStorage``. Trials are copied only if some of their
+        distributions are not interned yet, and the copies of finished trials in
+        ``previous`` are reused since finished trials are immutable.
+        """
+        n_reused = 0
+        if previous is not None:
+            n = min(len(previous), len(trials))
+            while (
+                n_reused < n
+                and previous[n_reused].state.is_finished()
+                and previous[n_reused].number == trials[n_reused].number
+            ):
+                n_reused += 1
+
+        interned_trials = previous[:n_reused] if previous is not None else []
+        for trial in trials[n_reused:]:
+            distributions = trial.distributions
+            interned = {name: self.intern(d) for name, d in distributions.items()}
+            if all(interned[name] is d for name, d in distributions.items()):
+                interned_trials.append(trial)
+                continue
+            trial = copy.copy(trial)
+            trial.distributions = interned
+            interned_trials.append(trial)
+        return interned_trials
+
+    def to_json(self, distribution: BaseDistribution) -> DistributionJSON:
+        serialized = self._json.get(id(distribution))
+        if serialized is None:
+            return _serialize_distribution(distribution)
+        return serialized
+
+
+def get_distribution_table(in_memory_cache: InMemoryCache, study_id: int) -> DistributionTable:
+    with in_memory_cache._distribution_table_cache_lock:
+        table = in_memory_cache._distribution_table_cache.get(study_id)
+        if table is None:
+            table = in_memory_cache._distribution_table_cache[study_id] = DistributionTable()
+        return table
+
+
+def _serialize_distribution(distribution: BaseDistribution) -> DistributionJSON:
+    # Imported here since _serializer depends on _storage, which depends on this module.
+    from ._serializer import serialize_distribution
+
+    return serialize_distribution(distribution)
@@ -1,20 +1,28 @@
 from __future__ import annotations
 
+from collections.abc import Callable
+from dataclasses import dataclass
+from datetime import datetime
+import importlib.util
 import logging
-import threading
+import math
+import random
 import warnings
-from collections.abc import Callable
+from typing import Iterable
 from typing import TYPE_CHECKING
 
+import numpy as np
+from optuna.importance import BaseImportanceEvaluator
 from optuna.importance import get_param_importances
 from optuna.importance import PedAnovaImportanceEvaluator
-from optuna.storages import BaseStorage
 from optuna.study import Study
 from optuna.study import StudyDirection
 from optuna.trial import FrozenTrial
 from optuna.trial import TrialState
+from optuna_dashboard._cached_study import CachedStudy
 from optuna_dashboard._inmemory_cache import get_cached_extra_study_property
 from optuna_dashboard._inmemory_cache import InMemoryCache
+from optuna_dashboard._trial_columns import get_trial_columns
 
 
 _logger = logging.getLogger(__name__)
@@ -28,76 +36,233 @@ if TYPE_CHECKING:
         {
             "name": str,
             "importance": float,
+            "importance_std": float,
             "distribution": str,
         },
     )
 
-param_importance_cache_lock = threading.Lock()
-# { "{study_id}:{objective_id}" : (n_completed_trials, importance) }
-param_importance_cache: dict[str, tuple[int, list[ImportanceType]]] = {}
+
+@dataclass
+class ImportanceConfig:
+    """Configuration for the hyperparameter importance API.
+
+    Importances are recomputed only when the number of completed trials has grown by
+    ``recompute_growth_ratio`` since the last computation, or when the cached value is
+    older than ``recompute_interval_seconds``. Otherwise the cached value is returned
+    even if a few more trials have been completed.
+
+    When ``max_trials`` is set and a study has more completed trials than that,
+    importances are evaluated on ``n_subsamples`` random subsamples of ``max_trials``
+    trials, and the mean and standard deviation across subsamples are reported. The
+    ``sampling`` mode is either ``"reservoir"`` (uniform sampling) or ``"stratified"``
+    (uniform sampling within quantiles of the objective value).
+
+    ``evaluator`` selects the importance evaluator: ``"ped_anova"`` (default) or
+    ``"fanova"``. The latter requires scikit-learn, which is checked when the config is
+    created.
+    """
+
+    evaluator: str = "ped_anova"
+    recompute_growth_ratio: float = 0.05
+    recompute_interval_seconds: float = 30.0
+    max_trials: int | None = None
+    sampling: str = "reservoir"
+    n_subsamples: int = 3
+
+    def __post_init__(self) -> None:
+        if self.evaluator not in _IMPORTANCE_EVALUATORS:
+            evaluators = tuple(_IMPORTANCE_EVALUATORS)
+            raise ValueError(f"evaluator must be one of {evaluators}, got {self.evaluator!r}.")
+        if self.evaluator == "fanova" and importlib.util.find_spec("sklearn") is None:
+            raise ValueError(
+                "evaluator 'fanova' requires scikit-learn. "
+                "Please install it with `pip install scikit-learn`."
+            )
+        if self.sampling not in _SAMPLING_MODES:
+            raise ValueError(f"sampling must be one of {_SAMPLING_MODES}, got {self.sampling!r}.")
+        if self.max_trials is not None and self.max_trials < 2:
+            raise ValueError("max_trials must be larger than 1.")
+        if self.n_subsamples < 1:
+            raise ValueError("n_subsamples must be a positive integer.")
+
+
+def _create_ped_anova_evaluator() -> BaseImportanceEvaluator:
+    # TODO(nabenabe0928): We might want to pass baseline_quantile
+    #                     as an argument in the future.
+    return PedAnovaImportanceEvaluator()
+
+
+def _create_fanova_evaluator() -> BaseImportanceEvaluator:
+    from optuna.importance import FanovaImportanceEvaluator
+
+    return FanovaImportanceEvaluator(seed=0)
 
 
-class StudyWrapper(Study):
-    def __init__(
-        self, storage: BaseStorage, study_id: int, cached_trials: list[FrozenTrial]
-    ) -> None:
-        study_name = storage.get_study_name_from_id(study_id)
-        super().__init__(study_name=study_name, storage=storage)
-        self._cached_trials = cached_trials
+_IMPORTANCE_EVALUATORS: dict[str, Callable[[], BaseImportanceEvaluator]] = {
+    "ped_anova": _create_ped_anova_evaluator,
+    "fanova": _create_fanova_evaluator,
+}
+_SAMPLING_MODES = ("reservoir", "stratified")
+_N_STRATA = 10
 
-    @property
-    def trials(self) -> list[FrozenTrial]:
-        return self._cached_trials
+
+def _should_recompute(
+    config: ImportanceConfig, n_cached_trials: int, computed_at: datetime, n_completed_trials: int
+) -> bool:
+    if n_completed_trials == n_cached_trials:
+        return False
+    if n_completed_trials < n_cached_trials:
+        # Trials are never removed from a study, but be defensive about re-created studies.
+        return True
+    if n_completed_trials - n_cached_trials >= n_cached_trials * config.recompute_growth_ratio:
+        return True
+    elapsed = (datetime.now() - computed_at).total_seconds()
+    return elapsed >= config.recompute_interval_seconds
 
 
 def get_param_importance_from_trials_cache(
     inmemory_cache: InMemoryCache,
-    storage: BaseStorage,
     study_id: int,
+    directions: list[StudyDirection],
     objective_id: int,
     trials: list[FrozenTrial],
+    config: ImportanceConfig | None = None,
 ) -> list[ImportanceType]:
-    n_completed_trials = len([t for t in trials if t.state == TrialState.COMPLETE])
+    config = config or ImportanceConfig()
+    columns = get_trial_columns(inmemory_cache, study_id, trials)
+    if columns is not None:
+        n_completed_trials = int(np.count_nonzero(columns.completed_mask()))
+    else:
+        n_completed_trials = len([t for t in trials if t.state == TrialState.COMPLETE])
     if n_completed_trials <= 1:
         return []
 
-    cache_key = f"{study_id}:{objective_id}"
-    with param_importance_cache_lock:
-        cache_n_trial, cache_importance = param_importance_cache.get(cache_key, (0, []))
-        if n_completed_trials == cache_n_trial:
-            return cache_importance
-
-        study = StudyWrapper(storage, study_id, trials)
-        # TODO(nabenabe0928): We might want to pass baseline_quantile
-        #                     as an argument in the future.
-        with warnings.catch_warnings():
-            # Optuna v4 warns whenever target is passed to PED-ANOVA, even though
-            # optuna-dashboard already adjusts target for maximize directions. Keep this
-            # suppression while optuna-dashboard supports Optuna v4.x.
-            # https://github.com/optuna/optuna/blob/v4.9.0/optuna/importance/_ped_anova/evaluator.py#L179-L199
-            warnings.filterwarnings(
-                "ignore",
-                message="PedAnovaImportanceEvaluator computes the importances of params to "
-                "achieve low `target` values.*",
+    cache_key = (study_id, objective_id, config.evaluator)
+    with inmemory_cache._param_importance_cache_lock:
+        cached = inmemory_cache._param_importance_cache.get(cache_key)
+        if cached is not None:
+            cache_n_trial, computed_at, cache_importance = cached
+            if not _should_recompute(config, cache_n_trial, computed_at, n_completed_trials):
+                inmemory_cache._param_importance_cache.move_to_end(cache_key)
+                return cache_importance
+
+        importance_std: dict[str, float] = {}
+        if config.max_trials is not None and n_completed_trials > config.max_trials:
+            importance, importance_std = _evaluate_importance_on_subsamples(
+                study_id, directions, objective_id, trials, config
             )
-            importance = get_param_importances(
-                study,
-                target=_get_importance_target(study, objective_id),
-                evaluator=PedAnovaImportanceEvaluator(),
+        else:
+            importance = _evaluate_importance(
+                study_id, directions, objective_id, trials, config.evaluator
             )
+        _, union_search_space, _, _ = get_cached_extra_study_property(
+            inmemory_cache, study_id, trials
+        )
         if not importance:
-            _, union_search_space, _, _ = get_cached_extra_study_property(
-                inmemory_cache, study_id, trials
-            )
             importance_value = 1 / len(union_search_space)
             importance = {
                 param_name: importance_value for param_name, distribution in union_search_space
             }
-        converted = convert_to_importance_type(importance, trials)
-        param_importance_cache[cache_key] = (n_completed_trials, converted)
+        distribution_names = {name: d.__class__.__name__ for name, d in union_search_space}
+        converted = convert_to_importance_type(importance, distribution_names, importance_std)
+        inmemory_cache._put_param_importance(
+            cache_key, (n_completed_trials, datetime.now(), converted)
+        )
     return converted
 
 
+def _evaluate_importance(
+    study_id: int,
+    directions: list[StudyDirection],
+    objective_id: int,
+    trials: list[FrozenTrial],
+    evaluator: str,
+) -> dict[str, float]:
+    # The study name is not used by importance evaluators.
+    study = CachedStudy(study_id, "", directions, trials)
+    with warnings.catch_warnings():
+        # Optuna v4 warns whenever target is passed to PED-ANOVA, even though
+        # optuna-dashboard already adjusts target for maximize directions. Keep this
+        # suppression while optuna-dashboard supports Optuna v4.x.
+        # https://github.com/optuna/optuna/blob/v4.9.0/optuna/importance/_ped_anova/evaluator.py#L179-L199
+        warnings.filterwarnings(
+            "ignore",
+            message="PedAnovaImportanceEvaluator computes the importances of params to "
+            "achieve low `target` values.*",
+        )
+        return get_param_importances(
+            study,
+            target=_get_importance_target(study, objective_id),
+            evaluator=_IMPORTANCE_EVALUATORS[evaluator](),
+        )
+
+
+def _evaluate_importance_on_subsamples(
+    study_id: int,
+    directions: list[StudyDirection],
+    objective_id: int,
+    trials: list[FrozenTrial],
+    config: ImportanceConfig,
+) -> tuple[dict[str, float], dict[str, float]]:
+    assert config.max_trials is not None
+    # Use a fixed seed so that the displayed importances do not flicker between requests.
+    rng = random.Random(study_id)
+    results: list[dict[str, float]] = []
+    for _ in range(config.n_subsamples):
+        completed_trials = (t for t in trials if t.state == TrialState.COMPLETE)
+        if config.sampling == "stratified":
+            subsample = _stratified_sample(
+                list(completed_trials), objective_id, config.max_trials, rng
+            )
+        else:
+            subsample = _reservoir_sample(completed_trials, config.max_trials, rng)
+        results.append(
+            _evaluate_importance(study_id, directions, objective_id, subsample, config.evaluator)
+        )
+
+    param_names = {name for result in results for name in result}
+    values = {name: np.array([r.get(name, 0.0) for r in results]) for name in param_names}
+    mean = {name: float(v.mean()) for name, v in values.items()}
+    std = {name: float(v.std()) for name, v in values.items()}
+    sorted_names = sorted(param_names, key=lambda name: mean[name], reverse=True)
+    return {name: mean[name] for name in sorted_names}, std
+
+
+def _reservoir_sample(
+    trials: Iterable[FrozenTrial], k: int, rng: random.Random
+) -> list[FrozenTrial]:
+    reservoir: list[FrozenTrial] = []
+    for i, trial in enumerate(trials):
+        if i < k:
+            reservoir.append(trial)
+            continue
+        j = rng.randint(0, i)
+        if j < k:
+            reservoir[j] = trial
+    reservoir.sort(key=lambda t: t.number)
+    return reservoir
+
+
+def _stratified_sample(
+    trials: list[FrozenTrial], objective_id: int, k: int, rng: random.Random
+) -> list[FrozenTrial]:
+    # Split trials into quantiles of the objective value and draw the same fraction of
+    # trials from every quantile, so that the top quantile used by PED-ANOVA is always
+    # represented regardless of the sampling noise.
+    if len(trials) <= k:
+        return trials
+    sorted_trials = sorted(trials, key=lambda t: t.values[objective_id])
+    strata = np.array_split(np.arange(len(sorted_trials)), _N_STRATA)
+    sampled: list[FrozenTrial] = []
+    remaining = k
+    for i, stratum in enumerate(strata):
+        n = min(len(stratum), math.ceil(remaining / (_N_STRATA - i)))
+        remaining -= n
+        sampled.extend(sorted_trials[j] for j in rng.sample(stratum.tolist(), n))
+    sampled.sort(key=lambda t: t.number)
+    return sampled
+
+
 def _get_importance_target(study: Study, objective_id: int) -> Callable[[FrozenTrial], float]:
     if study.directions[objective_id] == StudyDirection.MAXIMIZE:
         return lambda t: -t.values[objective_id]
@@ -105,20 +270,17 @@ def _get_importance_target(study: Study, objective_id: int) -> Callable[[FrozenT
 
 
 def convert_to_importance_type(
-    importance: dict[str, float], trials: list[FrozenTrial]
+    importance: dict[str, float],
+    distribution_names: dict[str, str],
+    importance_std: dict[str, float] | None = None,
 ) -> list[ImportanceType]:
+    importance_std = importance_std or {}
     return [
         {
             "name": name,
             "importance": importance,
-            "distribution": get_distribution_name(name, trials),
+            "importance_std": importance_std.get(name, 0.0),
+            "distribution": distribution_names[name],
         }
         for name, importance in importance.items()
     ]
-
-
-def get_distribution_name(param_name: str, trials: list[FrozenTrial]) -> str:
-    for trial in trials:
-        if param_name in trial.distributions:
-            return trial.distributions[param_name].__class__.__name__
-    assert False, "Must not reach here."
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from collections import OrderedDict
 from datetime import datetime
 import numbers
 import threading
@@ -19,6 +20,13 @@ from optuna.trial import TrialState
 
 
 if TYPE_CHECKING:
+    from ._compact_trial import TrialCompactor
+    from ._distribution_table import DistributionTable
+    from ._importance import ImportanceType
+    from ._trial_columns import TrialColumns
+    from ._trial_query import TrialColumnIndex
+    from .artifact._index import ArtifactIndex
+
     SearchSpaceSetT = Set[Tuple[str, BaseDistribution]]
     SearchSpaceListT = List[Tuple[str, BaseDistribution]]
 
@@ -43,12 +51,41 @@ def get_cached_extra_study_property(
 
 
 class InMemoryCache:
-    def __init__(self) -> None:
+    def __init__(
+        self,
+        max_param_importance_cache_size: int = 128,
+        enable_trial_columns: bool = False,
+        compact_trials: bool = False,
+    ) -> None:
         self._cached_extra_study_property_cache: dict[int, "_CachedExtraStudyProperty"] = {}
         self._cached_extra_study_property_cache_lock = threading.Lock()
         self._trials_cache: dict[int, list[FrozenTrial]] = {}
         self._trials_cache_lock = threading.Lock()
         self._trials_last_fetched_at: dict[int, datetime] = {}
+        # Trials are cached as CompactTrial to reduce the memory usage of large studies.
+        self._compact_trials = compact_trials
+        self._trial_compactors: dict[int, TrialCompactor] = {}
+        self._distribution_table_cache: dict[int, DistributionTable] = {}
+        self._distribution_table_cache_lock = threading.Lock()
+        # { (study_id, objective_id, evaluator): (n_completed_trials, computed_at, importance) }
+        self._param_importance_cache: OrderedDict[
+            tuple[int, int, str], tuple[int, datetime, list[ImportanceType]]
+        ] = OrderedDict()
+        self._param_importance_cache_lock = threading.Lock()
+        self._max_param_importance_cache_size = max_param_importance_cache_size
+        self._artifact_index_cache: dict[int, ArtifactIndex] = {}
+        # Bumped whenever the artifact indexes are invalidated, so that an index built from
+        # the storage read before the invalidation is never stored.
+        self._artifact_index_generation = 0
+        self._artifact_index_cache_lock = threading.Lock()
+        self._trial_column_index_cache: dict[int, TrialColumnIndex] = {}
+        self._trial_column_index_cache_lock = threading.Lock()
+        # NumPy columns of the trials, which are used to vectorize the computations over trials
+        # such as the Pareto front if enabled. They are also used to filter and sort trials on
+        # the server, in which case they are only kept for the queried studies.
+        self._trial_columns_enabled = enable_trial_columns
+        self._trial_columns_cache: dict[int, TrialColumns] = {}
+        self._trial_columns_cache_lock = threading.Lock()
 
     def clear(self) -> None:
         with self._cached_extra_study_property_cache_lock:
@@ -56,6 +93,27 @@ class InMemoryCache:
         with self._trials_cache_lock:
             self._trials_cache.clear()
             self._trials_last_fetched_at.clear()
+            self._trial_compactors.clear()
+        with self._distribution_table_cache_lock:
+            self._distribution_table_cache.clear()
+        with self._param_importance_cache_lock:
+            self._param_importance_cache.clear()
+        with self._artifact_index_cache_lock:
+            self._artifact_index_cache.clear()
+            self._artifact_index_generation += 1
+        with self._trial_column_index_cache_lock:
+            self._trial_column_index_cache.clear()
+        with self._trial_columns_cache_lock:
+            self._trial_columns_cache.clear()
+
+    def _put_param_importance(
+        self, key: tuple[int, int, str], value: tuple[int, datetime, list[ImportanceType]]
+    ) -> None:
+        # Must be called while holding _param_importance_cache_lock.
+        self._param_importance_cache[key] = value
+        self._param_importance_cache.move_to_end(key)
+        while len(self._param_importance_cache) > self._max_param_importance_cache_size:
+            self._param_importance_cache.popitem(last=False)
 
 
 class _CachedExtraStudyProperty:
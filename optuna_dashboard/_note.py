@@ -6,6 +6,11 @@ from typing import TYPE_CHECKING
 import optuna
 from optuna.storages import BaseStorage
 
+from ._compression import decode_payload
+from ._compression import encode_payload
+from ._compression import payload_digest
+from ._storage import set_study_system_attrs
+
 
 if TYPE_CHECKING:
     from typing import Any
@@ -19,11 +24,21 @@ if TYPE_CHECKING:
             "body": str,
         },
     )
+    NoteRefType = TypedDict(
+        "NoteRefType",
+        {
+            "version": int,
+            "is_empty": bool,
+            "digest": str,
+        },
+    )
 
 SYSTEM_ATTR_MAX_LENGTH = 2045
 
 
-def save_note(study_or_trial: optuna.Study | optuna.Trial, body: str) -> None:
+def save_note(
+    study_or_trial: optuna.Study | optuna.Trial, body: str, *, compress: bool = False
+) -> None:
     """Save the note (Markdown format) to the Study or Trial.
 
     Example:
@@ -52,6 +67,16 @@ def save_note(study_or_trial: optuna.Study | optuna.Trial, body: str) -> None:
           You can *freely* take a **note** that is associated with the study.
           '''))
           study.optimize(objective, n_trials=10)
+
+    Args:
+        study_or_trial:
+            Target study or trial object.
+        body:
+            The note body in Markdown format.
+        compress:
+            If :obj:`True`, the note is stored compressed to reduce the number of
+            system attributes. Note that older versions of optuna-dashboard cannot read
+            compressed notes.
     """
     trial_id: Optional[int] = None
     if isinstance(study_or_trial, optuna.Study):
@@ -64,7 +89,9 @@ def save_note(study_or_trial: optuna.Study | optuna.Trial, body: str) -> None:
 
     system_attrs = storage.get_study_system_attrs(study_id)
     next_ver = system_attrs.get(note_ver_key(trial_id), 0) + 1
-    save_note_with_version(storage, study_id, trial_id, next_ver, body)
+    save_note_with_version(
+        storage, study_id, trial_id, next_ver, body, system_attrs, compress=compress
+    )
 
 
 def get_note(study_or_trial: optuna.Study | optuna.Trial) -> str:
@@ -110,17 +137,48 @@ def note_str_key_prefix(trial_id: Optional[int]) -> str:
     return f"dashboard:{trial_id}:note_str:"
 
 
+def note_chunks_key(trial_id: Optional[int]) -> str:
+    # The number of note_str chunks stored in system attrs, including blanked stale ones.
+    prefix = "dashboard:note_chunks"
+    if trial_id is None:
+        return prefix
+    return f"dashboard:{trial_id}:note_chunks"
+
+
 def copy_notes(storage: BaseStorage, src_study: optuna.Study, dst_study: optuna.Study) -> None:
-    system_attrs = storage.get_study_system_attrs(study_id=src_study._study_id)
+    trial_id_map = {
+        src_trial._trial_id: dst_trial._trial_id
+        for src_trial, dst_trial in zip(
+            src_study.get_trials(deepcopy=False), dst_study.get_trials(deepcopy=False)
+        )
+    }
+    copy_notes_by_trial_ids(storage, src_study._study_id, dst_study._study_id, trial_id_map)
+
 
-    # Copy individual trial notes
-    for src_trial, dst_trial in zip(src_study.get_trials(), dst_study.get_trials()):
-        note = get_note_from_system_attrs(system_attrs, src_trial._trial_id)["body"]
-        save_note_with_version(storage, dst_study._study_id, dst_trial._trial_id, 0, note)
+def copy_notes_by_trial_ids(
+    storage: BaseStorage, src_study_id: int, dst_study_id: int, trial_id_map: dict[int, int]
+) -> None:
+    """Copy the notes of the study and its trials, where ``trial_id_map`` maps the trial IDs
+    of the source study to the ones of the destination study.
 
-    # Copy study note
-    note = get_note_from_system_attrs(system_attrs, None)["body"]
-    save_note_with_version(storage, dst_study._study_id, None, 0, note)
+    Copied notes get a version of at least 1, since version 0 means that there is no note and
+    clients cache the note bodies by their versions.
+    """
+    system_attrs = storage.get_study_system_attrs(study_id=src_study_id)
+    dst_system_attrs = storage.get_study_system_attrs(study_id=dst_study_id)
+
+    attrs: dict[str, Any] = {}
+    for src_trial_id, dst_trial_id in [*trial_id_map.items(), (None, None)]:
+        if note_ver_key(src_trial_id) not in system_attrs:
+            continue
+        ver = max(
+            int(system_attrs[note_ver_key(src_trial_id)]),
+            int(dst_system_attrs.get(note_ver_key(dst_trial_id), 0)) + 1,
+        )
+        # Copy the stored payload as it is to keep compressed notes compressed.
+        note = _get_note_payload(system_attrs, src_trial_id)
+        attrs.update(_diff_note_attrs(dst_system_attrs, dst_trial_id, ver, note))
+    set_study_system_attrs(storage, dst_study_id, attrs)
 
 
 def get_note_from_system_attrs(system_attrs: dict[str, Any], trial_id: Optional[int]) -> NoteType:
@@ -130,12 +188,40 @@ def get_note_from_system_attrs(system_attrs: dict[str, Any], trial_id: Optional[
             "body": "",
         }
     note_ver = int(system_attrs[note_ver_key(trial_id)])
-    note_attrs: dict[str, str] = {
-        key: value
-        for key, value in system_attrs.items()
-        if key.startswith(note_str_key_prefix(trial_id))
+    return {"version": note_ver, "body": decode_payload(_get_note_payload(system_attrs, trial_id))}
+
+
+def get_note_ref_from_system_attrs(
+    system_attrs: dict[str, Any], trial_id: Optional[int]
+) -> NoteRefType:
+    """Return the version and the digest of the note without its body.
+
+    The body can be fetched separately, and cached by the client per version and digest.
+    The version alone is not enough since study and trial IDs can be reused, e.g. by SQLite
+    after the last study is deleted.
+    """
+    if note_ver_key(trial_id) not in system_attrs:
+        return {"version": 0, "is_empty": True, "digest": payload_digest("")}
+    note_ver = int(system_attrs[note_ver_key(trial_id)])
+    payload = _get_note_payload(system_attrs, trial_id)
+    return {
+        "version": note_ver,
+        "is_empty": decode_payload(payload) == "",
+        "digest": payload_digest(payload),
     }
-    return {"version": note_ver, "body": concat_body(note_attrs, trial_id)}
+
+
+def get_note_cache_version(system_attrs: dict[str, Any], trial_id: Optional[int]) -> str:
+    """Return the version of the note for the HTTP caches, which includes its digest."""
+    ref = get_note_ref_from_system_attrs(system_attrs, trial_id)
+    return f"{ref['version']}-{ref['digest']}"
+
+
+def _get_note_payload(system_attrs: dict[str, Any], trial_id: Optional[int]) -> str:
+    prefix = note_str_key_prefix(trial_id)
+    return "".join(
+        system_attrs[f"{prefix}{i}"] for i in range(_get_n_chunks(system_attrs, trial_id))
+    )
 
 
 def version_is_incremented(
@@ -146,23 +232,51 @@ def version_is_incremented(
 
 
 def save_note_with_version(
-    storage: BaseStorage, study_id: int, trial_id: Optional[int], ver: int, body: str
+    storage: BaseStorage,
+    study_id: int,
+    trial_id: Optional[int],
+    ver: int,
+    body: str,
+    system_attrs: Optional[dict[str, Any]] = None,
+    *,
+    compress: bool = False,
 ) -> None:
-    storage.set_study_system_attr(study_id, note_ver_key(trial_id), ver)
+    """Save the note, only writing the chunks that differ from ``system_attrs``.
 
+    ``system_attrs`` should be the study system attrs that the caller has already loaded
+    (e.g. to check the note version). They are loaded from the storage if omitted.
+    """
+    if system_attrs is None:
+        system_attrs = storage.get_study_system_attrs(study_id)
+    attrs = _diff_note_attrs(system_attrs, trial_id, ver, encode_payload(body, compress))
+    set_study_system_attrs(storage, study_id, attrs)
+
+
+def _get_n_chunks(system_attrs: dict[str, Any], trial_id: Optional[int]) -> int:
+    # Chunks are always stored from the first one, so only the chunks after the header are
+    # looked up. Older versions do not write the header attribute and may have written more
+    # chunks than it says.
+    prefix = note_str_key_prefix(trial_id)
+    n_chunks = system_attrs.get(note_chunks_key(trial_id), 0)
+    while f"{prefix}{n_chunks}" in system_attrs:
+        n_chunks += 1
+    return n_chunks
+
+
+def _diff_note_attrs(
+    system_attrs: dict[str, Any], trial_id: Optional[int], ver: int, body: str
+) -> dict[str, Any]:
     attrs = split_body(body, trial_id)
-    for k, v in attrs.items():
-        storage.set_study_system_attr(study_id, k, v)
-
+    n_chunks = max(len(attrs), _get_n_chunks(system_attrs, trial_id))
     # Clear previous messages
-    all_note_attrs: dict[str, str] = {
-        key: value
-        for key, value in storage.get_study_system_attrs(study_id).items()
-        if key.startswith(note_str_key_prefix(trial_id))
-    }
-    if len(all_note_attrs) > len(attrs):
-        for i in range(len(attrs), len(all_note_attrs)):
-            storage.set_study_system_attr(study_id, f"{note_str_key_prefix(trial_id)}{i}", "")
+    for i in range(len(attrs), n_chunks):
+        attrs[f"{note_str_key_prefix(trial_id)}{i}"] = ""
+
+    diff: dict[str, Any] = {note_ver_key(trial_id): ver}
+    diff.update({k: v for k, v in attrs.items() if system_attrs.get(k) != v})
+    if system_attrs.get(note_chunks_key(trial_id)) != n_chunks:
+        diff[note_chunks_key(trial_id)] = n_chunks
+    return diff
 
 
 def split_body(note_str: str, trial_id: Optional[int]) -> dict[str, str]:
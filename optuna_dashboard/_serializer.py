@@ -16,14 +16,12 @@ from optuna.study._frozen import FrozenStudy
 from optuna.trial import FrozenTrial
 
 from . import _note as note
-from ._form_widget import get_form_widgets_json
-from ._named_objectives import get_objective_names
 from ._preference_setting import _SYSTEM_ATTR_FEEDBACK_COMPONENT
 from ._preferential_history import _SYSTEM_ATTR_PREFIX_HISTORY
-from .artifact._backend import list_study_artifacts
+from ._system_attrs_view import StudySystemAttrsView
 from .artifact._backend import list_trial_artifacts
 from .preferential._study import _SYSTEM_ATTR_PREFERENTIAL_STUDY
-from .preferential._system_attrs import get_preferences
+from .preferential._system_attrs import _SYSTEM_ATTR_PREFIX_PREFERENCE
 from .preferential._system_attrs import is_preference_removed
 
 
@@ -31,6 +29,7 @@ if TYPE_CHECKING:
     from typing import Literal
     from typing import TypedDict
 
+    from ._distribution_table import DistributionTable
     from ._preferential_history import History
     from ._preferential_history import SerializedHistory
 
@@ -136,8 +135,10 @@ def serialize_study_detail(
     union: list[tuple[str, BaseDistribution]],
     union_user_attrs: list[tuple[str, bool]],
     has_intermediate_values: bool,
-    plotly_graph_objects: dict[str, str],
+    plotly_graph_object_versions: dict[str, str],
     skipped_trial_numbers: list[int],
+    system_attrs_view: StudySystemAttrsView | None = None,
+    distribution_table: DistributionTable | None = None,
 ) -> dict[str, Any]:
     serialized: dict[str, Any] = {
         "name": study.study_name,
@@ -145,24 +146,34 @@ def serialize_study_detail(
         "user_attrs": serialize_attrs(study.user_attrs),
     }
     system_attrs = study.system_attrs
-    serialized["artifacts"] = list_study_artifacts(system_attrs)
+    view = system_attrs_view or StudySystemAttrsView(system_attrs)
+    serialized["artifacts"] = view.study_artifacts
 
+    # Each trial only needs its own notes and artifacts in the study system attrs.
     serialized["trials"] = [
-        serialize_frozen_trial(study._study_id, trial, system_attrs) for trial in trials
+        serialize_frozen_trial(
+            study._study_id, trial, view.trial_attrs(trial._trial_id), distribution_table
+        )
+        for trial in trials
     ]
     serialized["best_trials"] = [
-        serialize_frozen_trial(study._study_id, trial, system_attrs) for trial in best_trials
+        serialize_frozen_trial(
+            study._study_id, trial, view.trial_attrs(trial._trial_id), distribution_table
+        )
+        for trial in best_trials
     ]
-    serialized["intersection_search_space"] = serialize_search_space(intersection)
-    serialized["union_search_space"] = serialize_search_space(union)
+    serialized["intersection_search_space"] = serialize_search_space(
+        intersection, distribution_table
+    )
+    serialized["union_search_space"] = serialize_search_space(union, distribution_table)
     serialized["union_user_attrs"] = [{"key": a[0], "sortable": a[1]} for a in union_user_attrs]
     serialized["has_intermediate_values"] = has_intermediate_values
-    serialized["note"] = note.get_note_from_system_attrs(system_attrs, None)
+    serialized["note"] = view.note_ref(None)
     serialized["is_preferential"] = system_attrs.get(_SYSTEM_ATTR_PREFERENTIAL_STUDY, False)
-    objective_names = get_objective_names(system_attrs)
+    objective_names = view.objective_names
     if objective_names:
         serialized["objective_names"] = objective_names
-    form_widgets = get_form_widgets_json(system_attrs)
+    form_widgets = view.form_widgets
     if form_widgets:
         serialized["form_widgets"] = form_widgets
     serialized["feedback_component_type"] = system_attrs.get(
@@ -172,12 +183,14 @@ def serialize_study_detail(
         },
     )
     if serialized["is_preferential"]:
-        serialized["preference_history"] = serialize_preference_history(system_attrs)
-        serialized["preferences"] = get_preferences(system_attrs)
+        serialized["preference_history"] = serialize_preference_history(
+            view.with_prefix(_SYSTEM_ATTR_PREFIX_HISTORY, _SYSTEM_ATTR_PREFIX_PREFERENCE)
+        )
+        serialized["preferences"] = view.preferences
         serialized["skipped_trial_numbers"] = skipped_trial_numbers
+    # Graph objects and notes can be large, so they are fetched from separate endpoints.
     serialized["plotly_graph_objects"] = [
-        {"id": id_, "graph_object": graph_object}
-        for id_, graph_object in plotly_graph_objects.items()
+        {"id": id_, "version": version} for id_, version in plotly_graph_object_versions.items()
     ]
     return serialized
 
@@ -211,11 +224,17 @@ def serialize_preference_history(
 
 
 def serialize_frozen_trial(
-    study_id: int, trial: FrozenTrial, study_system_attrs: dict[str, Any]
+    study_id: int,
+    trial: FrozenTrial,
+    study_system_attrs: dict[str, Any],
+    distribution_table: DistributionTable | None = None,
 ) -> dict[str, Any]:
+    # Interned distributions are serialized only once per study.
+    to_json = distribution_table.to_json if distribution_table else serialize_distribution
     params = []
+    distributions = trial.distributions
     for param_name, param_external_value in trial.params.items():
-        distribution = trial.distributions.get(param_name)
+        distribution = distributions.get(param_name)
         if distribution is None:
             continue
         params.append(
@@ -224,7 +243,7 @@ def serialize_frozen_trial(
                 "param_internal_value": distribution.to_internal_repr(param_external_value),
                 "param_external_value": str(param_external_value),
                 "param_external_pytyp": str(type(param_external_value)),
-                "distribution": serialize_distribution(distribution),
+                "distribution": to_json(distribution),
             }
         )
     trial_system_attrs: dict[str, Any] = getattr(trial, "_system_attrs", {})
@@ -240,7 +259,7 @@ def serialize_frozen_trial(
             for param_name in fixed_params
         ],
         "user_attrs": serialize_attrs(trial.user_attrs),
-        "note": note.get_note_from_system_attrs(study_system_attrs, trial._trial_id),
+        "note": note.get_note_ref_from_system_attrs(study_system_attrs, trial._trial_id),
         "artifacts": list_trial_artifacts(study_system_attrs, trial_system_attrs, trial),
         "constraints": trial_system_attrs.get(CONSTRAINTS_KEY, []),
     }
@@ -316,13 +335,15 @@ def serialize_distribution(distribution: BaseDistribution) -> DistributionJSON:
 
 def serialize_search_space(
     search_space: list[tuple[str, BaseDistribution]],
+    distribution_table: DistributionTable | None = None,
 ) -> list[dict[str, Any]]:
+    to_json = distribution_table.to_json if distribution_table else serialize_distribution
     serialized = []
     for param_name, distribution in search_space:
         serialized.append(
             {
                 "name": param_name,
-                "distribution": serialize_distribution(distribution),
+                "distribution": to_json(distribution),
             }
         )
     return serialized
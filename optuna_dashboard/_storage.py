@@ -1,14 +1,25 @@
 from __future__ import annotations
 
+from dataclasses import dataclass
+from dataclasses import field
 from datetime import datetime
 from datetime import timedelta
+import inspect
+import json
+from typing import Any
+from typing import Optional
 
+from optuna.exceptions import DuplicatedStudyError
 from optuna.storages import BaseStorage
 from optuna.storages import RDBStorage
+from optuna.storages._cached_storage import _CachedStorage
 from optuna.study import StudyDirection
 from optuna.study._frozen import FrozenStudy
 from optuna.trial import FrozenTrial
+from optuna.trial import TrialState
 
+from ._compact_trial import TrialCompactor
+from ._distribution_table import get_distribution_table
 from ._inmemory_cache import InMemoryCache
 
 
@@ -35,7 +46,18 @@ def get_trials(
             return trials
     trials = storage.get_all_trials(study_id, deepcopy=False)
 
+    distribution_table = get_distribution_table(in_memory_cache, study_id)
     with in_memory_cache._trials_cache_lock:
+        if in_memory_cache._compact_trials:
+            compactor = in_memory_cache._trial_compactors.get(study_id)
+            if compactor is None:
+                compactor = TrialCompactor(distribution_table)
+                in_memory_cache._trial_compactors[study_id] = compactor
+            trials = compactor.compact(trials)
+        else:
+            trials = distribution_table.intern_trials(
+                trials, in_memory_cache._trials_cache.get(study_id)
+            )
         in_memory_cache._trials_last_fetched_at[study_id] = datetime.now()
         in_memory_cache._trials_cache[study_id] = trials
     return trials
@@ -49,12 +71,22 @@ def get_studies(storage: BaseStorage) -> list[FrozenStudy]:
 
 
 def get_study(storage: BaseStorage, study_id: int) -> FrozenStudy | None:
-    studies = get_studies(storage)
-    for s in studies:
-        if s._study_id != study_id:
-            continue
-        return s
-    return None
+    # Only the given study is read, since get_all_studies() is slow with many studies.
+    try:
+        study_name = storage.get_study_name_from_id(study_id)
+        directions = storage.get_study_directions(study_id)
+        user_attrs = storage.get_study_user_attrs(study_id)
+        system_attrs = storage.get_study_system_attrs(study_id)
+    except KeyError:
+        return None
+    return FrozenStudy(
+        study_name=study_name,
+        direction=None,
+        directions=directions,
+        user_attrs=user_attrs,
+        system_attrs=system_attrs,
+        study_id=study_id,
+    )
 
 
 def create_new_study(
@@ -62,3 +94,173 @@ def create_new_study(
 ) -> int:
     study_id = storage.create_new_study(directions, study_name=study_name)
     return study_id
+
+
+def get_rdb_storage(storage: BaseStorage) -> RDBStorage | None:
+    if isinstance(storage, _CachedStorage):
+        storage = storage._backend
+    if isinstance(storage, RDBStorage):
+        return storage
+    return None
+
+
+class ConcurrentWriteError(Exception):
+    """Raised when the same attributes are written by another process at the same time."""
+
+
+def set_study_system_attrs(storage: BaseStorage, study_id: int, attrs: dict[str, Any]) -> None:
+    """Set multiple study system attributes at once.
+
+    The attributes are written in a single transaction on RDBStorage, and one by one on
+    the other storages. Raises ``ConcurrentWriteError`` if another process added some of the
+    attributes at the same time, in which case nothing is written.
+    """
+    if not attrs:
+        return
+
+    rdb_storage = get_rdb_storage(storage)
+    if rdb_storage is None:
+        for key, value in attrs.items():
+            storage.set_study_system_attr(study_id, key, value)
+        return
+
+    from optuna.storages._rdb import models
+    from optuna.storages._rdb.storage import _create_scoped_session
+    from sqlalchemy.exc import IntegrityError
+
+    try:
+        with _create_scoped_session(rdb_storage.scoped_session) as session:
+            models.StudyModel.find_or_raise_by_id(study_id, session)
+            existing: dict[Any, Any] = {
+                attr.key: attr
+                for attr in session.query(models.StudySystemAttributeModel).filter(
+                    models.StudySystemAttributeModel.study_id == study_id,
+                    models.StudySystemAttributeModel.key.in_(list(attrs)),
+                )
+            }
+            for key, value in attrs.items():
+                attribute = existing.get(key)
+                if attribute is None:
+                    session.add(
+                        models.StudySystemAttributeModel(
+                            study_id=study_id, key=key, value_json=json.dumps(value)
+                        )
+                    )
+                else:
+                    attribute.value_json = json.dumps(value)
+    except IntegrityError:
+        raise ConcurrentWriteError(
+            f"System attrs of study_id={study_id} were written by another process."
+        )
+
+
+def rename_study_in_place(storage: BaseStorage, study_id: int, study_name: str) -> bool:
+    """Rename the study by updating its name on RDBStorage.
+
+    Returns ``False`` without doing anything on the other storages since they do not support
+    renaming studies. Raises ``DuplicatedStudyError`` if the name is already used.
+    """
+    rdb_storage = get_rdb_storage(storage)
+    if rdb_storage is None:
+        return False
+
+    from optuna.storages._rdb import models
+    from optuna.storages._rdb.storage import _create_scoped_session
+    from sqlalchemy.exc import IntegrityError
+
+    try:
+        with _create_scoped_session(rdb_storage.scoped_session) as session:
+            if models.StudyModel.find_by_name(study_name, session) is not None:
+                raise DuplicatedStudyError(
+                    f"Another study with name '{study_name}' already exists."
+                )
+            study: Any = models.StudyModel.find_or_raise_by_id(study_id, session)
+            study.study_name = study_name
+    except IntegrityError:
+        # The name is taken by another process at the same time.
+        raise DuplicatedStudyError(f"Another study with name '{study_name}' already exists.")
+
+    if isinstance(storage, _CachedStorage):
+        with storage._lock:
+            study_info = storage._studies.get(study_id)
+            if study_info is not None:
+                study_info.name = study_name
+    return True
+
+
+@dataclass
+class TrialUpdate:
+    trial_id: int
+    user_attrs: dict[str, Any] = field(default_factory=dict)
+    state: Optional[TrialState] = None
+    values: Optional[list[float]] = None
+
+
+def apply_trial_updates(storage: BaseStorage, updates: list[TrialUpdate]) -> list[Optional[str]]:
+    """Set the user attributes, and then the state and values of many trials at once.
+
+    The updates are applied in a single transaction on RDBStorage if the installed Optuna
+    supports it, and one by one through the public storage API otherwise. An update is
+    skipped if its trial is not found or already finished, and the error messages of the
+    updates are returned in the same order (``None`` for success). Other errors of the
+    storage are raised as they are.
+    """
+    rdb_storage = get_rdb_storage(storage)
+    if rdb_storage is None or not _supports_trial_updates_in_transaction(rdb_storage):
+        errors: list[Optional[str]] = []
+        for update in updates:
+            try:
+                for key, value in update.user_attrs.items():
+                    storage.set_trial_user_attr(update.trial_id, key, value)
+                if update.state is not None:
+                    storage.set_trial_state_values(update.trial_id, update.state, update.values)
+            except (KeyError, RuntimeError) as e:
+                errors.append(_get_update_error(update, e))
+            else:
+                errors.append(None)
+        return errors
+
+    from optuna.storages._rdb import models
+    from optuna.storages._rdb.storage import _create_scoped_session
+
+    errors = []
+    # Nothing is written if the transaction fails.
+    with _create_scoped_session(rdb_storage.scoped_session) as session:
+        for update in updates:
+            # Every check below raises an error before the trial is modified, so the
+            # failed updates can be skipped without savepoints.
+            try:
+                trial: Any = models.TrialModel.find_or_raise_by_id(
+                    update.trial_id, session, for_update=True
+                )
+                rdb_storage.check_trial_is_updatable(update.trial_id, trial.state)
+                for key, value in update.user_attrs.items():
+                    rdb_storage._set_trial_attr_without_commit(
+                        session, models.TrialUserAttributeModel, update.trial_id, key, value
+                    )
+                if update.state is not None:
+                    for objective, v in enumerate(update.values or []):
+                        rdb_storage._set_trial_value_without_commit(session, trial, objective, v)
+                    trial.state = update.state
+                    if update.state.is_finished():
+                        trial.datetime_complete = datetime.now()
+            except (KeyError, RuntimeError) as e:
+                errors.append(_get_update_error(update, e))
+            else:
+                errors.append(None)
+    return errors
+
+
+def _supports_trial_updates_in_transaction(rdb_storage: RDBStorage) -> bool:
+    # The private helpers of RDBStorage changed in Optuna 4.0. Older versions name the
+    # helper of user attrs differently, and take trial ids instead of trial models.
+    if not hasattr(rdb_storage, "_set_trial_attr_without_commit"):
+        return False
+    set_trial_value = getattr(rdb_storage, "_set_trial_value_without_commit", None)
+    return set_trial_value is not None and "trial" in inspect.signature(set_trial_value).parameters
+
+
+def _get_update_error(update: TrialUpdate, e: Exception) -> str:
+    if isinstance(e, KeyError):
+        return f"trial_id={update.trial_id} is not found"
+    return f"Failed to update trial_id={update.trial_id}: {e}"
@@ -0,0 +1,144 @@
+from __future__ import annotations
+
+from collections import OrderedDict
+import logging
+import threading
+from typing import TYPE_CHECKING
+import uuid
+
+from ._note import copy_notes_by_trial_ids
+
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+    from typing import Any
+    from typing import Optional
+
+    from optuna.storages import BaseStorage
+
+
+_logger = logging.getLogger(__name__)
+
+# Trials are copied in batches of this size, and larger studies are copied in the background.
+COPY_BATCH_SIZE = 1000
+
+
+def copy_study(
+    storage: BaseStorage,
+    src_study_id: int,
+    dst_study_id: int,
+    *,
+    callback: Optional[Callable[[int], None]] = None,
+) -> None:
+    """Copy the user attrs, the trials and the notes of a study to another study.
+
+    The trials are read at once with ``get_all_trials(deepcopy=False)``, since reading them
+    one by one syncs JournalStorage every time. ``callback`` is called with the number of
+    copied trials every time a batch of ``COPY_BATCH_SIZE`` trials is copied. If the copy
+    fails, the destination study is deleted and the error is raised.
+    """
+    try:
+        for key, value in storage.get_study_user_attrs(src_study_id).items():
+            storage.set_study_user_attr(dst_study_id, key, value)
+
+        trials = storage.get_all_trials(src_study_id, deepcopy=False)
+        trial_id_map: dict[int, int] = {}
+        for i in range(0, len(trials), COPY_BATCH_SIZE):
+            batch = trials[i : i + COPY_BATCH_SIZE]
+            for trial in batch:
+                trial_id_map[trial._trial_id] = storage.create_new_trial(
+                    dst_study_id, template_trial=trial
+                )
+            if callback is not None:
+                callback(len(batch))
+        copy_notes_by_trial_ids(storage, src_study_id, dst_study_id, trial_id_map)
+    except Exception:
+        try:
+            storage.delete_study(dst_study_id)
+        except Exception:
+            _logger.exception("Failed to delete the study (study_id=%d).", dst_study_id)
+        raise
+
+
+class StudyCopyJob:
+    """Copies a study to another study, and then deletes it.
+
+    If the copy fails, the destination study is deleted and the source study is left as it
+    is.
+    """
+
+    def __init__(self, src_study_id: int, dst_study_id: int, total: int) -> None:
+        self.job_id = str(uuid.uuid4())
+        self.src_study_id = src_study_id
+        self.dst_study_id = dst_study_id
+        self.total = total
+        self.n_copied = 0
+        self.finished = False
+        self.error: Optional[str] = None
+        self._lock = threading.Lock()
+
+    def _report(self, n_copied: int) -> None:
+        with self._lock:
+            self.n_copied += n_copied
+
+    def run(self, storage: BaseStorage) -> None:
+        try:
+            copy_study(storage, self.src_study_id, self.dst_study_id, callback=self._report)
+            storage.delete_study(self.src_study_id)
+        except Exception as e:
+            _logger.exception(
+                "Failed to copy the study (study_id=%d) to the study (study_id=%d).",
+                self.src_study_id,
+                self.dst_study_id,
+            )
+            with self._lock:
+                self.error = str(e)
+        finally:
+            with self._lock:
+                self.finished = True
+
+    def to_dict(self) -> dict[str, Any]:
+        with self._lock:
+            return {
+                "job_id": self.job_id,
+                "src_study_id": self.src_study_id,
+                "study_id": self.dst_study_id,
+                "total": self.total,
+                "n_copied": self.n_copied,
+                "finished": self.finished,
+                "error": self.error,
+            }
+
+
+class StudyCopyJobManager:
+    """Runs the copy of studies in background threads and keeps their progress.
+
+    Only the latest ``max_jobs`` jobs are kept so that the memory usage is bounded.
+
+    Jobs live in the memory of the process. When the dashboard is served by multiple worker
+    processes, the progress is only available from the worker that started the job. The
+    threads are daemon threads, so if the process exits during the copy, both the source
+    study and the partially copied study are left in the storage. The partially copied
+    study can be deleted from the dashboard, and the source study renamed again.
+    """
+
+    def __init__(self, max_jobs: int = 128) -> None:
+        self._max_jobs = max_jobs
+        self._jobs: OrderedDict[str, StudyCopyJob] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def start(
+        self, storage: BaseStorage, src_study_id: int, dst_study_id: int, total: int
+    ) -> StudyCopyJob:
+        job = StudyCopyJob(src_study_id, dst_study_id, total)
+        with self._lock:
+            self._jobs[job.job_id] = job
+            while len(self._jobs) > self._max_jobs:
+                self._jobs.popitem(last=False)
+        thread = threading.Thread(target=job.run, args=(storage,), daemon=True)
+        thread.start()
+        return job
+
+    def get(self, job_id: str) -> Optional[StudyCopyJob]:
+        with self._lock:
+            return self._jobs.get(job_id)
@@ -0,0 +1,127 @@
+from __future__ import annotations
+
+import functools
+from typing import TYPE_CHECKING
+
+from . import _note as note
+from ._custom_plot_data import get_plotly_graph_object_versions
+from ._custom_plot_data import SYSTEM_ATTR_PLOT_DATA
+from ._form_widget import get_form_widgets_json
+from ._named_objectives import get_objective_names
+from ._preferential_history import _SYSTEM_ATTR_PREFIX_HISTORY
+from .artifact._backend import ARTIFACTS_ATTR_PREFIX
+from .artifact._backend import DASHBOARD_ARTIFACTS_ATTR_PREFIX
+from .artifact._backend import list_study_artifacts
+from .preferential._system_attrs import _SYSTEM_ATTR_PREFIX_PREFERENCE
+from .preferential._system_attrs import _SYSTEM_ATTR_PREFIX_SKIP_TRIAL
+from .preferential._system_attrs import get_preferences
+from .preferential._system_attrs import get_skipped_trial_ids
+
+
+if TYPE_CHECKING:
+    from typing import Any
+    from typing import Optional
+
+    from ._form_widget import FormWidgetJSON
+    from ._note import NoteRefType
+    from .artifact._backend import ArtifactMeta
+
+
+_DASHBOARD_PREFIX = "dashboard:"
+_STUDY_NOTE_PREFIX = "dashboard:note_"
+_PREFIXES = (
+    ARTIFACTS_ATTR_PREFIX,
+    SYSTEM_ATTR_PLOT_DATA,
+    _STUDY_NOTE_PREFIX,
+    _SYSTEM_ATTR_PREFIX_HISTORY,
+    _SYSTEM_ATTR_PREFIX_PREFERENCE,
+    _SYSTEM_ATTR_PREFIX_SKIP_TRIAL,
+)
+
+
+class StudySystemAttrsView:
+    """A read-only view of the study system attrs that is built once per request.
+
+    The study system attrs are partitioned by the known key prefixes in a single pass, so
+    that each helper only scans the attributes it is interested in. The per-trial
+    attributes (notes and artifacts uploaded via optuna-dashboard) are grouped by the trial
+    ID. Decoded values are memoized.
+    """
+
+    def __init__(self, system_attrs: dict[str, Any]) -> None:
+        self._system_attrs = system_attrs
+        self._partitions: dict[str, dict[str, Any]] = {prefix: {} for prefix in _PREFIXES}
+        self._trial_partitions: dict[int, dict[str, Any]] = {}
+        self._note_refs: dict[Optional[int], NoteRefType] = {}
+
+        for key, value in system_attrs.items():
+            trial_id = _get_trial_id(key)
+            if trial_id is not None:
+                self._trial_partitions.setdefault(trial_id, {})[key] = value
+                continue
+            for prefix in _PREFIXES:
+                if key.startswith(prefix):
+                    self._partitions[prefix][key] = value
+                    break
+
+    def get(self, key: str, default: Any = None) -> Any:
+        return self._system_attrs.get(key, default)
+
+    def with_prefix(self, *prefixes: str) -> dict[str, Any]:
+        """Return the attributes under the given known prefixes."""
+        attrs: dict[str, Any] = {}
+        for prefix in prefixes:
+            attrs.update(self._partitions[prefix])
+        return attrs
+
+    def trial_attrs(self, trial_id: int) -> dict[str, Any]:
+        """Return the study system attrs that are associated with the trial."""
+        return self._trial_partitions.get(trial_id, {})
+
+    def note_ref(self, trial_id: Optional[int]) -> NoteRefType:
+        if trial_id not in self._note_refs:
+            if trial_id is None:
+                attrs = self._partitions[_STUDY_NOTE_PREFIX]
+            else:
+                attrs = self.trial_attrs(trial_id)
+            self._note_refs[trial_id] = note.get_note_ref_from_system_attrs(attrs, trial_id)
+        return self._note_refs[trial_id]
+
+    @functools.cached_property
+    def study_artifacts(self) -> list[ArtifactMeta]:
+        return list_study_artifacts(self._partitions[ARTIFACTS_ATTR_PREFIX])
+
+    @functools.cached_property
+    def plotly_graph_object_versions(self) -> dict[str, str]:
+        return get_plotly_graph_object_versions(self._partitions[SYSTEM_ATTR_PLOT_DATA])
+
+    @functools.cached_property
+    def preferences(self) -> list[tuple[int, int]]:
+        return get_preferences(self._partitions[_SYSTEM_ATTR_PREFIX_PREFERENCE])
+
+    @functools.cached_property
+    def skipped_trial_ids(self) -> list[int]:
+        return get_skipped_trial_ids(self._partitions[_SYSTEM_ATTR_PREFIX_SKIP_TRIAL])
+
+    @functools.cached_property
+    def objective_names(self) -> Optional[list[str]]:
+        return get_objective_names(self._system_attrs)
+
+    @functools.cached_property
+    def form_widgets(self) -> Optional[FormWidgetJSON]:
+        return get_form_widgets_json(self._system_attrs)
+
+
+def _get_trial_id(key: str) -> Optional[int]:
+    # Per-trial keys look like "dashboard:<trial_id>:note_ver" or
+    # "dashboard:artifacts:<trial_id>:<artifact_id>".
+    if key.startswith(DASHBOARD_ARTIFACTS_ATTR_PREFIX):
+        rest = key[len(DASHBOARD_ARTIFACTS_ATTR_PREFIX) :]
+    elif key.startswith(_DASHBOARD_PREFIX):
+        rest = key[len(_DASHBOARD_PREFIX) :]
+    else:
+        return None
+    head, sep, _ = rest.partition(":")
+    if not sep or not head.isascii() or not head.isdigit():
+        return None
+    return int(head)
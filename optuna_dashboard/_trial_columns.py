@@ -0,0 +1,239 @@
+from __future__ import annotations
+
+import numbers
+from typing import TYPE_CHECKING
+
+import numpy as np
+from optuna.study import StudyDirection
+from optuna.trial import TrialState
+
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+    from datetime import datetime
+    from typing import Optional
+
+    from optuna.trial import FrozenTrial
+
+    from ._inmemory_cache import InMemoryCache
+
+
+_STATE_COMPLETE = TrialState.COMPLETE.value
+
+
+class TrialColumns:
+    """A columnar store of the trials of a study backed by NumPy arrays.
+
+    Each trial is a row, and rows are in the same order as the trial list. Missing values
+    (e.g. the values of a running trial, or a parameter that is not suggested) are NaN.
+    Parameters are stored in their internal representation, and only numeric user attrs
+    are stored.
+
+    ``trials`` is the trial list given to :meth:`extend`, which is the list cached by
+    ``get_trials()``, so the trials themselves are not copied.
+
+    Columns are never modified in place, so they can be read without locks. :meth:`extend`
+    returns new columns reusing the rows of the trials that were already finished, since
+    finished trials are immutable. It is proportional to the number of new or running trials.
+    """
+
+    def __init__(self) -> None:
+        self.trials: list[FrozenTrial] = []
+        self.trial_id = np.empty(0, dtype=np.int64)
+        self.number = np.empty(0, dtype=np.int64)
+        self.state = np.empty(0, dtype=np.int8)
+        self.values = np.empty((0, 0), dtype=np.float64)
+        self.datetime_start = np.empty(0, dtype=np.float64)
+        self.datetime_complete = np.empty(0, dtype=np.float64)
+        self.params: dict[str, np.ndarray] = {}
+        self.user_attrs: dict[str, np.ndarray] = {}
+        # The number of leading rows whose trials are finished.
+        self._n_stable = 0
+
+    def __len__(self) -> int:
+        return len(self.trials)
+
+    @property
+    def n_stable(self) -> int:
+        """The number of leading rows whose trials are finished, which never change."""
+        return self._n_stable
+
+    def extend(self, trials: list[FrozenTrial]) -> TrialColumns:
+        """Return the columns of the trial list, which must extend the current one."""
+        if trials is self.trials:
+            return self
+        n_stable = min(self._n_stable, len(trials))
+        new_trials = trials[n_stable:]
+
+        n_objectives = self.values.shape[1]
+        for t in new_trials:
+            if t.values is not None:
+                n_objectives = max(n_objectives, len(t.values))
+        values = np.full((len(new_trials), n_objectives), np.nan)
+        for i, t in enumerate(new_trials):
+            if t.values is not None:
+                values[i, : len(t.values)] = t.values
+
+        params: dict[str, np.ndarray] = {}
+        user_attrs: dict[str, np.ndarray] = {}
+        for i, t in enumerate(new_trials):
+            for name, value in t.params.items():
+                if name not in params:
+                    params[name] = np.full(len(new_trials), np.nan)
+                params[name][i] = t.distributions[name].to_internal_repr(value)
+            for key, value in t.user_attrs.items():
+                if isinstance(value, numbers.Real) and not isinstance(value, bool):
+                    if key not in user_attrs:
+                        user_attrs[key] = np.full(len(new_trials), np.nan)
+                    user_attrs[key][i] = value
+
+        extended = TrialColumns()
+        extended.trial_id = np.concatenate(
+            [self.trial_id[:n_stable], np.array([t._trial_id for t in new_trials], np.int64)]
+        )
+        extended.number = np.concatenate(
+            [self.number[:n_stable], np.array([t.number for t in new_trials], np.int64)]
+        )
+        extended.state = np.concatenate(
+            [self.state[:n_stable], np.array([t.state.value for t in new_trials], np.int8)]
+        )
+        extended.values = np.concatenate(
+            [_pad_columns(self.values[:n_stable], n_objectives), values]
+        )
+        extended.datetime_start = np.concatenate(
+            [self.datetime_start[:n_stable], _timestamps([t.datetime_start for t in new_trials])]
+        )
+        extended.datetime_complete = np.concatenate(
+            [
+                self.datetime_complete[:n_stable],
+                _timestamps([t.datetime_complete for t in new_trials]),
+            ]
+        )
+        extended.params = _merge_columns(self.params, params, n_stable, len(new_trials))
+        extended.user_attrs = _merge_columns(
+            self.user_attrs, user_attrs, n_stable, len(new_trials)
+        )
+
+        extended.trials = trials
+        while n_stable < len(trials) and trials[n_stable].state.is_finished():
+            n_stable += 1
+        extended._n_stable = n_stable
+        return extended
+
+    def completed_mask(self) -> np.ndarray:
+        return self.state == _STATE_COMPLETE
+
+    def trials_at(self, positions: np.ndarray) -> list[FrozenTrial]:
+        return [self.trials[i] for i in positions.tolist()]
+
+    def get_best_trial(self, direction: StudyDirection) -> Optional[FrozenTrial]:
+        """Return the first completed trial with the best value of a single-objective study."""
+        (completed,) = np.nonzero(self.completed_mask())
+        if len(completed) == 0 or self.values.shape[1] == 0:
+            return None
+        values = self.values[completed, 0]
+        if direction == StudyDirection.MAXIMIZE:
+            best = np.argmax(values)
+        else:
+            best = np.argmin(values)
+        return self.trials[completed[best]]
+
+    def get_pareto_front_trials(self, directions: Sequence[StudyDirection]) -> list[FrozenTrial]:
+        """Return the completed trials that are not dominated by any other completed trial.
+
+        Trials with identical values do not dominate each other, so all of them are returned.
+        """
+        (completed,) = np.nonzero(self.completed_mask())
+        if len(completed) == 0:
+            return []
+        values = self.values[completed, : len(directions)].copy()
+        for i, direction in enumerate(directions):
+            if direction == StudyDirection.MAXIMIZE:
+                values[:, i] = -values[:, i]
+        if len(directions) == 2:
+            on_front = _is_pareto_front_2d(values)
+        else:
+            on_front = _is_pareto_front_nd(values)
+        return self.trials_at(completed[on_front])
+
+    def get_numbers_of_trial_ids(self, trial_ids: Sequence[int]) -> list[int]:
+        mask = np.isin(self.trial_id, np.asarray(trial_ids, dtype=np.int64))
+        return self.number[mask].tolist()
+
+    def get_trials_of_numbers(self, numbers: Sequence[int]) -> list[FrozenTrial]:
+        (positions,) = np.nonzero(np.isin(self.number, np.asarray(numbers, dtype=np.int64)))
+        return self.trials_at(positions)
+
+
+def get_trial_columns(
+    in_memory_cache: InMemoryCache, study_id: int, trials: list[FrozenTrial]
+) -> Optional[TrialColumns]:
+    """Return the columns of the trials, or ``None`` if the columnar store is disabled."""
+    if not in_memory_cache._trial_columns_enabled:
+        return None
+    return extend_trial_columns(in_memory_cache, study_id, trials)
+
+
+def extend_trial_columns(
+    in_memory_cache: InMemoryCache, study_id: int, trials: list[FrozenTrial]
+) -> TrialColumns:
+    """Return the columns of the trials even if the columnar store is disabled.
+
+    This is used by the features that always need the columns, e.g. the server-side
+    filtering of trials, so the columns are only kept for the studies that use them.
+    """
+    with in_memory_cache._trial_columns_cache_lock:
+        columns = in_memory_cache._trial_columns_cache.get(study_id)
+        if columns is None:
+            columns = TrialColumns()
+        columns = columns.extend(trials)
+        in_memory_cache._trial_columns_cache[study_id] = columns
+        return columns
+
+
+def _timestamps(datetimes: list[Optional[datetime]]) -> np.ndarray:
+    return np.array([np.nan if d is None else d.timestamp() for d in datetimes], np.float64)
+
+
+def _pad_columns(array: np.ndarray, n_columns: int) -> np.ndarray:
+    if array.shape[1] == n_columns:
+        return array
+    padded = np.full((array.shape[0], n_columns), np.nan)
+    padded[:, : array.shape[1]] = array
+    return padded
+
+
+def _merge_columns(
+    old: dict[str, np.ndarray], new: dict[str, np.ndarray], n_stable: int, n_new: int
+) -> dict[str, np.ndarray]:
+    merged: dict[str, np.ndarray] = {}
+    for name in old.keys() | new.keys():
+        head = old[name][:n_stable] if name in old else np.full(n_stable, np.nan)
+        tail = new[name] if name in new else np.full(n_new, np.nan)
+        merged[name] = np.concatenate([head, tail])
+    return merged
+
+
+def _is_pareto_front_2d(values: np.ndarray) -> np.ndarray:
+    # Sort lexicographically. A trial is dominated iff a trial with strictly smaller values in
+    # the lexicographic order has a second value that is not larger than its one. The first
+    # group is never dominated, which is checked explicitly since values may be infinite.
+    order = np.lexsort((values[:, 1], values[:, 0]))
+    sorted_values = values[order]
+    n = len(sorted_values)
+    is_group_head = np.ones(n, dtype=bool)
+    is_group_head[1:] = np.any(sorted_values[1:] != sorted_values[:-1], axis=1)
+    group_head = np.maximum.accumulate(np.where(is_group_head, np.arange(n), 0))
+    running_min = np.minimum.accumulate(sorted_values[:, 1])
+    min_before_group = np.where(group_head > 0, running_min[np.maximum(group_head - 1, 0)], np.inf)
+    on_front = np.empty(n, dtype=bool)
+    on_front[order] = (group_head == 0) | (min_before_group > sorted_values[:, 1])
+    return on_front
+
+
+def _is_pareto_front_nd(values: np.ndarray) -> np.ndarray:
+    on_front = np.ones(len(values), dtype=bool)
+    for i, v in enumerate(values):
+        dominated_by = np.all(values <= v, axis=1) & np.any(values < v, axis=1)
+        on_front[i] = not dominated_by.any()
+    return on_front
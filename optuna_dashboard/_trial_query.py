@@ -0,0 +1,355 @@
+from __future__ import annotations
+
+import base64
+import binascii
+from dataclasses import dataclass
+import json
+import math
+import numbers
+import operator
+import threading
+from typing import TYPE_CHECKING
+
+import numpy as np
+from optuna.trial import TrialState
+
+from ._storage import get_trials
+from ._trial_columns import extend_trial_columns
+
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+    from typing import Any
+    from typing import Optional
+
+    from optuna.storages import BaseStorage
+    from optuna.trial import FrozenTrial
+
+    from ._inmemory_cache import InMemoryCache
+    from ._trial_columns import TrialColumns
+
+    # e.g. ("number", ""), ("value", "0"), ("param", "x"), ("user_attr", "key")
+    ColumnKey = tuple[str, str]
+
+
+DEFAULT_LIMIT = 100
+MAX_LIMIT = 1000
+_SCALAR_COLUMNS = ("number", "datetime_start", "datetime_complete", "duration")
+_USER_ATTR_OPS = ("eq", "ne", "lt", "le", "gt", "ge", "in", "exists")
+
+
+class InvalidTrialQuery(Exception):
+    pass
+
+
+@dataclass(frozen=True)
+class SortOrder:
+    """The positions of the trials sorted by a column, and their sort keys and numbers.
+
+    Keys are negated for the descending order, so they are always in the ascending order
+    with NaN, i.e. missing values, last. Ties are in the ascending order of the numbers.
+    """
+
+    positions: np.ndarray
+    keys: np.ndarray
+    numbers: np.ndarray
+
+    def index_after(self, key: float, number: int) -> int:
+        """Return the index of the first trial that comes after the given key and number."""
+        lo = np.searchsorted(self.keys, key, side="left")
+        hi = np.searchsorted(self.keys, key, side="right")
+        return int(lo + np.searchsorted(self.numbers[lo:hi], number, side="right"))
+
+
+class TrialColumnIndex:
+    """Sort orders of the trials of a study for filtering and sorting them on the server.
+
+    The index is built on the :class:`TrialColumns` of the study, so the trials are not
+    copied to other columns. Sort orders are built on demand, so only the orders that are
+    actually queried are kept in memory. :meth:`extend` reuses the sort orders of the
+    finished trials like :meth:`TrialColumns.extend`.
+    """
+
+    def __init__(self, columns: TrialColumns) -> None:
+        self.columns = columns
+        self._sort_orders: dict[tuple[ColumnKey, bool], SortOrder] = {}
+        self._lock = threading.Lock()
+
+    @property
+    def trials(self) -> list[FrozenTrial]:
+        return self.columns.trials
+
+    def column(self, key: ColumnKey) -> np.ndarray:
+        """Return the column as floats, where missing and non-numeric values are NaN."""
+        columns = self.columns
+        kind, name = key
+        if kind == "number":
+            return columns.number.astype(np.float64)
+        if kind == "datetime_start":
+            return columns.datetime_start
+        if kind == "datetime_complete":
+            return columns.datetime_complete
+        if kind == "duration":
+            return columns.datetime_complete - columns.datetime_start
+        if kind == "value":
+            objective = int(name)
+            if objective < columns.values.shape[1]:
+                return columns.values[:, objective]
+        elif kind == "param_internal":
+            # Categorical parameters are sorted by the index of the choice.
+            if name in columns.params:
+                return columns.params[name]
+        elif kind == "user_attr":
+            if name in columns.user_attrs:
+                return columns.user_attrs[name]
+        else:
+            raise InvalidTrialQuery(f"Unknown column: {kind}")
+        return np.full(len(columns), np.nan)
+
+    def sort_order(self, key: ColumnKey, descending: bool) -> SortOrder:
+        """Return the trials sorted by the column.
+
+        Trials without the column come last in both orders, and ties are broken by the
+        trial number. Only numeric values are sorted, and the other values are treated as
+        missing.
+        """
+        with self._lock:
+            order = self._sort_orders.get((key, descending))
+        if order is not None:
+            return order
+
+        keys = self._sort_keys(key, descending)
+        # The positions are in the order of the trial numbers, so the stable sort breaks ties
+        # by the trial number.
+        positions = np.argsort(keys, kind="stable")
+        order = SortOrder(positions, keys[positions], self.columns.number[positions])
+        with self._lock:
+            return self._sort_orders.setdefault((key, descending), order)
+
+    def extend(self, columns: TrialColumns) -> TrialColumnIndex:
+        """Return the index of the columns, which must extend the current columns.
+
+        The rows of finished trials never change, so their sort orders are kept, and only the
+        other trials are sorted and merged into them.
+        """
+        extended = TrialColumnIndex(columns)
+        n_stable = self.columns.n_stable
+        with self._lock:
+            sort_orders = list(self._sort_orders.items())
+        for (key, descending), order in sort_orders:
+            stable = order.positions < n_stable
+            keys = extended._sort_keys(key, descending)[n_stable:]
+            sorted_new = np.argsort(keys, kind="stable")
+            # The other trials have larger numbers than the finished trials with the same key.
+            insert_at = np.searchsorted(order.keys[stable], keys[sorted_new], side="right")
+            positions = np.insert(order.positions[stable], insert_at, sorted_new + n_stable)
+            extended._sort_orders[(key, descending)] = SortOrder(
+                positions,
+                np.insert(order.keys[stable], insert_at, keys[sorted_new]),
+                columns.number[positions],
+            )
+        return extended
+
+    def _sort_keys(self, key: ColumnKey, descending: bool) -> np.ndarray:
+        # NaN stays NaN when negated, so missing values come last in both orders.
+        column = self.column(key)
+        return -column if descending else column
+
+
+def get_trial_column_index(
+    in_memory_cache: InMemoryCache, storage: BaseStorage, study_id: int
+) -> TrialColumnIndex:
+    trials = get_trials(in_memory_cache, storage, study_id)
+    columns = extend_trial_columns(in_memory_cache, study_id, trials)
+    with in_memory_cache._trial_column_index_cache_lock:
+        index = in_memory_cache._trial_column_index_cache.get(study_id)
+        if index is None:
+            index = TrialColumnIndex(columns)
+        elif index.columns is not columns:
+            index = index.extend(columns)
+        in_memory_cache._trial_column_index_cache[study_id] = index
+        return index
+
+
+def _is_number(value: Any) -> bool:
+    return isinstance(value, numbers.Real) and not isinstance(value, bool)
+
+
+def parse_sort(sort_by: str) -> ColumnKey:
+    kind, _, name = sort_by.partition(":")
+    if kind in _SCALAR_COLUMNS and not name:
+        return (kind, "")
+    if kind == "value" and name.isdigit():
+        return (kind, name)
+    if kind == "param" and name:
+        return ("param_internal", name)
+    if kind == "user_attr" and name:
+        return (kind, name)
+    raise InvalidTrialQuery(f"Invalid sort_by: {sort_by}")
+
+
+def parse_states(states: str) -> set[TrialState]:
+    try:
+        return {TrialState[s.strip().upper()] for s in states.split(",") if s.strip()}
+    except KeyError as e:
+        raise InvalidTrialQuery(f"Invalid state: {e}")
+
+
+def compile_filters(index: TrialColumnIndex, filters: Any) -> list[np.ndarray]:
+    """Compile the filters to boolean masks over the positions of the trials.
+
+    Each filter is one of the following objects:
+
+    - ``{"type": "param", "name": ..., "min": ..., "max": ...}``
+    - ``{"type": "param", "name": ..., "in": [...]}``
+    - ``{"type": "value", "objective": ..., "min": ..., "max": ...}``
+    - ``{"type": "user_attr", "key": ..., "op": ..., "value": ...}``, where ``op`` is one of
+      ``eq``, ``ne``, ``lt``, ``le``, ``gt``, ``ge``, ``in``, and ``exists``.
+    """
+    if not isinstance(filters, list):
+        raise InvalidTrialQuery("filters must be an array.")
+    return [_compile_filter(index, f) for f in filters]
+
+
+def _compile_filter(index: TrialColumnIndex, f: Any) -> np.ndarray:
+    if not isinstance(f, dict):
+        raise InvalidTrialQuery("Each filter must be an object.")
+    filter_type = f.get("type")
+    if filter_type == "param":
+        name = f.get("name")
+        if not isinstance(name, str):
+            raise InvalidTrialQuery("name of the param filter must be a string.")
+        # The filters compare the external representations of params, which are not stored
+        # in the columns.
+        params = [t.params.get(name) for t in index.trials]
+        if "in" in f:
+            if not isinstance(f["in"], list):
+                raise InvalidTrialQuery("in of the param filter must be an array.")
+            # Categorical choices are compared as strings like the trial table.
+            choices = {str(c) for c in f["in"]}
+            return _mask(params, lambda v: str(v) in choices)
+        return _compile_range(
+            np.array([v if _is_number(v) else np.nan for v in params], np.float64), f
+        )
+    if filter_type == "value":
+        objective = f.get("objective", 0)
+        if not isinstance(objective, int) or objective < 0:
+            raise InvalidTrialQuery("objective of the value filter must be an integer.")
+        return _compile_range(index.column(("value", str(objective))), f)
+    if filter_type == "user_attr":
+        key = f.get("key")
+        if not isinstance(key, str):
+            raise InvalidTrialQuery("key of the user_attr filter must be a string.")
+        return _compile_user_attr_filter(index, key, f)
+    raise InvalidTrialQuery(f"Unknown filter type: {filter_type}")
+
+
+def _mask(values: list[Any], predicate: Callable[[Any], bool]) -> np.ndarray:
+    return np.fromiter(
+        (v is not None and predicate(v) for v in values), dtype=bool, count=len(values)
+    )
+
+
+def _compile_range(column: np.ndarray, f: dict[str, Any]) -> np.ndarray:
+    low = f.get("min")
+    high = f.get("max")
+    if (low is not None and not _is_number(low)) or (high is not None and not _is_number(high)):
+        raise InvalidTrialQuery("min and max must be numbers.")
+    low = -math.inf if low is None else low
+    high = math.inf if high is None else high
+    # NaN, i.e. a missing value, is never in the range.
+    return (low <= column) & (column <= high)
+
+
+def _compile_user_attr_filter(index: TrialColumnIndex, key: str, f: dict[str, Any]) -> np.ndarray:
+    op = f.get("op", "eq")
+    value: Any = f.get("value")
+    if op not in _USER_ATTR_OPS:
+        raise InvalidTrialQuery(f"Unknown op: {op}")
+    if op in ("exists", "eq", "ne", "in"):
+        # The columns only have numeric user attrs, so these ops read the trials.
+        if op == "in" and not isinstance(value, list):
+            raise InvalidTrialQuery("value of the in op must be an array.")
+        predicate: Callable[[Any], bool] = {
+            "exists": lambda v: True,
+            "eq": lambda v: v == value,
+            "ne": lambda v: v != value,
+            "in": lambda v: v in value,
+        }[op]
+        return _mask([t.user_attrs.get(key) for t in index.trials], predicate)
+    if not _is_number(value):
+        raise InvalidTrialQuery(f"value of the {op} op must be a number.")
+    compare = {"lt": operator.lt, "le": operator.le, "gt": operator.gt, "ge": operator.ge}[op]
+    # Non-numeric values are NaN in the column, which never match.
+    return compare(index.column(("user_attr", key)), value)
+
+
+def encode_cursor(sort_by: str, order: str, key: float, number: int) -> str:
+    payload = json.dumps(
+        {
+            "sort_by": sort_by,
+            "order": order,
+            "key": None if math.isnan(key) else key,
+            "after": number,
+        }
+    )
+    return base64.urlsafe_b64encode(payload.encode("utf-8")).decode("ascii")
+
+
+def decode_cursor(cursor: str, sort_by: str, order: str) -> tuple[float, int]:
+    try:
+        payload = json.loads(base64.urlsafe_b64decode(cursor.encode("ascii")))
+        key = payload["key"]
+        after = payload["after"]
+    except (ValueError, KeyError, TypeError, binascii.Error):
+        raise InvalidTrialQuery("Invalid cursor.")
+    if payload.get("sort_by") != sort_by or payload.get("order") != order:
+        raise InvalidTrialQuery("The cursor was issued for another sort order.")
+    if not isinstance(after, int) or not (key is None or _is_number(key)):
+        raise InvalidTrialQuery("Invalid cursor.")
+    return math.nan if key is None else float(key), after
+
+
+def query_trials(
+    index: TrialColumnIndex,
+    *,
+    states: Optional[set[TrialState]] = None,
+    filters: Optional[list[np.ndarray]] = None,
+    sort_by: str = "number",
+    order: str = "asc",
+    limit: int = DEFAULT_LIMIT,
+    cursor: Optional[str] = None,
+) -> tuple[list[FrozenTrial], Optional[str]]:
+    """Return a page of the trials that match all conditions, and the cursor of the next page.
+
+    The cursor has the sort key and the number of the last trial of the page, so that trials
+    added or updated after the page is fetched do not shift the following pages.
+    """
+    if order not in ("asc", "desc"):
+        raise InvalidTrialQuery("order must be either 'asc' or 'desc'.")
+    if not 0 < limit <= MAX_LIMIT:
+        raise InvalidTrialQuery(f"limit must be between 1 and {MAX_LIMIT}.")
+
+    sort_order = index.sort_order(parse_sort(sort_by), order == "desc")
+    start = 0
+    if cursor is not None:
+        start = sort_order.index_after(*decode_cursor(cursor, sort_by, order))
+
+    mask = np.ones(len(index.trials), dtype=bool)
+    for m in filters or []:
+        mask &= m
+    if states:
+        mask &= np.isin(index.columns.state, [s.value for s in states])
+
+    (matched,) = np.nonzero(mask[sort_order.positions[start:]])
+    matched = matched[: limit + 1] + start
+    has_next = len(matched) > limit
+    matched = matched[:limit]
+
+    next_cursor = None
+    if has_next:
+        last = matched[-1]
+        next_cursor = encode_cursor(
+            sort_by, order, float(sort_order.keys[last]), int(sort_order.numbers[last])
+        )
+    return index.columns.trials_at(sort_order.positions[matched]), next_cursor
@@ -1,6 +1,5 @@
 from __future__ import annotations
 
-import io
 import json
 import mimetypes
 import os.path
@@ -17,11 +16,34 @@ import optuna
 from optuna.trial import FrozenTrial
 
 from .._bottle_util import json_api_view
-from .._bottle_util import parse_data_uri
+from ._backend_to_store import ArtifactBackendToStore
+from ._deletion import remove_artifacts
+from ._preview import create_preview_response
+from ._preview import DEFAULT_PREVIEW_CACHE_DIR
+from ._preview import DEFAULT_PREVIEW_CACHE_MAX_BYTES
+from ._preview import DEFAULT_PREVIEW_LINES
+from ._preview import DEFAULT_THUMBNAIL_SIZE
+from ._preview import get_preview_kind
+from ._preview import get_thumbnail_format
+from ._preview import is_pillow_available
+from ._preview import MAX_PREVIEW_LINES
+from ._preview import MAX_THUMBNAIL_SIZE
+from ._preview import MIN_THUMBNAIL_SIZE
+from ._preview import PreviewCache
+from ._preview import PreviewNotSupported
+from ._serve import create_artifact_response
+from ._serve import create_not_modified_response
+from ._serve import DEFAULT_BUFFER_SIZE
+from ._serve import DEFAULT_X_ACCEL_REDIRECT
+from ._serve import DEFAULT_X_SENDFILE
+from ._serve import get_offload_header
+from ._upload import UploadError
+from ._upload import write_uploaded_file
 
 
 if TYPE_CHECKING:
     from typing import Any
+    from typing import BinaryIO
     from typing import Optional
     from typing import TypedDict
 
@@ -43,6 +65,7 @@ if TYPE_CHECKING:
 ARTIFACTS_ATTR_PREFIX = "artifacts:"
 DASHBOARD_ARTIFACTS_ATTR_PREFIX = "dashboard:artifacts:"
 DEFAULT_MIME_TYPE = "application/octet-stream"
+# Only the legacy uploads of base64-encoded data URIs are buffered in memory.
 BaseRequest.MEMFILE_MAX = int(
     os.environ.get("OPTUNA_DASHBOARD_MEMFILE_MAX", 1024 * 1024 * 128)
 )  # 128MB
@@ -74,27 +97,40 @@ def get_artifact_path(
 
 
 def register_artifact_route(
-    app: Bottle, storage: BaseStorage, artifact_store: ArtifactStore | None
+    app: Bottle,
+    storage: BaseStorage,
+    artifact_store: ArtifactStore | None,
+    *,
+    buffer_size: int = DEFAULT_BUFFER_SIZE,
+    x_sendfile: bool = DEFAULT_X_SENDFILE,
+    x_accel_redirect: str | None = DEFAULT_X_ACCEL_REDIRECT,
+    preview_cache_dir: str | None = DEFAULT_PREVIEW_CACHE_DIR,
+    preview_cache_max_bytes: int = DEFAULT_PREVIEW_CACHE_MAX_BYTES,
 ) -> None:
+    from ._index import invalidate_artifact_index
+    from ._index import lookup_study_artifact_meta
+    from ._index import lookup_trial_artifact_meta
+
+    preview_cache = (
+        PreviewCache(artifact_store, preview_cache_dir, preview_cache_max_bytes)
+        if artifact_store is not None
+        else None
+    )
+
     @app.get("/artifacts/<study_id:int>/<artifact_id:re:[0-9a-fA-F-]+>")
     def proxy_study_artifact(study_id: int, artifact_id: str) -> HTTPResponse | bytes:
         if artifact_store is None:
             response.status = 400  # Bad Request
             return b"Cannot access to the artifacts."
-        artifact_dict = get_study_artifact_meta(storage, study_id, artifact_id)
+        artifact_dict = lookup_study_artifact_meta(
+            app._inmemory_cache, storage, study_id, artifact_id
+        )
         if artifact_dict is None:
             response.status = 404
             return b"Not Found"
-        headers = {"Content-Type": artifact_dict["mimetype"]}
-        encoding = artifact_dict.get("encoding")
-        if encoding:
-            headers["Content-Encodings"] = encoding
-
-        # CORS Headers
-        headers["Access-Control-Allow-Origin"] = "*"
-
-        fp = artifact_store.open_reader(artifact_id)
-        return HTTPResponse(fp, headers=headers)
+        return _proxy_artifact(
+            artifact_store, artifact_id, artifact_dict, buffer_size, x_sendfile, x_accel_redirect
+        )
 
     @app.get("/artifacts/<study_id:int>/<trial_id:int>/<artifact_id:re:[0-9a-fA-F-]+>")
     def proxy_trial_artifact(
@@ -105,20 +141,61 @@ def register_artifact_route(
         if artifact_store is None:
             response.status = 400  # Bad Request
             return b"Cannot access to the artifacts."
-        artifact_dict = get_trial_artifact_meta(storage, study_id, trial_id, artifact_id)
+        artifact_dict = lookup_trial_artifact_meta(
+            app._inmemory_cache, storage, study_id, trial_id, artifact_id
+        )
         if artifact_dict is None:
             response.status = 404
             return b"Not Found"
-        headers = {"Content-Type": artifact_dict["mimetype"]}
-        encoding = artifact_dict.get("encoding")
-        if encoding:
-            headers["Content-Encodings"] = encoding
+        return _proxy_artifact(
+            artifact_store, artifact_id, artifact_dict, buffer_size, x_sendfile, x_accel_redirect
+        )
 
-        # CORS Headers
-        headers["Access-Control-Allow-Origin"] = "*"
+    @app.get("/artifacts/<study_id:int>/<artifact_id:re:[0-9a-fA-F-]+>/preview")
+    def preview_study_artifact(study_id: int, artifact_id: str) -> HTTPResponse | bytes:
+        if artifact_store is None or preview_cache is None:
+            response.status = 400  # Bad Request
+            return b"Cannot access to the artifacts."
+        artifact_dict = lookup_study_artifact_meta(
+            app._inmemory_cache, storage, study_id, artifact_id
+        )
+        if artifact_dict is None:
+            response.status = 404
+            return b"Not Found"
+        return _preview_artifact(
+            artifact_store,
+            preview_cache,
+            artifact_id,
+            artifact_dict,
+            buffer_size,
+            x_sendfile,
+            x_accel_redirect,
+        )
 
-        fp = artifact_store.open_reader(artifact_id)
-        return HTTPResponse(fp, headers=headers)
+    @app.get("/artifacts/<study_id:int>/<trial_id:int>/<artifact_id:re:[0-9a-fA-F-]+>/preview")
+    def preview_trial_artifact(
+        study_id: int,
+        trial_id: int,
+        artifact_id: str,
+    ) -> HTTPResponse | bytes:
+        if artifact_store is None or preview_cache is None:
+            response.status = 400  # Bad Request
+            return b"Cannot access to the artifacts."
+        artifact_dict = lookup_trial_artifact_meta(
+            app._inmemory_cache, storage, study_id, trial_id, artifact_id
+        )
+        if artifact_dict is None:
+            response.status = 404
+            return b"Not Found"
+        return _preview_artifact(
+            artifact_store,
+            preview_cache,
+            artifact_id,
+            artifact_dict,
+            buffer_size,
+            x_sendfile,
+            x_accel_redirect,
+        )
 
     @app.post("/api/artifacts/<study_id:int>/<trial_id:int>")
     @json_api_view
@@ -135,15 +212,11 @@ def register_artifact_route(
         if artifact_store is None:
             response.status = 400  # Bad Request
             return {"reason": "Cannot access to the artifacts."}
-        file = request.json.get("file")
-        if file is None:
-            response.status = 400
-            return {"reason": "Please specify the 'file' key."}
-
-        _, data = parse_data_uri(file)
-        filename = request.json.get("filename", "")
-        artifact_id = str(uuid.uuid4())
-        artifact_store.write(artifact_id, io.BytesIO(data))
+        try:
+            artifact_id, filename = write_uploaded_file(artifact_store, buffer_size)
+        except UploadError as e:
+            response.status = e.status
+            return {"reason": str(e)}
 
         mimetype, encoding = mimetypes.guess_type(filename)
         artifact = {
@@ -154,6 +227,7 @@ def register_artifact_route(
         }
         attr_key = ARTIFACTS_ATTR_PREFIX + artifact_id
         storage.set_trial_system_attr(trial_id, attr_key, json.dumps(artifact))
+        invalidate_artifact_index(app._inmemory_cache, study_id)
         response.status = 201
 
         study_system_attrs = storage.get_study_system_attrs(study_id)
@@ -170,15 +244,11 @@ def register_artifact_route(
         if artifact_store is None:
             response.status = 400  # Bad Request
             return {"reason": "Cannot access to the artifacts."}
-        file = request.json.get("file")
-        if file is None:
-            response.status = 400
-            return {"reason": "Please specify the 'file' key."}
-
-        _, data = parse_data_uri(file)
-        filename = request.json.get("filename", "")
-        artifact_id = str(uuid.uuid4())
-        artifact_store.write(artifact_id, io.BytesIO(data))
+        try:
+            artifact_id, filename = write_uploaded_file(artifact_store, buffer_size)
+        except UploadError as e:
+            response.status = e.status
+            return {"reason": str(e)}
 
         mimetype, encoding = mimetypes.guess_type(filename)
         artifact = {
@@ -189,6 +259,7 @@ def register_artifact_route(
         }
         attr_key = ARTIFACTS_ATTR_PREFIX + artifact_id
         storage.set_study_system_attr(study_id, attr_key, json.dumps(artifact))
+        invalidate_artifact_index(app._inmemory_cache, study_id)
 
         response.status = 201
 
@@ -218,6 +289,7 @@ def register_artifact_route(
         storage.set_trial_system_attr(
             trial_id, ARTIFACTS_ATTR_PREFIX + artifact_id, json.dumps(None)
         )
+        invalidate_artifact_index(app._inmemory_cache, study_id)
 
         response.status = 204
         return {}
@@ -239,11 +311,124 @@ def register_artifact_route(
         storage.set_study_system_attr(
             study_id, ARTIFACTS_ATTR_PREFIX + artifact_id, json.dumps(None)
         )
+        invalidate_artifact_index(app._inmemory_cache, study_id)
 
         response.status = 204
         return {}
 
 
+def _proxy_artifact(
+    artifact_store: ArtifactStore,
+    artifact_id: str,
+    artifact_meta: ArtifactMeta,
+    buffer_size: int,
+    x_sendfile: bool,
+    x_accel_redirect: str | None,
+) -> HTTPResponse | bytes:
+    from optuna.artifacts.exceptions import ArtifactNotFound
+
+    not_modified = create_not_modified_response(artifact_id, artifact_meta)
+    if not_modified is not None:
+        return not_modified
+    try:
+        fp = artifact_store.open_reader(artifact_id)
+    except ArtifactNotFound:
+        response.status = 404
+        return b"Not Found"
+    offload_header = get_offload_header(
+        fp, _get_file_system_base_path(artifact_store), x_sendfile, x_accel_redirect
+    )
+    return create_artifact_response(fp, artifact_id, artifact_meta, buffer_size, offload_header)
+
+
+def _preview_artifact(
+    artifact_store: ArtifactStore,
+    preview_cache: PreviewCache,
+    artifact_id: str,
+    artifact_meta: ArtifactMeta,
+    buffer_size: int,
+    x_sendfile: bool,
+    x_accel_redirect: str | None,
+) -> HTTPResponse | bytes:
+    from optuna.artifacts.exceptions import ArtifactNotFound
+
+    kind = get_preview_kind(artifact_meta)
+    if kind == "image":
+        if not is_pillow_available():
+            # Serve the original image since thumbnails cannot be generated without Pillow.
+            return _proxy_artifact(
+                artifact_store,
+                artifact_id,
+                artifact_meta,
+                buffer_size,
+                x_sendfile,
+                x_accel_redirect,
+            )
+        size = _get_int_query(
+            "size", DEFAULT_THUMBNAIL_SIZE, MIN_THUMBNAIL_SIZE, MAX_THUMBNAIL_SIZE
+        )
+        if size is None:
+            response.status = 400  # Bad Request
+            return (
+                f"`size` should be between {MIN_THUMBNAIL_SIZE} and {MAX_THUMBNAIL_SIZE}."
+            ).encode()
+        image_format, mimetype = get_thumbnail_format(artifact_meta["mimetype"])
+        variant = f"thumbnail-{size}"
+
+        def open_preview() -> BinaryIO:
+            return preview_cache.open_thumbnail(artifact_id, size, image_format)
+
+    elif kind == "text":
+        n_lines = _get_int_query("lines", DEFAULT_PREVIEW_LINES, 1, MAX_PREVIEW_LINES)
+        if n_lines is None:
+            response.status = 400  # Bad Request
+            return f"`lines` should be between 1 and {MAX_PREVIEW_LINES}.".encode()
+        mimetype = artifact_meta["mimetype"]
+        variant = f"text-{n_lines}"
+
+        def open_preview() -> BinaryIO:
+            return preview_cache.open_text_preview(artifact_id, n_lines)
+
+    else:
+        response.status = 415  # Unsupported Media Type
+        return b"The preview of this artifact is not supported."
+
+    try:
+        return create_preview_response(open_preview, artifact_id, mimetype, variant)
+    except ArtifactNotFound:
+        response.status = 404
+        return b"Not Found"
+    except PreviewNotSupported:
+        response.status = 415  # Unsupported Media Type
+        return b"The preview of this artifact is not supported."
+
+
+def _get_int_query(name: str, default: int, min_value: int, max_value: int) -> Optional[int]:
+    value = request.query.get(name)
+    if value is None:
+        return default
+    try:
+        parsed = int(value)
+    except ValueError:
+        return None
+    if not min_value <= parsed <= max_value:
+        return None
+    return parsed
+
+
+def _get_file_system_base_path(artifact_store: ArtifactStore) -> str | None:
+    from optuna.artifacts import FileSystemArtifactStore
+
+    from .file_system import FileSystemBackend
+
+    store: Any = artifact_store
+    if isinstance(store, ArtifactBackendToStore):
+        store = store._backend
+    if isinstance(store, (FileSystemArtifactStore, FileSystemBackend)):
+        return str(store._base_path)
+    return None
+
+
 def upload_artifact(
     backend: ArtifactBackend,
     trial: optuna.Trial,
@@ -336,20 +521,23 @@ def get_trial_artifact_meta(
     return None
 
 
+def list_artifact_ids(storage: BaseStorage, study_id: int) -> list[str]:
+    """List the IDs of all artifacts associated with the study and its trials."""
+    from ._index import build_artifact_index
+
+    # The index is built from the latest trials instead of the cached ones so that the
+    # artifacts uploaded recently are also listed.
+    index = build_artifact_index(
+        storage.get_study_system_attrs(study_id),
+        storage.get_all_trials(study_id, deepcopy=False),
+    )
+    artifact_ids = [meta["artifact_id"] for meta in index.study_artifacts]
+    artifact_ids.extend(meta["artifact_id"] for _, meta in index.trial_artifacts)
+    return artifact_ids
+
+
 def delete_all_artifacts(backend: ArtifactStore, storage: BaseStorage, study_id: int) -> None:
-    artifact_metas = []
-    study_system_attrs = storage.get_study_system_attrs(study_id)
-    artifact_metas.extend(list_study_artifacts(study_system_attrs))
-    for trial in storage.get_all_trials(study_id):
-        trial_system_attrs = getattr(trial, "_system_attrs")
-        if trial_system_attrs is None:
-            # This is unreachable line until Optuna v5.0.0 release.
-            trial_system_attrs = storage.get_trial_system_attrs(trial._trial_id)
-        trial_artifacts = list_trial_artifacts(study_system_attrs, trial_system_attrs, trial)
-        artifact_metas.extend(trial_artifacts)
-
-    for meta in artifact_metas:
-        backend.remove(meta["artifact_id"])
+    remove_artifacts(backend, list_artifact_ids(storage, study_id))
 
 
 def list_study_artifacts(study_system_attrs: dict[str, Any]) -> list[ArtifactMeta]:
@@ -0,0 +1,190 @@
+from __future__ import annotations
+
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+import logging
+import threading
+from typing import TYPE_CHECKING
+import uuid
+
+from optuna_dashboard.artifact.exceptions import ArtifactNotFound as DashboardArtifactNotFound
+
+from ._backend_to_store import ArtifactBackendToStore
+
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+    from collections.abc import Sequence
+    from typing import Any
+    from typing import Optional
+
+    from optuna.artifacts._protocol import ArtifactStore
+
+
+_logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_WORKERS = 16
+# Up to this number of artifacts are removed within the request instead of a background job.
+MAX_SYNC_DELETION_SIZE = 100
+# The maximum number of keys that can be deleted by a single DeleteObjects request of S3.
+S3_DELETE_OBJECTS_LIMIT = 1000
+
+
+def remove_artifacts(
+    artifact_store: ArtifactStore,
+    artifact_ids: Sequence[str],
+    *,
+    max_workers: int = DEFAULT_MAX_WORKERS,
+    callback: Optional[Callable[[int, int], None]] = None,
+) -> None:
+    """Remove the artifacts concurrently.
+
+    Boto3 based stores remove up to 1000 artifacts with a single ``DeleteObjects`` request,
+    and the other stores call ``remove()`` in a thread pool. ``callback`` is called with the
+    number of removed and failed artifacts every time a batch is processed. Artifacts that
+    are already removed are counted as removed.
+    """
+
+    def report(n_removed: int, n_failed: int) -> None:
+        if callback is not None:
+            callback(n_removed, n_failed)
+
+    s3 = _get_s3_client_and_bucket(artifact_store)
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        if s3 is not None:
+            client, bucket = s3
+            batches = [
+                artifact_ids[i : i + S3_DELETE_OBJECTS_LIMIT]
+                for i in range(0, len(artifact_ids), S3_DELETE_OBJECTS_LIMIT)
+            ]
+            for batch, n_failed in zip(
+                batches, executor.map(lambda b: _delete_s3_objects(client, bucket, b), batches)
+            ):
+                report(len(batch) - n_failed, n_failed)
+        else:
+            for removed in executor.map(lambda a: _remove(artifact_store, a), artifact_ids):
+                report(int(removed), int(not removed))
+
+
+def _get_s3_client_and_bucket(artifact_store: ArtifactStore) -> Optional[tuple[Any, str]]:
+    # Both Boto3ArtifactStore of Optuna and the deprecated Boto3Backend have these attributes.
+    # Wrappers like the backoff and prefix middlewares are not unwrapped on purpose since
+    # they may change the behavior of remove().
+    store: Any = artifact_store
+    if isinstance(store, ArtifactBackendToStore):
+        store = store._backend
+    client = getattr(store, "client", None)
+    bucket = getattr(store, "bucket", None)
+    if not isinstance(bucket, str) or not callable(getattr(client, "delete_objects", None)):
+        return None
+    return client, bucket
+
+
+def _delete_s3_objects(client: Any, bucket: str, keys: Sequence[str]) -> int:
+    try:
+        res = client.delete_objects(
+            Bucket=bucket,
+            Delete={"Objects": [{"Key": key} for key in keys], "Quiet": True},
+        )
+    except Exception:
+        _logger.exception("Failed to delete %d artifacts from the bucket %s.", len(keys), bucket)
+        return len(keys)
+    # Keys that do not exist are not reported as errors by S3.
+    errors = res.get("Errors", [])
+    for error in errors:
+        _logger.error(
+            "Failed to delete the artifact %s: %s", error.get("Key"), error.get("Message")
+        )
+    return len(errors)
+
+
+def _remove(artifact_store: ArtifactStore, artifact_id: str) -> bool:
+    from optuna.artifacts.exceptions import ArtifactNotFound
+
+    try:
+        artifact_store.remove(artifact_id)
+    except (ArtifactNotFound, DashboardArtifactNotFound):
+        pass
+    except Exception:
+        _logger.exception("Failed to delete the artifact %s.", artifact_id)
+        return False
+    return True
+
+
+class ArtifactDeletionJob:
+    def __init__(self, study_id: int, artifact_ids: Sequence[str]) -> None:
+        self.job_id = str(uuid.uuid4())
+        self.study_id = study_id
+        self.artifact_ids = artifact_ids
+        self.n_removed = 0
+        self.n_failed = 0
+        self.finished = False
+        self._lock = threading.Lock()
+
+    def _report(self, n_removed: int, n_failed: int) -> None:
+        with self._lock:
+            self.n_removed += n_removed
+            self.n_failed += n_failed
+
+    def run(self, artifact_store: ArtifactStore, max_workers: int) -> None:
+        try:
+            remove_artifacts(
+                artifact_store, self.artifact_ids, max_workers=max_workers, callback=self._report
+            )
+        finally:
+            with self._lock:
+                self.finished = True
+        if self.n_failed > 0:
+            _logger.warning(
+                "Failed to delete %d artifacts of the study (study_id=%d).",
+                self.n_failed,
+                self.study_id,
+            )
+
+    def to_dict(self) -> dict[str, Any]:
+        with self._lock:
+            return {
+                "job_id": self.job_id,
+                "study_id": self.study_id,
+                "total": len(self.artifact_ids),
+                "n_removed": self.n_removed,
+                "n_failed": self.n_failed,
+                "finished": self.finished,
+            }
+
+
+class ArtifactDeletionJobManager:
+    """Runs the deletion of artifacts in background threads and keeps their progress.
+
+    Only the latest ``max_jobs`` jobs are kept so that the memory usage is bounded.
+
+    Jobs live in the memory of the process. When the dashboard is served by multiple worker
+    processes, the progress is only available from the worker that started the job. The
+    threads are daemon threads, so artifacts that are not removed yet are left in the
+    artifact store if the process exits. Such artifacts are no longer referenced by any
+    study and can be removed from the artifact store by hand.
+    """
+
+    def __init__(self, max_workers: int = DEFAULT_MAX_WORKERS, max_jobs: int = 128) -> None:
+        self._max_workers = max_workers
+        self._max_jobs = max_jobs
+        self._jobs: OrderedDict[str, ArtifactDeletionJob] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def start(
+        self, artifact_store: ArtifactStore, study_id: int, artifact_ids: Sequence[str]
+    ) -> ArtifactDeletionJob:
+        job = ArtifactDeletionJob(study_id, artifact_ids)
+        with self._lock:
+            self._jobs[job.job_id] = job
+            while len(self._jobs) > self._max_jobs:
+                self._jobs.popitem(last=False)
+        thread = threading.Thread(
+            target=job.run, args=(artifact_store, self._max_workers), daemon=True
+        )
+        thread.start()
+        return job
+
+    def get(self, job_id: str) -> Optional[ArtifactDeletionJob]:
+        with self._lock:
+            return self._jobs.get(job_id)
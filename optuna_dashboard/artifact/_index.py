@@ -0,0 +1,141 @@
+from __future__ import annotations
+
+import json
+from typing import TYPE_CHECKING
+
+from .._storage import get_trials
+from ._backend import ARTIFACTS_ATTR_PREFIX
+from ._backend import DASHBOARD_ARTIFACTS_ATTR_PREFIX
+from ._backend import get_study_artifact_meta
+from ._backend import get_trial_artifact_meta
+
+
+if TYPE_CHECKING:
+    from typing import Any
+    from typing import Optional
+
+    from optuna.storages import BaseStorage
+    from optuna.trial import FrozenTrial
+
+    from .._inmemory_cache import InMemoryCache
+    from ._backend import ArtifactMeta
+
+
+class ArtifactIndex:
+    """An index from artifact IDs to the artifact metadata of a study.
+
+    Since artifacts are never updated, a cached metadata stays valid until the artifact is
+    deleted. Artifacts uploaded after the index is built (e.g. from a running optimization)
+    are looked up from the storage once, and then added to the index.
+    """
+
+    def __init__(self) -> None:
+        self._study_artifacts: dict[str, ArtifactMeta] = {}
+        # artifact_id: (trial_id, artifact_meta)
+        self._trial_artifacts: dict[str, tuple[int, ArtifactMeta]] = {}
+
+    @property
+    def study_artifacts(self) -> list[ArtifactMeta]:
+        return list(self._study_artifacts.values())
+
+    @property
+    def trial_artifacts(self) -> list[tuple[int, ArtifactMeta]]:
+        return list(self._trial_artifacts.values())
+
+    def add_study_artifact(self, artifact_meta: ArtifactMeta) -> None:
+        self._study_artifacts[artifact_meta["artifact_id"]] = artifact_meta
+
+    def add_trial_artifact(self, trial_id: int, artifact_meta: ArtifactMeta) -> None:
+        # Artifacts in the study system attrs take precedence as in get_trial_artifact_meta().
+        self._trial_artifacts.setdefault(artifact_meta["artifact_id"], (trial_id, artifact_meta))
+
+    def get_study_artifact(self, artifact_id: str) -> Optional[ArtifactMeta]:
+        return self._study_artifacts.get(artifact_id)
+
+    def get_trial_artifact(self, trial_id: int, artifact_id: str) -> Optional[ArtifactMeta]:
+        owner = self._trial_artifacts.get(artifact_id)
+        if owner is None or owner[0] != trial_id:
+            return None
+        return owner[1]
+
+
+def build_artifact_index(
+    study_system_attrs: dict[str, Any], trials: list[FrozenTrial]
+) -> ArtifactIndex:
+    index = ArtifactIndex()
+    for key, value in study_system_attrs.items():
+        if key.startswith(ARTIFACTS_ATTR_PREFIX):
+            meta = json.loads(value)
+            if meta is not None:
+                index.add_study_artifact(meta)
+        elif key.startswith(DASHBOARD_ARTIFACTS_ATTR_PREFIX):
+            # The key looks like "dashboard:artifacts:<trial_id>:<artifact_id>".
+            trial_id, _, _ = key[len(DASHBOARD_ARTIFACTS_ATTR_PREFIX) :].partition(":")
+            meta = json.loads(value)
+            if meta is not None and trial_id.isdigit():
+                index.add_trial_artifact(int(trial_id), meta)
+
+    for trial in trials:
+        trial_system_attrs = getattr(trial, "_system_attrs")
+        if trial_system_attrs is None:
+            # This is unreachable line until Optuna v5.0.0 release.
+            continue
+        for key, value in trial_system_attrs.items():
+            if not key.startswith(ARTIFACTS_ATTR_PREFIX):
+                continue
+            meta = json.loads(value)
+            if meta is not None:
+                index.add_trial_artifact(trial._trial_id, meta)
+    return index
+
+
+def get_artifact_index(
+    in_memory_cache: InMemoryCache, storage: BaseStorage, study_id: int
+) -> ArtifactIndex:
+    with in_memory_cache._artifact_index_cache_lock:
+        index = in_memory_cache._artifact_index_cache.get(study_id)
+        generation = in_memory_cache._artifact_index_generation
+    if index is not None:
+        return index
+
+    trials = get_trials(in_memory_cache, storage, study_id)
+    index = build_artifact_index(storage.get_study_system_attrs(study_id), trials)
+    with in_memory_cache._artifact_index_cache_lock:
+        if in_memory_cache._artifact_index_generation != generation:
+            # The index was invalidated while it was built, so it may be stale.
+            return index
+        return in_memory_cache._artifact_index_cache.setdefault(study_id, index)
+
+
+def invalidate_artifact_index(in_memory_cache: InMemoryCache, study_id: int) -> None:
+    with in_memory_cache._artifact_index_cache_lock:
+        in_memory_cache._artifact_index_cache.pop(study_id, None)
+        in_memory_cache._artifact_index_generation += 1
+
+
+def lookup_study_artifact_meta(
+    in_memory_cache: InMemoryCache, storage: BaseStorage, study_id: int, artifact_id: str
+) -> Optional[ArtifactMeta]:
+    index = get_artifact_index(in_memory_cache, storage, study_id)
+    meta = index.get_study_artifact(artifact_id)
+    if meta is None:
+        meta = get_study_artifact_meta(storage, study_id, artifact_id)
+        if meta is not None:
+            index.add_study_artifact(meta)
+    return meta
+
+
+def lookup_trial_artifact_meta(
+    in_memory_cache: InMemoryCache,
+    storage: BaseStorage,
+    study_id: int,
+    trial_id: int,
+    artifact_id: str,
+) -> Optional[ArtifactMeta]:
+    index = get_artifact_index(in_memory_cache, storage, study_id)
+    meta = index.get_trial_artifact(trial_id, artifact_id)
+    if meta is None:
+        meta = get_trial_artifact_meta(storage, study_id, trial_id, artifact_id)
+        if meta is not None:
+            index.add_trial_artifact(trial_id, meta)
+    return meta
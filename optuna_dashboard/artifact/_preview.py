@@ -0,0 +1,254 @@
+from __future__ import annotations
+
+import atexit
+import contextlib
+import importlib.util
+import io
+import os
+import shutil
+import tempfile
+import threading
+from typing import TYPE_CHECKING
+
+from bottle import HTTPResponse
+from bottle import request
+
+from ._serve import etag_matches
+from ._serve import get_content_length
+from ._serve import IMMUTABLE_CACHE_CONTROL
+from .disk_cache import DiskCache
+
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+    from collections.abc import Iterator
+    from typing import BinaryIO
+    from typing import Optional
+
+    from optuna.artifacts._protocol import ArtifactStore
+
+    from ._backend import ArtifactMeta
+
+
+# Previews are cached in a temporary directory of the process unless this is set. The
+# temporary directory is removed when the process exits.
+DEFAULT_PREVIEW_CACHE_DIR = os.environ.get("OPTUNA_DASHBOARD_ARTIFACT_PREVIEW_CACHE_DIR") or None
+DEFAULT_PREVIEW_CACHE_MAX_BYTES = int(
+    os.environ.get("OPTUNA_DASHBOARD_ARTIFACT_PREVIEW_CACHE_MAX_BYTES", 256 * 1024 * 1024)
+)  # 256MB
+DEFAULT_THUMBNAIL_SIZE = 256
+MIN_THUMBNAIL_SIZE = 16
+MAX_THUMBNAIL_SIZE = 2048
+DEFAULT_PREVIEW_LINES = 20
+MAX_PREVIEW_LINES = 1000
+# Text previews are truncated at this size even if the lines are very long.
+MAX_TEXT_PREVIEW_BYTES = 64 * 1024
+# Bound the memory usage of decoding images, e.g. a decompression bomb. This is checked in
+# addition to Pillow's own limit, which is left as it is since it is global.
+MAX_IMAGE_PIXELS = 8192 * 8192
+# Images larger than this are not read at all to generate the thumbnails.
+MAX_IMAGE_BYTES = 64 * 1024 * 1024
+# Unseekable images (e.g. S3) larger than this are spooled to a temporary file.
+_SPOOL_MAX_BYTES = 8 * 1024 * 1024
+
+_TEXT_MIME_TYPES = {
+    "application/json",
+    "application/jsonl",
+    "application/x-ndjson",
+    "application/xml",
+    "application/x-yaml",
+    "application/yaml",
+}
+_TEXT_FILE_EXTENSIONS = (".csv", ".tsv", ".jsonl", ".log", ".txt", ".yaml", ".yml")
+
+
+class PreviewNotSupported(Exception):
+    pass
+
+
+def is_pillow_available() -> bool:
+    return importlib.util.find_spec("PIL") is not None
+
+
+def get_preview_kind(artifact_meta: ArtifactMeta) -> Optional[str]:
+    """Return ``"image"``, ``"text"``, or ``None`` if the artifact has no preview."""
+    if artifact_meta.get("encoding"):
+        # e.g. "foo.csv.gz" is guessed as "text/csv" with the gzip encoding.
+        return None
+    mimetype = artifact_meta["mimetype"]
+    # SVG images are already small and cannot be rasterized by Pillow.
+    if mimetype.startswith("image/") and mimetype != "image/svg+xml":
+        return "image"
+    if (
+        mimetype.startswith("text/")
+        or mimetype in _TEXT_MIME_TYPES
+        or artifact_meta["filename"].lower().endswith(_TEXT_FILE_EXTENSIONS)
+    ):
+        return "text"
+    return None
+
+
+def get_thumbnail_format(mimetype: str) -> tuple[str, str]:
+    # Photos are encoded with JPEG, and the others (e.g. plots) keep the transparency.
+    if mimetype == "image/jpeg":
+        return "JPEG", "image/jpeg"
+    return "PNG", "image/png"
+
+
+@contextlib.contextmanager
+def _open_seekable(fp: BinaryIO) -> Iterator[BinaryIO]:
+    # Pillow reads unseekable file objects into the memory at once.
+    try:
+        seekable = fp.seekable()
+    except (AttributeError, ValueError):
+        seekable = False
+    if seekable:
+        yield fp
+        return
+
+    with tempfile.SpooledTemporaryFile(max_size=_SPOOL_MAX_BYTES) as spooled:
+        n_bytes = 0
+        while True:
+            chunk = fp.read(1024 * 1024)
+            if not chunk:
+                break
+            n_bytes += len(chunk)
+            if n_bytes > MAX_IMAGE_BYTES:
+                raise PreviewNotSupported("The image is too large to generate the thumbnail.")
+            spooled.write(chunk)
+        spooled.seek(0)
+        yield spooled  # type: ignore[misc]
+
+
+def generate_thumbnail(fp: BinaryIO, size: int, image_format: str) -> bytes:
+    """Downscale the image to fit in a ``size`` x ``size`` box keeping the aspect ratio.
+
+    Images are never upscaled, and only the first frame of animated images is used. Images
+    larger than ``MAX_IMAGE_BYTES`` are rejected before they are read.
+    """
+    from PIL import Image
+
+    content_length = get_content_length(fp)
+    if content_length is not None and content_length > MAX_IMAGE_BYTES:
+        raise PreviewNotSupported(
+            f"The image is too large to generate the thumbnail ({content_length} bytes)."
+        )
+
+    try:
+        with _open_seekable(fp) as seekable_fp, Image.open(seekable_fp) as img:
+            # Only the header is read so far, so huge images are rejected before decoding.
+            width, height = img.size
+            if width * height > MAX_IMAGE_PIXELS:
+                raise PreviewNotSupported(
+                    f"The image is too large to generate the thumbnail ({width}x{height})."
+                )
+            # Decode JPEG images at a reduced scale when possible.
+            img.draft("RGB", (size, size))
+            img.thumbnail((size, size))
+            thumbnail: Image.Image = img
+            if image_format == "JPEG" and img.mode not in ("RGB", "L"):
+                thumbnail = img.convert("RGB")
+            elif image_format == "PNG" and img.mode not in ("1", "L", "LA", "P", "RGB", "RGBA"):
+                thumbnail = img.convert("RGBA")
+            buf = io.BytesIO()
+            thumbnail.save(buf, format=image_format, optimize=True)
+    except (OSError, ValueError, Image.DecompressionBombError) as e:
+        raise PreviewNotSupported(f"Failed to generate the thumbnail: {e}") from e
+    return buf.getvalue()
+
+
+def generate_text_preview(fp: BinaryIO, n_lines: int) -> bytes:
+    """Return the first ``n_lines`` lines of the text, up to ``MAX_TEXT_PREVIEW_BYTES``.
+
+    Only the head of the artifact is read from the artifact store.
+    """
+    head = b""
+    while head.count(b"\n") < n_lines and len(head) < MAX_TEXT_PREVIEW_BYTES:
+        chunk = fp.read(8192)
+        if not chunk:
+            break
+        head += chunk
+
+    end = -1
+    for _ in range(n_lines):
+        end = head.find(b"\n", end + 1)
+        if end == -1:
+            break
+    if end != -1:
+        head = head[: end + 1]
+    return head[:MAX_TEXT_PREVIEW_BYTES]
+
+
+class PreviewCache:
+    """A disk cache of the previews of artifacts.
+
+    Previews are generated on the first request, and keyed by the artifact ID, the kind of
+    the preview, and its size. The cache evicts the least recently used previews as
+    :class:`~optuna_dashboard.artifact.disk_cache.DiskCache` does. Since artifact IDs are
+    never reused, the previews of deleted artifacts are simply left to the eviction.
+    """
+
+    def __init__(
+        self,
+        artifact_store: ArtifactStore,
+        cache_dir: Optional[str] = DEFAULT_PREVIEW_CACHE_DIR,
+        max_bytes: int = DEFAULT_PREVIEW_CACHE_MAX_BYTES,
+    ) -> None:
+        self._artifact_store = artifact_store
+        self._cache_dir = cache_dir
+        self._max_bytes = max_bytes
+        self._cache: Optional[DiskCache] = None
+        self._lock = threading.Lock()
+
+    def _get_cache(self) -> DiskCache:
+        # The cache directory is created on the first request.
+        with self._lock:
+            if self._cache is None:
+                cache_dir = self._cache_dir
+                if cache_dir is None:
+                    cache_dir = tempfile.mkdtemp(prefix="optuna-dashboard-previews-")
+                    atexit.register(shutil.rmtree, cache_dir, ignore_errors=True)
+                self._cache = DiskCache(self._artifact_store, cache_dir, self._max_bytes)
+            return self._cache
+
+    def open_thumbnail(self, artifact_id: str, size: int, image_format: str) -> BinaryIO:
+        def generate() -> BinaryIO:
+            with self._artifact_store.open_reader(artifact_id) as fp:
+                return io.BytesIO(generate_thumbnail(fp, size, image_format))
+
+        key = f"{artifact_id}:thumbnail:{size}:{image_format}"
+        return self._get_cache()._open_cached(key, generate)
+
+    def open_text_preview(self, artifact_id: str, n_lines: int) -> BinaryIO:
+        def generate() -> BinaryIO:
+            with self._artifact_store.open_reader(artifact_id) as fp:
+                return io.BytesIO(generate_text_preview(fp, n_lines))
+
+        key = f"{artifact_id}:text:{n_lines}"
+        return self._get_cache()._open_cached(key, generate)
+
+
+def create_preview_response(
+    open_preview: Callable[[], BinaryIO], artifact_id: str, mimetype: str, variant: str
+) -> HTTPResponse:
+    """Create a response of the preview, which is generated only if it is not cached.
+
+    Both the browser cache and the disk cache are keyed by ``variant``, which identifies the
+    kind and the size of the preview.
+    """
+    etag = f'"{artifact_id}-{variant}"'
+    headers = {
+        "Content-Type": mimetype,
+        "ETag": etag,
+        "Cache-Control": IMMUTABLE_CACHE_CONTROL,
+        # CORS Headers
+        "Access-Control-Allow-Origin": "*",
+    }
+    if etag_matches(request.get_header("If-None-Match"), etag):
+        return HTTPResponse(status=304, headers=headers)  # Not modified
+    fp = open_preview()
+    size = get_content_length(fp)
+    if size is not None:
+        headers["Content-Length"] = str(size)
+    # Bottle wraps file objects with wsgi.file_wrapper.
+    return HTTPResponse(fp, headers=headers)
@@ -0,0 +1,239 @@
+from __future__ import annotations
+
+import os
+import re
+import stat
+from typing import TYPE_CHECKING
+from urllib.parse import quote
+
+from bottle import HTTPResponse
+from bottle import request
+
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+    from typing import BinaryIO
+    from typing import Optional
+
+    from ._backend import ArtifactMeta
+
+
+DEFAULT_BUFFER_SIZE = int(
+    os.environ.get("OPTUNA_DASHBOARD_ARTIFACT_BUFFER_SIZE", 1024 * 1024)
+)  # 1MB
+# Let the reverse proxy send the files of the file system artifact stores. Set
+# "OPTUNA_DASHBOARD_ARTIFACT_X_SENDFILE=1" for Apache's mod_xsendfile or lighttpd, and
+# "OPTUNA_DASHBOARD_ARTIFACT_X_ACCEL_REDIRECT=<location>" for nginx, where the internal
+# location serves the base directory of the artifact store.
+DEFAULT_X_SENDFILE = os.environ.get("OPTUNA_DASHBOARD_ARTIFACT_X_SENDFILE") == "1"
+DEFAULT_X_ACCEL_REDIRECT = os.environ.get("OPTUNA_DASHBOARD_ARTIFACT_X_ACCEL_REDIRECT") or None
+# Artifact IDs are UUIDs, and the content of an artifact is never updated.
+IMMUTABLE_CACHE_CONTROL = "public, max-age=31536000, immutable"
+_RANGE_PATTERN = re.compile(r"^bytes=(\d*)-(\d*)$")
+
+
+class RangeNotSatisfiable(Exception):
+    pass
+
+
+def create_not_modified_response(
+    artifact_id: str, artifact_meta: ArtifactMeta
+) -> Optional[HTTPResponse]:
+    """Return a 304 response if the client already has the artifact, otherwise :obj:`None`.
+
+    This is checked before the artifact is opened, since opening it may be a round-trip to
+    a remote artifact store.
+    """
+    if not etag_matches(request.get_header("If-None-Match"), _get_etag(artifact_id)):
+        return None
+    return HTTPResponse(status=304, headers=_get_headers(artifact_id, artifact_meta))
+
+
+def create_artifact_response(
+    fp: BinaryIO,
+    artifact_id: str,
+    artifact_meta: ArtifactMeta,
+    buffer_size: int,
+    offload_header: Optional[tuple[str, str]] = None,
+) -> HTTPResponse:
+    """Create a streaming response of the artifact that supports range requests.
+
+    The body is read from ``fp`` in chunks of ``buffer_size`` bytes, and ``fp`` is closed
+    after the response is sent. Range requests are supported only if the size of the
+    artifact is known, i.e. ``fp`` is seekable or it reports the size like botocore's
+    ``StreamingBody``. A whole regular file is passed to ``wsgi.file_wrapper`` so that WSGI
+    servers can send it with ``sendfile()``. If ``offload_header`` is given, the body is
+    left to the reverse proxy. Conditional requests should be handled with
+    :func:`create_not_modified_response` before opening ``fp``.
+    """
+    etag = _get_etag(artifact_id)
+    headers = _get_headers(artifact_id, artifact_meta)
+
+    if offload_header is not None:
+        # The reverse proxy also handles range requests.
+        fp.close()
+        name, value = offload_header
+        headers[name] = value
+        return HTTPResponse(headers=headers)
+
+    size = get_content_length(fp)
+    if size is None:
+        return HTTPResponse(iter_chunks(fp, None, buffer_size), headers=headers)
+
+    headers["Accept-Ranges"] = "bytes"
+    range_header = request.get_header("Range")
+    if_range = request.get_header("If-Range")
+    if range_header is None or (if_range is not None and if_range != etag):
+        headers["Content-Length"] = str(size)
+        if is_regular_file(fp):
+            # Bottle wraps file objects with wsgi.file_wrapper.
+            return HTTPResponse(fp, headers=headers)
+        return HTTPResponse(iter_chunks(fp, size, buffer_size), headers=headers)
+
+    try:
+        byte_range = parse_range(range_header, size)
+    except RangeNotSatisfiable:
+        fp.close()
+        headers["Content-Range"] = f"bytes */{size}"
+        return HTTPResponse(status=416, headers=headers)  # Range not satisfiable
+    if byte_range is None:
+        # Multiple ranges or malformed headers are ignored as allowed by RFC 9110.
+        headers["Content-Length"] = str(size)
+        return HTTPResponse(iter_chunks(fp, size, buffer_size), headers=headers)
+
+    start, end = byte_range
+    skip(fp, start, buffer_size)
+    headers["Content-Range"] = f"bytes {start}-{end}/{size}"
+    headers["Content-Length"] = str(end - start + 1)
+    return HTTPResponse(
+        iter_chunks(fp, end - start + 1, buffer_size), status=206, headers=headers
+    )  # Partial content
+
+
+def get_offload_header(
+    fp: BinaryIO, base_path: Optional[str], x_sendfile: bool, x_accel_redirect: Optional[str]
+) -> Optional[tuple[str, str]]:
+    """Return the header to let the reverse proxy send the file opened as ``fp``."""
+    if base_path is None or not (x_sendfile or x_accel_redirect) or not is_regular_file(fp):
+        return None
+    path = getattr(fp, "name", None)
+    if not isinstance(path, str):
+        return None
+    path = os.path.realpath(path)
+    relpath = os.path.relpath(path, os.path.realpath(base_path))
+    if relpath.startswith(os.pardir):
+        return None
+    if x_accel_redirect is not None:
+        location = x_accel_redirect.rstrip("/") + "/" + relpath.replace(os.sep, "/")
+        return "X-Accel-Redirect", quote(location)
+    return "X-Sendfile", path
+
+
+def is_regular_file(fp: BinaryIO) -> bool:
+    try:
+        return stat.S_ISREG(os.fstat(fp.fileno()).st_mode)
+    except (AttributeError, OSError, ValueError):
+        return False
+
+
+def _get_etag(artifact_id: str) -> str:
+    return f'"{artifact_id}"'
+
+
+def _get_headers(artifact_id: str, artifact_meta: ArtifactMeta) -> dict[str, str]:
+    headers = {
+        "Content-Type": artifact_meta["mimetype"],
+        "ETag": _get_etag(artifact_id),
+        "Cache-Control": IMMUTABLE_CACHE_CONTROL,
+        # CORS Headers
+        "Access-Control-Allow-Origin": "*",
+    }
+    encoding = artifact_meta.get("encoding")
+    if encoding:
+        headers["Content-Encoding"] = encoding
+    return headers
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    if if_none_match is None:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    # Weak comparison is used for If-None-Match.
+    tags = [t.strip() for t in if_none_match.split(",")]
+    return any((t[2:] if t.startswith("W/") else t) == etag for t in tags)
+
+
+def parse_range(range_header: str, size: int) -> Optional[tuple[int, int]]:
+    """Parse a single byte range and return the first and last byte positions (inclusive).
+
+    Returns :obj:`None` if the header is malformed or has multiple ranges.
+    """
+    m = _RANGE_PATTERN.match(range_header.strip())
+    if m is None:
+        return None
+    first, last = m.group(1), m.group(2)
+    if first == "":
+        if last == "":
+            return None
+        # Suffix range, e.g. "bytes=-500" is the last 500 bytes.
+        suffix_length = int(last)
+        if suffix_length == 0 or size == 0:
+            raise RangeNotSatisfiable
+        return max(size - suffix_length, 0), size - 1
+
+    start = int(first)
+    end = size - 1 if last == "" else min(int(last), size - 1)
+    if start > end:
+        if last != "" and int(last) < start:
+            return None  # Invalid range, which must be ignored.
+        raise RangeNotSatisfiable
+    return start, end
+
+
+def get_content_length(fp: BinaryIO) -> Optional[int]:
+    try:
+        if fp.seekable():
+            pos = fp.tell()
+            end = fp.seek(0, os.SEEK_END)
+            fp.seek(pos)
+            return end - pos
+    except (AttributeError, OSError, ValueError):
+        pass
+    # botocore's StreamingBody knows the size from the response header of S3.
+    content_length = getattr(fp, "_content_length", None)
+    if content_length is None:
+        return None
+    try:
+        return int(content_length)
+    except ValueError:
+        return None
+
+
+def skip(fp: BinaryIO, n: int, buffer_size: int) -> None:
+    try:
+        if fp.seekable():
+            fp.seek(n, os.SEEK_CUR)
+            return
+    except (AttributeError, OSError, ValueError):
+        pass
+    # Streaming bodies cannot seek, so the leading bytes are read and discarded.
+    while n > 0:
+        chunk = fp.read(min(buffer_size, n))
+        if not chunk:
+            return
+        n -= len(chunk)
+
+
+def iter_chunks(fp: BinaryIO, length: Optional[int], buffer_size: int) -> Iterator[bytes]:
+    try:
+        remaining = length
+        while remaining is None or remaining > 0:
+            chunk = fp.read(buffer_size if remaining is None else min(buffer_size, remaining))
+            if not chunk:
+                break
+            if remaining is not None:
+                remaining -= len(chunk)
+            yield chunk
+    finally:
+        fp.close()
@@ -0,0 +1,103 @@
+from __future__ import annotations
+
+import io
+from typing import TYPE_CHECKING
+import uuid
+
+from bottle import request
+
+from .._bottle_util import parse_data_uri
+
+
+if TYPE_CHECKING:
+    from typing import BinaryIO
+
+    from optuna.artifacts._protocol import ArtifactStore
+
+
+class UploadError(Exception):
+    def __init__(self, status: int, reason: str) -> None:
+        super().__init__(reason)
+        self.status = status
+
+
+class IncompleteUploadError(UploadError):
+    def __init__(self, reason: str) -> None:
+        super().__init__(400, reason)
+
+
+class _RequestBodyReader(io.RawIOBase):
+    """A file-like object that reads the request body directly from the WSGI input stream.
+
+    Bottle's ``request.body`` buffers the whole body in memory (or in a temporary file),
+    so the WSGI input stream is consumed here instead. At most ``content_length`` bytes
+    are read, and :class:`IncompleteUploadError` is raised if the client disconnects
+    before sending all of them.
+    """
+
+    def __init__(self, stream: BinaryIO, content_length: int) -> None:
+        self._stream = stream
+        self._remaining = content_length
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, buffer: bytearray | memoryview) -> int:  # type: ignore[override]
+        if self._remaining <= 0:
+            return 0
+        data = self._stream.read(min(len(buffer), self._remaining))
+        if not data:
+            raise IncompleteUploadError(f"{self._remaining} bytes of the body are missing.")
+        n = len(data)
+        buffer[:n] = data
+        self._remaining -= n
+        return n
+
+
+def write_uploaded_file(artifact_store: ArtifactStore, buffer_size: int) -> tuple[str, str]:
+    """Write the uploaded file to the artifact store and return the artifact ID and filename.
+
+    The file is sent as a raw ``application/octet-stream`` request body with the ``filename``
+    query parameter, and it is streamed to the artifact store in chunks of ``buffer_size``
+    bytes. JSON requests that contain the file as a data URI are still accepted for backward
+    compatibility. Other content types are rejected, since browsers send them from
+    cross-site forms without a CORS preflight.
+    """
+    artifact_id = str(uuid.uuid4())
+    if request.content_type.startswith("application/json"):
+        file = request.json.get("file")
+        if file is None:
+            raise UploadError(400, "Please specify the 'file' key.")
+        _, data = parse_data_uri(file)
+        _write_or_remove(artifact_store, artifact_id, io.BytesIO(data))
+        return artifact_id, request.json.get("filename", "")
+
+    if not request.content_type.startswith("application/octet-stream"):
+        raise UploadError(
+            415,  # Unsupported Media Type
+            "Content-Type must be either 'application/octet-stream' or 'application/json'.",
+        )
+    filename = request.query.getunicode("filename", default="")
+    _write_or_remove(artifact_store, artifact_id, open_request_body(buffer_size))
+    return artifact_id, filename
+
+
+def open_request_body(buffer_size: int) -> BinaryIO:
+    """Return a stream of the raw request body that can be passed to ``ArtifactStore.write``."""
+    content_length = request.content_length
+    if content_length < 0:
+        raise UploadError(411, "Content-Length header is required.")  # Length Required
+    reader = _RequestBodyReader(request.environ["wsgi.input"], content_length)
+    return io.BufferedReader(reader, buffer_size)  # type: ignore[return-value]
+
+
+def _write_or_remove(artifact_store: ArtifactStore, artifact_id: str, body: BinaryIO) -> None:
+    try:
+        artifact_store.write(artifact_id, body)
+    except Exception:
+        # Some artifact stores leave the partially written file.
+        try:
+            artifact_store.remove(artifact_id)
+        except Exception:
+            pass
+        raise
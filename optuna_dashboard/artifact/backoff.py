@@ -1,8 +1,11 @@
 from __future__ import annotations
 
 import logging
+import random
+import threading
 import time
 from typing import TYPE_CHECKING
+from typing import TypeVar
 
 from optuna_dashboard.artifact.exceptions import ArtifactNotFound
 
@@ -11,14 +14,177 @@ _logger = logging.getLogger(__name__)
 
 
 if TYPE_CHECKING:
+    from collections.abc import Callable
+    from typing import Any
     from typing import BinaryIO
+    from typing import Optional
+
+    from optuna.artifacts._protocol import ArtifactStore
 
     from optuna_dashboard.artifact.protocol import ArtifactBackend
 
+T = TypeVar("T")
+
+CIRCUIT_CLOSED = "closed"
+CIRCUIT_OPEN = "open"
+CIRCUIT_HALF_OPEN = "half_open"
+# Retries are given up after this many seconds by default, so that a request is not blocked
+# for minutes while the artifact store is down.
+DEFAULT_DEADLINE = 30.0
+
+
+class CircuitOpenError(Exception):
+    """Raised without calling the backend while the circuit breaker is open."""
+
+    pass
+
+
+class RetryEngine:
+    """Retries operations with exponential backoff and full jitter.
+
+    The n-th retry sleeps for a random duration between 0 and
+    ``min(min_delay * multiplier**n, max_delay)`` seconds. Retries are given up when the
+    elapsed time would exceed ``deadline`` seconds (``DEFAULT_DEADLINE`` by default). Pass
+    :obj:`None` to retry ``max_retries`` times regardless of the elapsed time.
+
+    If ``failure_threshold`` is set, the circuit breaker opens after the given number of
+    consecutive failures, and operations fail fast with :exc:`CircuitOpenError` for
+    ``recovery_timeout`` seconds. Then the next operation is tried once (half-open), and the
+    circuit is closed if it succeeds.
+    """
+
+    def __init__(
+        self,
+        max_retries: int = 10,
+        multiplier: float = 2,
+        min_delay: float = 0.1,
+        max_delay: float = 30,
+        deadline: Optional[float] = DEFAULT_DEADLINE,
+        failure_threshold: Optional[int] = None,
+        recovery_timeout: float = 30,
+        non_retryable_errors: tuple[type[BaseException], ...] = (),
+    ) -> None:
+        assert max_retries > 0
+        assert multiplier > 0
+        assert min_delay > 0
+        assert max_delay > min_delay
+        assert deadline is None or deadline > 0
+        assert failure_threshold is None or failure_threshold > 0
+        self._max_retries = max_retries
+        self._multiplier = multiplier
+        self._min_delay = min_delay
+        self._max_delay = max_delay
+        self._deadline = deadline
+        self._failure_threshold = failure_threshold
+        self._recovery_timeout = recovery_timeout
+        self._non_retryable_errors = non_retryable_errors
+
+        self._lock = threading.Lock()
+        self._circuit_state = CIRCUIT_CLOSED
+        self._circuit_opened_at = 0.0
+        self._n_consecutive_failures = 0
+        self._n_calls = 0
+        self._n_retries = 0
+        self._n_failures = 0
+        self._n_rejections = 0
+
+    def get_sleep_cap(self, n_retry: int) -> float:
+        return min(self._min_delay * self._multiplier**n_retry, self._max_delay)
+
+    @property
+    def metrics(self) -> dict[str, Any]:
+        with self._lock:
+            return {
+                "calls": self._n_calls,
+                "retries": self._n_retries,
+                "failures": self._n_failures,
+                "rejections": self._n_rejections,
+                "circuit_state": self._circuit_state,
+            }
+
+    def call(
+        self,
+        name: str,
+        artifact_id: str,
+        func: Callable[[], T],
+        before_retry: Optional[Callable[[], Any]] = None,
+        can_retry: bool = True,
+    ) -> T:
+        self._acquire_circuit(name, artifact_id)
+        started_at = time.monotonic()
+        for i in range(self._max_retries):
+            try:
+                result = func()
+            except self._non_retryable_errors:
+                # The backend is alive even if the artifact is not found.
+                self._record_success()
+                raise
+            except Exception as e:
+                circuit_opened = self._record_failure()
+                sleep_secs = random.uniform(0, self.get_sleep_cap(i))
+                if (
+                    not can_retry
+                    or circuit_opened
+                    or i == self._max_retries - 1
+                    or (
+                        self._deadline is not None
+                        and time.monotonic() - started_at + sleep_secs > self._deadline
+                    )
+                ):
+                    with self._lock:
+                        self._n_failures += 1
+                    raise
+                _logger.error(f"Failed to {name} artifact={artifact_id} n_retry={i}", exc_info=e)
+                with self._lock:
+                    self._n_retries += 1
+                time.sleep(sleep_secs)
+                if before_retry is not None:
+                    before_retry()
+            else:
+                self._record_success()
+                return result
+        assert False, "must not reach here"
+
+    def _acquire_circuit(self, name: str, artifact_id: str) -> None:
+        with self._lock:
+            self._n_calls += 1
+            if self._circuit_state != CIRCUIT_OPEN:
+                return
+            if time.monotonic() - self._circuit_opened_at >= self._recovery_timeout:
+                self._circuit_state = CIRCUIT_HALF_OPEN
+                return
+            self._n_rejections += 1
+        raise CircuitOpenError(
+            f"Failed to {name} artifact={artifact_id} since the circuit breaker is open."
+        )
+
+    def _record_success(self) -> None:
+        with self._lock:
+            self._n_consecutive_failures = 0
+            self._circuit_state = CIRCUIT_CLOSED
+
+    def _record_failure(self) -> bool:
+        # Returns whether the circuit is open.
+        with self._lock:
+            self._n_consecutive_failures += 1
+            if self._failure_threshold is None:
+                return False
+            if (
+                self._circuit_state == CIRCUIT_HALF_OPEN
+                or self._n_consecutive_failures >= self._failure_threshold
+            ):
+                if self._circuit_state != CIRCUIT_OPEN:
+                    _logger.error("The circuit breaker of the artifact backend is opened.")
+                self._circuit_state = CIRCUIT_OPEN
+                self._circuit_opened_at = time.monotonic()
+            return self._circuit_state == CIRCUIT_OPEN
+
 
 class Backoff:
     """An artifact backend middleware for exponential backoff.
 
+    See :class:`RetryEngine` for the details of the arguments.
+
     Example:
        .. code-block:: python
 
@@ -43,68 +209,122 @@ class Backoff:
         multiplier: float = 2,
         min_delay: float = 0.1,
         max_delay: float = 30,
+        deadline: Optional[float] = DEFAULT_DEADLINE,
+        failure_threshold: Optional[int] = None,
+        recovery_timeout: float = 30,
     ) -> None:
-        # Default sleep seconds:
+        # Default upper bounds of sleep seconds:
         # 0.1, 0.2, 0.4, 0.8, 1.6, 3.2, 6.4, 12.8, 25.6, 30
         self._backend = backend
-        assert max_retries > 0
-        assert multiplier > 0
-        assert min_delay > 0
-        assert max_delay > min_delay
-        self._max_retries = max_retries
-        self._multiplier = multiplier
-        self._min_delay = min_delay
-        self._max_delay = max_delay
+        self._engine = RetryEngine(
+            max_retries=max_retries,
+            multiplier=multiplier,
+            min_delay=min_delay,
+            max_delay=max_delay,
+            deadline=deadline,
+            failure_threshold=failure_threshold,
+            recovery_timeout=recovery_timeout,
+            non_retryable_errors=(ArtifactNotFound,),
+        )
+
+    @property
+    def metrics(self) -> dict[str, Any]:
+        return self._engine.metrics
 
     def _get_sleep_secs(self, n_retry: int) -> float:
-        return min(self._min_delay * self._multiplier**n_retry, self._max_delay)
+        return self._engine.get_sleep_cap(n_retry)
 
     def open(self, artifact_id: str) -> BinaryIO:
-        for i in range(self._max_retries):
-            try:
-                return self._backend.open(artifact_id)
-            except ArtifactNotFound:
-                raise
-            except Exception as e:
-                if i == self._max_retries - 1:
-                    raise
-                else:
-                    _logger.error(f"Failed to open artifact={artifact_id} n_retry={i}", exc_info=e)
-            time.sleep(self._get_sleep_secs(i))
-        assert False, "must not reach here"
+        return self._engine.call("open", artifact_id, lambda: self._backend.open(artifact_id))
 
     def write(self, artifact_id: str, content_body: BinaryIO) -> None:
-        for i in range(self._max_retries):
-            try:
-                self._backend.write(artifact_id, content_body)
-                break
-            except ArtifactNotFound:
-                raise
-            except Exception as e:
-                if i == self._max_retries - 1:
-                    raise
-                else:
-                    _logger.error(f"Failed to open artifact={artifact_id} n_retry={i}", exc_info=e)
-            content_body.seek(0)
-            time.sleep(self._get_sleep_secs(i))
+        self._engine.call(
+            "write",
+            artifact_id,
+            lambda: self._backend.write(artifact_id, content_body),
+            before_retry=lambda: content_body.seek(0),
+            can_retry=_is_seekable(content_body),
+        )
 
     def remove(self, artifact_id: str) -> None:
-        for i in range(self._max_retries):
-            try:
-                self._backend.remove(artifact_id)
-            except ArtifactNotFound:
-                raise
-            except Exception as e:
-                if i == self._max_retries - 1:
-                    raise
-                else:
-                    _logger.error(f"Failed to delete artifact={artifact_id}", exc_info=e)
-            time.sleep(self._get_sleep_secs(i))
+        self._engine.call("remove", artifact_id, lambda: self._backend.remove(artifact_id))
+
+
+class BackoffArtifactStore:
+    """An artifact store middleware for exponential backoff.
+
+    This is the same as :class:`Backoff`, but wraps Optuna's ``ArtifactStore``.
+
+    Example:
+       .. code-block:: python
+
+          from optuna.artifacts import Boto3ArtifactStore
+          from optuna_dashboard.artifact.backoff import BackoffArtifactStore
+
+          artifact_store = BackoffArtifactStore(
+              Boto3ArtifactStore("my-bucket"), deadline=10, failure_threshold=5
+          )
+    """
+
+    def __init__(
+        self,
+        store: ArtifactStore,
+        max_retries: int = 10,
+        multiplier: float = 2,
+        min_delay: float = 0.1,
+        max_delay: float = 30,
+        deadline: Optional[float] = DEFAULT_DEADLINE,
+        failure_threshold: Optional[int] = None,
+        recovery_timeout: float = 30,
+    ) -> None:
+        from optuna.artifacts.exceptions import ArtifactNotFound as OptunaArtifactNotFound
+
+        self._store = store
+        self._engine = RetryEngine(
+            max_retries=max_retries,
+            multiplier=multiplier,
+            min_delay=min_delay,
+            max_delay=max_delay,
+            deadline=deadline,
+            failure_threshold=failure_threshold,
+            recovery_timeout=recovery_timeout,
+            non_retryable_errors=(OptunaArtifactNotFound,),
+        )
+
+    @property
+    def metrics(self) -> dict[str, Any]:
+        return self._engine.metrics
+
+    def open_reader(self, artifact_id: str) -> BinaryIO:
+        return self._engine.call("open", artifact_id, lambda: self._store.open_reader(artifact_id))
+
+    def write(self, artifact_id: str, content_body: BinaryIO) -> None:
+        self._engine.call(
+            "write",
+            artifact_id,
+            lambda: self._store.write(artifact_id, content_body),
+            before_retry=lambda: content_body.seek(0),
+            can_retry=_is_seekable(content_body),
+        )
+
+    def remove(self, artifact_id: str) -> None:
+        self._engine.call("remove", artifact_id, lambda: self._store.remove(artifact_id))
+
+
+def _is_seekable(content_body: BinaryIO) -> bool:
+    # Streaming request bodies cannot be rewound, so they are not retried.
+    try:
+        return content_body.seekable()
+    except (AttributeError, ValueError):
+        return False
 
 
 if TYPE_CHECKING:
     # A mypy-runtime assertion to ensure that SCSBackend
     # implements all abstract methods in ArtifactBackendProtocol.
+    from optuna.artifacts import FileSystemArtifactStore
+
     from optuna_dashboard.artifact.file_system import FileSystemBackend
 
     _: ArtifactBackend = Backoff(FileSystemBackend("."))
+    _store: ArtifactStore = BackoffArtifactStore(FileSystemArtifactStore("."))
@@ -6,11 +6,13 @@ from typing import TYPE_CHECKING
 import warnings
 
 import boto3
+from boto3.s3.transfer import TransferConfig
 from botocore.exceptions import ClientError
 from optuna_dashboard.artifact.exceptions import ArtifactNotFound
 
 
 if TYPE_CHECKING:
+    from typing import Any
     from typing import BinaryIO
 
     from mypy_boto3_s3 import S3Client
@@ -39,17 +41,39 @@ class Boto3Backend:
               file_path = generate_example_png(...)
               upload_artifact(artifact_backend, trial, file_path)
               return ...
+
+    Objects larger than ``multipart_threshold`` bytes are uploaded in parts of
+    ``multipart_chunksize`` bytes, and up to ``max_concurrency`` parts are uploaded in
+    parallel. If ``streaming`` is :obj:`True`, the content is passed to Boto3 without being
+    copied to a buffer, so at most ``max_concurrency`` parts are kept in memory even for a
+    non-seekable stream.
     """
 
     def __init__(
-        self, bucket_name: str, client: S3Client | None = None, *, avoid_buf_copy: bool = False
+        self,
+        bucket_name: str,
+        client: S3Client | None = None,
+        *,
+        avoid_buf_copy: bool = False,
+        streaming: bool = False,
+        multipart_threshold: int = 8 * 1024 * 1024,  # 8MB
+        multipart_chunksize: int = 8 * 1024 * 1024,  # 8MB
+        max_concurrency: int = 10,
     ) -> None:
+        assert max_concurrency > 0
         self.bucket = bucket_name
         self.client = client or boto3.client("s3")
         # This flag is added to avoid that upload_fileobj() method of Boto3 client
         # may close the source file object.
         # See https://github.com/boto/boto3/issues/929
         self._avoid_buf_copy = avoid_buf_copy
+        self._streaming = streaming
+        self._transfer_config = TransferConfig(
+            multipart_threshold=multipart_threshold,
+            multipart_chunksize=multipart_chunksize,
+            max_concurrency=max_concurrency,
+            use_threads=max_concurrency > 1,
+        )
         warnings.warn(
             "Boto3Backend is deprecated. Please use Boto3ArtifactStore instead.\n"
             "See https://optuna-dashboard.readthedocs.io/en/latest/errors.html for details",
@@ -68,13 +92,15 @@ class Boto3Backend:
         return body  # type: ignore
 
     def write(self, artifact_id: str, content_body: BinaryIO) -> None:
-        fsrc: BinaryIO = content_body
-        if not self._avoid_buf_copy:
+        fsrc: Any = content_body
+        if self._streaming:
+            fsrc = _UnclosableReader(content_body)
+        elif not self._avoid_buf_copy:
             buf = io.BytesIO()
             shutil.copyfileobj(content_body, buf)
             buf.seek(0)
             fsrc = buf
-        self.client.upload_fileobj(fsrc, self.bucket, artifact_id)
+        self.client.upload_fileobj(fsrc, self.bucket, artifact_id, Config=self._transfer_config)
 
     def remove(self, artifact_id: str) -> None:
         try:
@@ -85,6 +111,19 @@ class Boto3Backend:
             raise
 
 
+class _UnclosableReader:
+    """A proxy of the file object that prevents upload_fileobj() from closing it."""
+
+    def __init__(self, fp: BinaryIO) -> None:
+        self._fp = fp
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._fp, name)
+
+    def close(self) -> None:
+        pass
+
+
 def _is_not_found_error(e: ClientError) -> bool:
     error_code = e.response.get("Error", {}).get("Code")
     http_status_code = e.response.get("ResponseMetadata", {}).get("HTTPStatusCode")
@@ -0,0 +1,182 @@
+from __future__ import annotations
+
+import hashlib
+import io
+import json
+import re
+import tempfile
+from typing import TYPE_CHECKING
+
+from ._backend_to_store import to_artifact_store
+
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+    from typing import BinaryIO
+    from typing import Optional
+
+    from optuna.artifacts._protocol import ArtifactStore
+
+    from optuna_dashboard.artifact.protocol import ArtifactBackend
+
+
+_POINTER_MAGIC = b"optuna-dashboard-dedup:"
+# Pointers are tiny JSON objects, so anything larger is a regular artifact.
+_MAX_POINTER_SIZE = 1024
+_SPOOL_MAX_SIZE = 8 * 1024 * 1024  # 8MB
+_BLOB_PREFIX = "sha256-"
+_DIGEST_PATTERN = re.compile(r"[0-9a-f]{64}")
+
+
+class Deduplicate:
+    """An artifact store middleware that stores the same content only once.
+
+    The content is hashed with SHA-256 on write and stored as a blob under its digest.
+    The artifact ID points to the blob with a tiny pointer object. Removing an artifact only
+    removes its pointer, since other processes may write pointers to the same blob at the
+    same time. Blobs that are no longer referenced are removed explicitly with
+    :meth:`remove_unreferenced_blobs`. Artifacts written before this middleware is enabled
+    are read as they are.
+
+    Example:
+       .. code-block:: python
+
+          import optuna
+          from optuna.artifacts import Boto3ArtifactStore
+          from optuna.artifacts import upload_artifact
+          from optuna_dashboard.artifact.dedup import Deduplicate
+
+          artifact_store = Deduplicate(Boto3ArtifactStore("my-bucket"))
+
+          def objective(trial: optuna.Trial) -> float:
+              ... = trial.suggest_float("x", -10, 10)
+              upload_artifact(
+                  artifact_store=artifact_store, file_path="config.yaml", study_or_trial=trial
+              )
+              return ...
+    """
+
+    def __init__(self, store: ArtifactStore | ArtifactBackend) -> None:
+        self._store = to_artifact_store(store)
+
+    def open_reader(self, artifact_id: str) -> BinaryIO:
+        fp = self._store.open_reader(artifact_id)
+        digest = _read_pointer(fp)
+        if digest is None:
+            if _rewind(fp):
+                return fp
+            # The pointer check consumed the head of a non-seekable stream.
+            fp.close()
+            return self._store.open_reader(artifact_id)
+        fp.close()
+        return self._store.open_reader(_blob_key(digest))
+
+    def write(self, artifact_id: str, content_body: BinaryIO) -> None:
+        with tempfile.SpooledTemporaryFile(max_size=_SPOOL_MAX_SIZE) as spool:
+            sha256 = hashlib.sha256()
+            while True:
+                chunk = content_body.read(io.DEFAULT_BUFFER_SIZE)
+                if not chunk:
+                    break
+                sha256.update(chunk)
+                spool.write(chunk)
+            digest = sha256.hexdigest()
+
+            # Processes writing the same content at the same time write the same blob, which
+            # is harmless.
+            if not self._exists(_blob_key(digest)):
+                spool.seek(0)
+                self._store.write(_blob_key(digest), spool)  # type: ignore[arg-type]
+        pointer = _POINTER_MAGIC + json.dumps({"digest": digest}).encode("utf-8")
+        self._store.write(artifact_id, io.BytesIO(pointer))
+
+    def remove(self, artifact_id: str) -> None:
+        self._store.remove(artifact_id)
+
+    def remove_unreferenced_blobs(
+        self, artifact_ids: Iterable[str], blob_keys: Iterable[str]
+    ) -> list[str]:
+        """Remove the blobs that are not referenced by any of the artifacts.
+
+        Artifact stores cannot list their objects, so the IDs of all artifacts, e.g. from
+        :func:`optuna.artifacts.get_all_artifact_meta`, and the keys of the blobs, i.e. the
+        keys starting with ``sha256-`` in the bucket or the directory, must be given.
+
+        .. warning::
+
+           Do not upload artifacts while this method runs. A blob whose new pointer is not in
+           ``artifact_ids`` is removed.
+
+        Args:
+            artifact_ids: The IDs of all artifacts in the store.
+            blob_keys: The keys of the blobs to check. Other keys are ignored.
+
+        Returns:
+            The keys of the removed blobs.
+        """
+        from optuna.artifacts.exceptions import ArtifactNotFound
+
+        referenced: set[str] = set()
+        for artifact_id in artifact_ids:
+            try:
+                with self._store.open_reader(artifact_id) as fp:
+                    digest = _read_pointer(fp)
+            except ArtifactNotFound:
+                continue
+            if digest is not None:
+                referenced.add(digest)
+
+        removed = []
+        for key in blob_keys:
+            digest = key[len(_BLOB_PREFIX) :]
+            if not key.startswith(_BLOB_PREFIX) or not _DIGEST_PATTERN.fullmatch(digest):
+                continue
+            if digest not in referenced:
+                self._store.remove(key)
+                removed.append(key)
+        return removed
+
+    def _exists(self, key: str) -> bool:
+        from optuna.artifacts.exceptions import ArtifactNotFound
+
+        try:
+            self._store.open_reader(key).close()
+        except ArtifactNotFound:
+            return False
+        return True
+
+
+def _blob_key(digest: str) -> str:
+    return f"{_BLOB_PREFIX}{digest}"
+
+
+def _read_pointer(fp: BinaryIO) -> Optional[str]:
+    head = fp.read(_MAX_POINTER_SIZE + 1)
+    if len(head) > _MAX_POINTER_SIZE or not head.startswith(_POINTER_MAGIC):
+        return None
+    try:
+        digest = json.loads(head[len(_POINTER_MAGIC) :])["digest"]
+    except (ValueError, KeyError, TypeError):
+        return None
+    # The digest is used to build a key, so anything else is read as a regular artifact.
+    if not isinstance(digest, str) or not _DIGEST_PATTERN.fullmatch(digest):
+        return None
+    return digest
+
+
+def _rewind(fp: BinaryIO) -> bool:
+    try:
+        if fp.seekable():
+            fp.seek(0)
+            return True
+    except (AttributeError, OSError, ValueError):
+        pass
+    return False
+
+
+if TYPE_CHECKING:
+    # A mypy-runtime assertion to ensure that Deduplicate
+    # implements all abstract methods in ArtifactStore.
+    from optuna.artifacts import FileSystemArtifactStore
+
+    _: ArtifactStore = Deduplicate(FileSystemArtifactStore("."))
@@ -0,0 +1,189 @@
+from __future__ import annotations
+
+from collections import OrderedDict
+import hashlib
+import logging
+import os
+import shutil
+import tempfile
+import threading
+import time
+from typing import TYPE_CHECKING
+
+from ._backend_to_store import to_artifact_store
+from ._serve import get_content_length
+
+
+_logger = logging.getLogger(__name__)
+
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+    from typing import BinaryIO
+
+    from optuna.artifacts._protocol import ArtifactStore
+
+    from optuna_dashboard.artifact.protocol import ArtifactBackend
+
+
+_TEMP_FILE_PREFIX = ".tmp-"
+# Temporary files older than this are regarded as left by a killed process. Newer ones may
+# be being written by another process sharing the cache directory.
+_STALE_TEMP_FILE_SECONDS = 60 * 60
+
+
+class DiskCache:
+    """An artifact store middleware that caches artifacts on the local disk.
+
+    Artifacts are cached when they are read, and the least recently used ones are evicted
+    when the total size exceeds ``max_bytes``. Files are written to a temporary file first
+    and then renamed, so a partially downloaded artifact is never served. Artifacts larger
+    than ``max_bytes`` are not cached. ``cache_dir`` must be dedicated to this cache since
+    the files in it are evicted.
+
+    The size is tracked in the memory of each process, so ``max_bytes`` is a limit per
+    process. When the dashboard is served by multiple worker processes sharing
+    ``cache_dir``, the directory can grow up to ``max_bytes`` times the number of processes.
+
+    Example:
+       .. code-block:: python
+
+          from optuna.artifacts import Boto3ArtifactStore
+          from optuna_dashboard import run_server
+          from optuna_dashboard.artifact.disk_cache import DiskCache
+
+          artifact_store = DiskCache(
+              Boto3ArtifactStore("my-bucket"),
+              cache_dir="/tmp/optuna-dashboard-cache",
+              max_bytes=1024**3,
+          )
+          run_server(storage, artifact_store=artifact_store)
+    """
+
+    def __init__(
+        self,
+        store: ArtifactStore | ArtifactBackend,
+        cache_dir: str,
+        max_bytes: int = 1024**3,  # 1GB
+    ) -> None:
+        assert max_bytes > 0
+        self._store = to_artifact_store(store)
+        self._cache_dir = cache_dir
+        self._max_bytes = max_bytes
+        # { file name: size in bytes } ordered from the least recently used one.
+        self._entries: OrderedDict[str, int] = OrderedDict()
+        self._total_bytes = 0
+        self._lock = threading.Lock()
+
+        os.makedirs(cache_dir, exist_ok=True)
+        self._load_entries()
+
+    def _load_entries(self) -> None:
+        # Reuse the files cached by the previous process.
+        files = []
+        now = time.time()
+        for entry in os.scandir(self._cache_dir):
+            if not entry.is_file():
+                continue
+            stat = entry.stat()
+            if entry.name.startswith(_TEMP_FILE_PREFIX):
+                if now - stat.st_mtime > _STALE_TEMP_FILE_SECONDS:
+                    # Left by a process that was killed while downloading.
+                    _remove_file(entry.path)
+                continue
+            files.append((stat.st_mtime, entry.name, stat.st_size))
+        for _, name, size in sorted(files):
+            self._entries[name] = size
+            self._total_bytes += size
+        self._evict()
+
+    def _path(self, name: str) -> str:
+        return os.path.join(self._cache_dir, name)
+
+    def open_reader(self, artifact_id: str) -> BinaryIO:
+        return self._open_cached(artifact_id, lambda: self._store.open_reader(artifact_id))
+
+    def _open_cached(self, key: str, open_source: Callable[[], BinaryIO]) -> BinaryIO:
+        # Open the cached file of the key, or cache the content read from open_source().
+        name = _cache_file_name(key)
+        with self._lock:
+            if name in self._entries:
+                self._entries.move_to_end(name)
+                try:
+                    return open(self._path(name), "rb")
+                except FileNotFoundError:
+                    # Removed by another process.
+                    self._total_bytes -= self._entries.pop(name)
+
+        reader = open_source()
+        size = get_content_length(reader)
+        if size is not None and size > self._max_bytes:
+            return reader
+
+        fd, tmp_path = tempfile.mkstemp(prefix=_TEMP_FILE_PREFIX, dir=self._cache_dir)
+        try:
+            with os.fdopen(fd, "wb") as f:
+                shutil.copyfileobj(reader, f)
+            size = os.path.getsize(tmp_path)
+            os.replace(tmp_path, self._path(name))
+        except BaseException:
+            _remove_file(tmp_path)
+            raise
+        finally:
+            reader.close()
+
+        # The file is opened before it is registered so that it can be read even if it is
+        # evicted immediately.
+        fp = open(self._path(name), "rb")
+        with self._lock:
+            self._total_bytes += size - self._entries.pop(name, 0)
+            self._entries[name] = size
+            self._evict()
+        return fp
+
+    def write(self, artifact_id: str, content_body: BinaryIO) -> None:
+        self._store.write(artifact_id, content_body)
+        self._discard(artifact_id)
+
+    def remove(self, artifact_id: str) -> None:
+        try:
+            self._store.remove(artifact_id)
+        finally:
+            self._discard(artifact_id)
+
+    def _discard(self, artifact_id: str) -> None:
+        name = _cache_file_name(artifact_id)
+        with self._lock:
+            size = self._entries.pop(name, None)
+            if size is None:
+                return
+            self._total_bytes -= size
+            _remove_file(self._path(name))
+
+    def _evict(self) -> None:
+        # Must be called while holding _lock.
+        while self._total_bytes > self._max_bytes and self._entries:
+            name, size = self._entries.popitem(last=False)
+            self._total_bytes -= size
+            _remove_file(self._path(name))
+
+
+def _cache_file_name(artifact_id: str) -> str:
+    # Artifact IDs may contain path separators (e.g. with the AppendPrefix middleware).
+    return hashlib.sha256(artifact_id.encode("utf-8")).hexdigest()
+
+
+def _remove_file(path: str) -> None:
+    try:
+        os.remove(path)
+    except OSError as e:
+        # The file may be opened on Windows, or already be removed.
+        _logger.debug(f"Failed to remove the cache file {path}: {e}")
+
+
+if TYPE_CHECKING:
+    # A mypy-runtime assertion to ensure that DiskCache
+    # implements all abstract methods in ArtifactStore.
+    from optuna.artifacts import FileSystemArtifactStore
+
+    _: ArtifactStore = DiskCache(FileSystemArtifactStore("."), ".")
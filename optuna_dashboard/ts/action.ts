@@ -16,11 +16,22 @@ import {
   Artifact,
   FeedbackComponentType,
   Note,
+  NoteRef,
   StudyDetail,
   StudySummary,
   Trial,
 } from "./types/optuna"
 
+// The digest of a saved note is not returned, so the note is fetched once more
+// after the study detail is reloaded.
+export const toNoteRef = (note: Note): NoteRef => ({
+  version: note.version,
+  is_empty: note.body === "",
+  digest: "",
+})
+
+const STUDY_COPY_JOB_POLLING_INTERVAL = 1000 // 1 second
+
 // eslint-disable-next-line @typescript-eslint/explicit-module-boundary-types
 export const actionCreator = () => {
   const { apiClient } = useAPIClient()
@@ -63,7 +74,7 @@ export const actionCreator = () => {
       {},
       studyDetails[studyId].trials[index]
     )
-    newTrial.note = note
+    newTrial.note = toNoteRef(note)
     setTrial(studyId, index, newTrial)
   }
 
@@ -269,11 +280,17 @@ export const actionCreator = () => {
   const deleteStudy = (studyId: number, removeAssociatedArtifacts: boolean) => {
     apiClient
       .deleteStudy(studyId, removeAssociatedArtifacts)
-      .then(() => {
+      .then((artifactDeletionJob) => {
         setStudySummaries(studySummaries.filter((s) => s.study_id !== studyId))
         enqueueSnackbar(`Success to delete a study (id=${studyId})`, {
           variant: "success",
         })
+        if (artifactDeletionJob !== null) {
+          enqueueSnackbar(
+            `Deleting ${artifactDeletionJob.total} artifacts in the background.`,
+            { variant: "info" }
+          )
+        }
       })
       .catch((err) => {
         enqueueSnackbar(`Failed to delete study (id=${studyId})`, {
@@ -286,7 +303,17 @@ export const actionCreator = () => {
   const renameStudy = (studyId: number, studyName: string) => {
     apiClient
       .renameStudy(studyId, studyName)
-      .then((study) => {
+      .then(({ study, studyCopyJob }) => {
+        if (studyCopyJob !== null) {
+          // The source study is deleted once the copy is finished.
+          setStudySummaries([...studySummaries, study])
+          enqueueSnackbar(
+            `Copying ${studyCopyJob.total} trials of the study in the background.`,
+            { variant: "info" }
+          )
+          waitStudyCopyJob(studyCopyJob.job_id)
+          return
+        }
         const newStudySummaries = [
           ...studySummaries.filter((s) => s.study_id !== studyId),
           study,
@@ -304,6 +331,33 @@ export const actionCreator = () => {
       })
   }
 
+  const waitStudyCopyJob = (jobId: string) => {
+    apiClient
+      .getStudyCopyJob(jobId)
+      .then((job) => {
+        if (!job.finished) {
+          setTimeout(
+            () => waitStudyCopyJob(jobId),
+            STUDY_COPY_JOB_POLLING_INTERVAL
+          )
+          return
+        }
+        if (job.error !== null) {
+          enqueueSnackbar(`Failed to rename study (id=${job.src_study_id})`, {
+            variant: "error",
+          })
+          updateStudySummaries()
+          return
+        }
+        updateStudySummaries(`Success to rename study (id=${job.src_study_id})`)
+      })
+      .catch((err) => {
+        // The job may be running on another worker process.
+        console.log(err)
+        updateStudySummaries()
+      })
+  }
+
   const saveReloadInterval = (interval: number) => {
     setReloadInterval(interval)
   }
@@ -313,7 +367,7 @@ export const actionCreator = () => {
       .saveStudyNote(studyId, note)
       .then(() => {
         const newStudy = Object.assign({}, studyDetails[studyId])
-        newStudy.note = note
+        newStudy.note = toNoteRef(note)
         setStudyDetailState(studyId, newStudy)
         enqueueSnackbar(`Success to save the note`, {
           variant: "success",
@@ -322,7 +376,7 @@ export const actionCreator = () => {
       .catch((err) => {
         if (err.response.status === 409) {
           const newStudy = Object.assign({}, studyDetails[studyId])
-          newStudy.note = err.response.data.note
+          newStudy.note = toNoteRef(err.response.data.note)
           setStudyDetailState(studyId, newStudy)
         }
         const reason = err.response?.data.reason
@@ -388,64 +442,39 @@ export const actionCreator = () => {
     trialId: number,
     file: File
   ): void => {
-    const reader = new FileReader()
     setUploading(true)
-    reader.readAsDataURL(file)
-    reader.onload = (upload: ProgressEvent<FileReader>) => {
-      apiClient
-        .uploadTrialArtifact(
-          studyId,
-          trialId,
-          file.name,
-          upload.target?.result as string
+    apiClient
+      .uploadTrialArtifact(studyId, trialId, file)
+      .then((res) => {
+        setUploading(false)
+        const index = studyDetails[studyId].trials.findIndex(
+          (t) => t.trial_id === trialId
         )
-        .then((res) => {
-          setUploading(false)
-          const index = studyDetails[studyId].trials.findIndex(
-            (t) => t.trial_id === trialId
-          )
-          if (index === -1) {
-            return
-          }
-          setTrialArtifacts(studyId, index, res.artifacts)
-        })
-        .catch((err) => {
-          setUploading(false)
-          const reason = err.response?.data.reason
-          enqueueSnackbar(`Failed to upload ${reason}`, { variant: "error" })
-        })
-    }
-    reader.onerror = (error) => {
-      enqueueSnackbar(`Failed to read the file ${error}`, { variant: "error" })
-      console.log(error)
-    }
+        if (index === -1) {
+          return
+        }
+        setTrialArtifacts(studyId, index, res.artifacts)
+      })
+      .catch((err) => {
+        setUploading(false)
+        const reason = err.response?.data.reason
+        enqueueSnackbar(`Failed to upload ${reason}`, { variant: "error" })
+      })
   }
 
   const uploadStudyArtifact = (studyId: number, file: File): void => {
-    const reader = new FileReader()
     setUploading(true)
-    reader.readAsDataURL(file)
-    reader.onload = (upload: ProgressEvent<FileReader>) => {
-      apiClient
-        .uploadStudyArtifact(
-          studyId,
-          file.name,
-          upload.target?.result as string
-        )
-        .then((res) => {
-          setUploading(false)
-          setStudyArtifacts(studyId, res.artifacts)
-        })
-        .catch((err) => {
-          setUploading(false)
-          const reason = err.response?.data.reason
-          enqueueSnackbar(`Failed to upload ${reason}`, { variant: "error" })
-        })
-    }
-    reader.onerror = (error) => {
-      enqueueSnackbar(`Failed to read the file ${error}`, { variant: "error" })
-      console.log(error)
-    }
+    apiClient
+      .uploadStudyArtifact(studyId, file)
+      .then((res) => {
+        setUploading(false)
+        setStudyArtifacts(studyId, res.artifacts)
+      })
+      .catch((err) => {
+        setUploading(false)
+        const reason = err.response?.data.reason
+        enqueueSnackbar(`Failed to upload ${reason}`, { variant: "error" })
+      })
   }
 
   const deleteTrialArtifact = (
@@ -5,6 +5,7 @@ import {
   FeedbackComponentType,
   FormWidgets,
   Note,
+  NoteRef,
   PlotlyGraphObject,
   PreferenceFeedbackMode,
   PreferenceHistory,
@@ -38,7 +39,7 @@ export interface TrialResponse {
     param_external_value: string
   }[]
   user_attrs: Optuna.Attribute[]
-  note: Note
+  note: NoteRef
   artifacts: Artifact[]
   constraints: number[]
 }
@@ -66,7 +67,7 @@ export interface StudyDetailResponse {
   union_search_space: Optuna.SearchSpaceItem[]
   union_user_attrs: Optuna.AttributeSpec[]
   has_intermediate_values: boolean
-  note: Note
+  note: NoteRef
   is_preferential: boolean
   // TODO(c-bata): Rename this to metric_names after releasing the new Jupyter Lab extension.
   objective_names?: string[]
@@ -108,6 +109,86 @@ export type RenameStudyResponse = {
   user_attrs: Optuna.Attribute[]
   is_prefential: boolean // TODO(porink0424): Fix typo
   datetime_start?: string
+  study_copy_job?: StudyCopyJob
+}
+
+export type StudyCopyJob = {
+  job_id: string
+  src_study_id: number
+  study_id: number
+  total: number
+  n_copied: number
+  finished: boolean
+  error: string | null
+}
+
+export type RenamedStudy = {
+  study: StudySummary
+  // Large studies are copied in the background, and the source study is
+  // deleted once the copy is finished.
+  studyCopyJob: StudyCopyJob | null
+}
+
+export type ArtifactDeletionJob = {
+  job_id: string
+  study_id: number
+  total: number
+  n_removed: number
+  n_failed: number
+  finished: boolean
+}
+
+export type DeleteStudyResponse = {
+  artifact_deletion_job?: ArtifactDeletionJob
+}
+
+export type TrialUpdate = {
+  trial_id: number
+  user_attrs?: { [key: string]: number | string }
+  state?: Optuna.TrialStateFinished
+  values?: number[]
+}
+
+export type TrialUpdateResult = {
+  trial_id: number | null
+  error: string | null
+}
+
+export type BatchUpdateTrialsResponse = {
+  results: TrialUpdateResult[]
+}
+
+export type TrialFilter =
+  | { type: "param"; name: string; min?: number; max?: number }
+  | { type: "param"; name: string; in: (string | number)[] }
+  | { type: "value"; objective: number; min?: number; max?: number }
+  | {
+      type: "user_attr"
+      key: string
+      op: "eq" | "ne" | "lt" | "le" | "gt" | "ge" | "in" | "exists"
+      value?: unknown
+    }
+
+export type ListTrialsQuery = {
+  states?: Optuna.TrialState[]
+  filters?: TrialFilter[]
+  // e.g. "number", "value:0", "param:x", "user_attr:key", or "duration"
+  sortBy?: string
+  order?: "asc" | "desc"
+  limit?: number
+  cursor?: string
+}
+
+export type ListTrialsResponse = {
+  trials: TrialResponse[]
+  next_cursor: string | null
+  n_trials: number
+}
+
+export type TrialPage = {
+  trials: Trial[]
+  nextCursor: string | null
+  nTrials: number
 }
 
 export type UploadArtifactAPIResponse = {
@@ -224,6 +305,27 @@ export abstract class APIClient {
       constraints: response.constraints,
     }
   }
+  convertListTrialsQuery(query: ListTrialsQuery): URLSearchParams {
+    const params = new URLSearchParams()
+    if (query.states !== undefined && query.states.length > 0) {
+      params.set("states", query.states.join(","))
+    }
+    if (query.filters !== undefined && query.filters.length > 0) {
+      params.set("filters", JSON.stringify(query.filters))
+    }
+    if (query.sortBy !== undefined) params.set("sort_by", query.sortBy)
+    if (query.order !== undefined) params.set("order", query.order)
+    if (query.limit !== undefined) params.set("limit", query.limit.toString())
+    if (query.cursor !== undefined) params.set("cursor", query.cursor)
+    return params
+  }
+  convertTrialPage(response: ListTrialsResponse): TrialPage {
+    return {
+      trials: response.trials.map((trial) => this.convertTrialResponse(trial)),
+      nextCursor: response.next_cursor,
+      nTrials: response.n_trials,
+    }
+  }
   convertPreferenceHistory(
     response: PreferenceHistoryResponse
   ): PreferenceHistory {
@@ -251,11 +353,20 @@ export abstract class APIClient {
   abstract deleteStudy(
     studyId: number,
     removeAssociatedArtifacts: boolean
-  ): Promise<void>
+  ): Promise<ArtifactDeletionJob | null>
+  abstract getArtifactDeletionJob(jobId: string): Promise<ArtifactDeletionJob>
   abstract renameStudy(
     studyId: number,
     studyName: string
-  ): Promise<StudySummary>
+  ): Promise<RenamedStudy>
+  abstract getStudyCopyJob(jobId: string): Promise<StudyCopyJob>
+  // The version of a note for the HTTP caches, which includes its digest.
+  abstract getStudyNote(studyId: number, cacheVersion: string): Promise<Note>
+  abstract getTrialNote(
+    studyId: number,
+    trialId: number,
+    cacheVersion: string
+  ): Promise<Note>
   abstract saveStudyNote(studyId: number, note: Note): Promise<void>
   abstract saveTrialNote(
     studyId: number,
@@ -265,13 +376,11 @@ export abstract class APIClient {
   abstract uploadTrialArtifact(
     studyId: number,
     trialId: number,
-    fileName: string,
-    dataUrl: string
+    file: File
   ): Promise<UploadArtifactAPIResponse>
   abstract uploadStudyArtifact(
     studyId: number,
-    fileName: string,
-    dataUrl: string
+    file: File
   ): Promise<UploadArtifactAPIResponse>
   abstract deleteTrialArtifact(
     studyId: number,
@@ -282,6 +391,10 @@ export abstract class APIClient {
     studyId: number,
     artifactId: string
   ): Promise<void>
+  abstract listTrials(
+    studyId: number,
+    query: ListTrialsQuery
+  ): Promise<TrialPage>
   abstract tellTrial(
     trialId: number,
     state: Optuna.TrialStateFinished,
@@ -291,6 +404,9 @@ export abstract class APIClient {
     trialId: number,
     user_attrs: { [key: string]: number | string }
   ): Promise<void>
+  abstract batchUpdateTrials(
+    updates: TrialUpdate[]
+  ): Promise<TrialUpdateResult[]>
   abstract getParamImportances(
     studyId: number
   ): Promise<Optuna.ParamImportance[][]>
@@ -316,6 +432,11 @@ export abstract class APIClient {
     component_type: FeedbackComponentType
   ): Promise<void>
   abstract getPlot(studyId: number, plotType: PlotType): Promise<PlotResponse>
+  abstract getPlotlyGraphObject(
+    studyId: number,
+    graphObjectId: string,
+    version: string
+  ): Promise<PlotResponse>
   abstract getCompareStudiesPlot(
     studyIds: number[],
     plotType: CompareStudiesPlotType
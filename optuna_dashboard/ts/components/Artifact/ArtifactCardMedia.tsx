@@ -3,11 +3,15 @@ import { Box, CardMedia } from "@mui/material"
 import { FC } from "react"
 import { Artifact } from "ts/types/optuna"
 
+// Thumbnails are a bit larger than the cards for high-DPI displays.
+export const THUMBNAIL_SIZE = 320
+
 export const ArtifactCardMedia: FC<{
   artifact: Artifact
   urlPath: string
   height: string
-}> = ({ artifact, urlPath, height }) => {
+  thumbnailSize?: number
+}> = ({ artifact, urlPath, height, thumbnailSize }) => {
   if (artifact.mimetype.startsWith("video")) {
     return (
       <Box
@@ -53,6 +57,11 @@ export const ArtifactCardMedia: FC<{
       </Box>
     )
   } else if (artifact.mimetype.startsWith("image")) {
+    // Downscaled thumbnails are generated and cached by the server.
+    const imageUrlPath =
+      thumbnailSize === undefined || artifact.mimetype === "image/svg+xml"
+        ? urlPath
+        : `${urlPath}/preview?size=${thumbnailSize}`
     return (
       <Box
         component="div"
@@ -66,7 +75,7 @@ export const ArtifactCardMedia: FC<{
       >
         <CardMedia
           component="img"
-          image={urlPath}
+          image={imageUrlPath}
           alt={artifact.filename}
           style={{
             width: "100%",
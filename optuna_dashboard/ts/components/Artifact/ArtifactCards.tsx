@@ -22,7 +22,7 @@ import {
 import { actionCreator } from "../../action"
 import { useArtifactBaseUrlPath } from "../../hooks/useAPIMeta"
 import { StudyDetail, Trial } from "../../types/optuna"
-import { ArtifactCardMedia } from "./ArtifactCardMedia"
+import { ArtifactCardMedia, THUMBNAIL_SIZE } from "./ArtifactCardMedia"
 import { useDeleteArtifactDialog } from "./DeleteArtifactDialog"
 import { isTableArtifact, useTableArtifactModal } from "./TableArtifactViewer"
 
@@ -109,6 +109,7 @@ export const ArtifactCards: FC<{
                 artifact={artifact}
                 urlPath={urlPath}
                 height={height}
+                thumbnailSize={THUMBNAIL_SIZE}
               />
               <CardContent
                 sx={{
@@ -19,7 +19,7 @@ import { FC, useMemo, useState } from "react"
 
 import { StudyDirection } from "@optuna/types"
 import { StudyDetail, Trial } from "ts/types/optuna"
-import { ArtifactCardMedia } from "./ArtifactCardMedia"
+import { ArtifactCardMedia, THUMBNAIL_SIZE } from "./ArtifactCardMedia"
 import { useDeleteArtifactDialog } from "./DeleteArtifactDialog"
 import { isTableArtifact, useTableArtifactModal } from "./TableArtifactViewer"
 
@@ -139,6 +139,7 @@ export const SelectedTrialArtifactCards: FC<{
                 artifact={artifact}
                 urlPath={urlPath}
                 height={height}
+                thumbnailSize={THUMBNAIL_SIZE}
               />
               <CardContent
                 sx={{
@@ -46,10 +46,12 @@ import { darcula } from "react-syntax-highlighter/dist/esm/styles/prism"
 import rehypeRaw from "rehype-raw"
 import remarkGfm from "remark-gfm"
 
+import { useQueryClient } from "@tanstack/react-query"
 import { useAtomValue } from "jotai"
-import { Note } from "ts/types/optuna"
-import { actionCreator } from "../action"
+import { Note, NoteRef } from "ts/types/optuna"
+import { actionCreator, toNoteRef } from "../action"
 import { useAllowUnsafe, useArtifactIsAvailable } from "../hooks/useAPIMeta"
+import { noteQueryKey, useNote } from "../hooks/useNote"
 import { isFileUploading, useArtifacts } from "../state"
 
 const placeholder = `## What is this feature for?
@@ -96,7 +98,7 @@ const CodeBlock: CodeComponent | ReactMarkdownNames = ({
 export const TrialNote: FC<{
   studyId: number
   trialId: number
-  latestNote: Note
+  latestNote: NoteRef
   cardSx?: SxProps<Theme>
 }> = ({ studyId, trialId, latestNote, cardSx }) => {
   return (
@@ -111,7 +113,7 @@ export const TrialNote: FC<{
 
 export const StudyNote: FC<{
   studyId: number
-  latestNote: Note
+  latestNote: NoteRef
   cardSx?: SxProps<Theme>
 }> = ({ studyId, latestNote, cardSx }) => {
   return <NoteBase studyId={studyId} latestNote={latestNote} cardSx={cardSx} />
@@ -188,6 +190,7 @@ const MarkdownEditorModal: FC<{
 }> = ({ studyId, trialId, latestNote, setEditorUnmount }) => {
   const theme = useTheme()
   const action = actionCreator()
+  const queryClient = useQueryClient()
   const [openConfirmCloseDialog, renderConfirmCloseDialog] =
     useConfirmCloseDialog(() => {
       setEditorUnmount()
@@ -231,6 +234,11 @@ const MarkdownEditorModal: FC<{
     }
     actionResponse
       .then(() => {
+        // Avoid fetching the note body that we've just saved.
+        queryClient.setQueryData(
+          noteQueryKey(studyId, trialId, toNoteRef(newNote)),
+          newNote
+        )
         setCurNote(newNote)
         window.onbeforeunload = null
         setEditorUnmount()
@@ -593,11 +601,15 @@ const ArtifactUploader: FC<{
 const NoteBase: FC<{
   studyId: number
   trialId?: number
-  latestNote: Note
+  latestNote: NoteRef
   cardSx?: SxProps<Theme>
 }> = ({ studyId, trialId, latestNote, cardSx }) => {
   const theme = useTheme()
   const [editorMounted, setEditorMounted] = useState<boolean>(false)
+  const note = useNote(studyId, trialId, latestNote)
+  // The previous version is shown while fetching the latest one, but it must
+  // not be edited since saving it would overwrite the latest note.
+  const editable = note !== undefined && note.version === latestNote.version
 
   const defaultBody = ""
   return (
@@ -609,7 +621,7 @@ const NoteBase: FC<{
           minHeight: theme.spacing(7),
         }}
       >
-        <MarkdownRenderer body={latestNote.body || defaultBody} />
+        <MarkdownRenderer body={note?.body || defaultBody} />
         <IconButton
           sx={{
             position: "absolute",
@@ -617,6 +629,7 @@ const NoteBase: FC<{
             right: 0,
             margin: theme.spacing(1),
           }}
+          disabled={!editable}
           onClick={() => {
             setEditorMounted(true)
           }}
@@ -624,11 +637,11 @@ const NoteBase: FC<{
           <EditIcon />
         </IconButton>
       </CardContent>
-      {editorMounted && (
+      {editorMounted && note !== undefined && editable && (
         <MarkdownEditorModal
           studyId={studyId}
           trialId={trialId}
-          latestNote={latestNote}
+          latestNote={note}
           setEditorUnmount={() => {
             setEditorMounted(false)
           }}
@@ -1,5 +1,6 @@
 import { FC, useMemo } from "react"
 import { Artifact, FeedbackComponentType, Trial } from "ts/types/optuna"
+import { useNote } from "../../hooks/useNote"
 import { ArtifactCardMedia } from "../Artifact/ArtifactCardMedia"
 import { MarkdownRenderer } from "../Note"
 
@@ -9,9 +10,10 @@ export const PreferentialOutputComponent: FC<{
   componentType: FeedbackComponentType
   urlPath: string
 }> = ({ trial, artifact, componentType, urlPath }) => {
+  const noteBody = useNote(trial.study_id, trial.trial_id, trial.note)?.body
   const note = useMemo(() => {
-    return <MarkdownRenderer body={trial.note.body} />
-  }, [trial.note.body])
+    return <MarkdownRenderer body={noteBody ?? ""} />
+  }, [noteBody])
   if (componentType === undefined || componentType.output_type === "note") {
     return note
   }
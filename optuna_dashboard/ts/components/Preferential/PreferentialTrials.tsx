@@ -161,7 +161,7 @@ const isComparisonReady = (
   componentType: FeedbackComponentType
 ): boolean => {
   if (componentType === undefined || componentType.output_type === "note") {
-    return trial.note.body !== ""
+    return !trial.note.is_empty
   }
   if (componentType.output_type === "artifact") {
     const artifactId = trial?.user_attrs.find(
@@ -139,7 +139,7 @@ export const StudyHistory: FC<{ studyId: number }> = ({ studyId }) => {
             <Grid xs={6} key={go.id}>
               <Card>
                 <CardContent>
-                  <UserDefinedPlot graphObject={go} />
+                  <UserDefinedPlot studyId={studyId} graphObject={go} />
                 </CardContent>
               </Card>
             </Grid>
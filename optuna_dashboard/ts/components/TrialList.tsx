@@ -333,6 +333,7 @@ export const TrialListDetail: FC<{
         Note
       </Typography>
       <TrialNote
+        key={trial.trial_id}
         studyId={trial.study_id}
         trialId={trial.trial_id}
         latestNote={trial.note}
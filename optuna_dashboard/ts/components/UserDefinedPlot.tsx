@@ -2,21 +2,31 @@ import { Box } from "@mui/material"
 import * as plotly from "plotly.js-dist-min"
 import { FC, useEffect } from "react"
 import { PlotlyGraphObject } from "ts/types/optuna"
+import { usePlotlyGraphObject } from "../hooks/usePlotlyGraphObject"
 
 export const UserDefinedPlot: FC<{
+  studyId: number
   graphObject: PlotlyGraphObject
-}> = ({ graphObject }) => {
+}> = ({ studyId, graphObject }) => {
   const plotDomId = `user-defined-plot:${graphObject.id}`
+  const { data, layout, error } = usePlotlyGraphObject(studyId, graphObject)
 
   useEffect(() => {
+    if (data === undefined) {
+      return
+    }
     try {
-      const parsed = JSON.parse(graphObject.graph_object)
-      plotly.react(plotDomId, parsed.data, parsed.layout)
+      plotly.react(plotDomId, data, layout)
     } catch (e) {
       // Avoid to crash the whole page when given invalid grpah objects.
       console.error(e)
     }
-  }, [graphObject])
+  }, [data, layout])
+  useEffect(() => {
+    if (error) {
+      console.error(error)
+    }
+  }, [error])
 
   return <Box component="div" id={plotDomId} sx={{ height: "450px" }} />
 }
@@ -2,31 +2,44 @@ import * as Optuna from "@optuna/types"
 import {
   APIClient,
   APIMeta,
+  ArtifactDeletionJob,
+  BatchUpdateTrialsResponse,
   CompareStudiesPlotType,
   CreateNewStudyResponse,
+  DeleteStudyResponse,
   FetchAPIClientError,
   GeneratePlotlyGraphQueryRequest,
   GeneratePlotlyGraphQueryResponse,
+  ListTrialsQuery,
+  ListTrialsResponse,
   ParamImportancesResponse,
   PlotResponse,
   PlotType,
   ReGeneratePlotlyGraphQueryRequest,
   ReGeneratePlotlyGraphQueryResponse,
   RenameStudyResponse,
+  RenamedStudy,
+  StudyCopyJob,
   StudyDetailResponse,
   StudySummariesResponse,
   TrialFilterQueryRequest,
   TrialFilterQueryResponse,
+  TrialPage,
+  TrialUpdate,
+  TrialUpdateResult,
   UploadArtifactAPIResponse,
 } from "./apiClient"
 import {
   FeedbackComponentType,
+  Note,
   StudyDetail,
   StudySummary,
   Trial,
 } from "./types/optuna"
 
 const JSON_HEADERS = { "Content-Type": "application/json" }
+// The file is sent as a raw request body so that the server can stream it.
+const ARTIFACT_UPLOAD_HEADERS = { "Content-Type": "application/octet-stream" }
 
 const trimTrailingSlashes = (value: string): string => {
   let end = value.length
@@ -147,7 +160,7 @@ export class FetchAPIClient extends APIClient {
   deleteStudy = async (
     studyId: number,
     removeAssociatedArtifacts: boolean
-  ): Promise<void> => {
+  ): Promise<ArtifactDeletionJob | null> => {
     const res = await fetch(`${this.baseURL}/api/studies/${studyId}`, {
       method: "DELETE",
       headers: JSON_HEADERS,
@@ -155,13 +168,27 @@ export class FetchAPIClient extends APIClient {
         remove_associated_artifacts: removeAssociatedArtifacts,
       }),
     })
-    await this.handleResponse<void>(res)
+    if (res.status === 204) {
+      // The study and its artifacts are already removed.
+      return null
+    }
+    const data = await this.handleResponse<DeleteStudyResponse>(res)
+    return data.artifact_deletion_job ?? null
+  }
+
+  getArtifactDeletionJob = async (
+    jobId: string
+  ): Promise<ArtifactDeletionJob> => {
+    const res = await fetch(
+      `${this.baseURL}/api/artifact_deletion_jobs/${jobId}`
+    )
+    return this.handleResponse<ArtifactDeletionJob>(res)
   }
 
   renameStudy = async (
     studyId: number,
     studyName: string
-  ): Promise<StudySummary> => {
+  ): Promise<RenamedStudy> => {
     const res = await fetch(`${this.baseURL}/api/studies/${studyId}/rename`, {
       method: "POST",
       headers: JSON_HEADERS,
@@ -169,17 +196,46 @@ export class FetchAPIClient extends APIClient {
     })
     const data = await this.handleResponse<RenameStudyResponse>(res)
     return {
-      study_id: data.study_id,
-      study_name: data.study_name,
-      directions: data.directions,
-      user_attrs: data.user_attrs,
-      is_preferential: data.is_prefential,
-      datetime_start: data.datetime_start
-        ? new Date(data.datetime_start)
-        : undefined,
+      study: {
+        study_id: data.study_id,
+        study_name: data.study_name,
+        directions: data.directions,
+        user_attrs: data.user_attrs,
+        is_preferential: data.is_prefential,
+        datetime_start: data.datetime_start
+          ? new Date(data.datetime_start)
+          : undefined,
+      },
+      studyCopyJob: data.study_copy_job ?? null,
     }
   }
 
+  getStudyCopyJob = async (jobId: string): Promise<StudyCopyJob> => {
+    const res = await fetch(`${this.baseURL}/api/study_copy_jobs/${jobId}`)
+    return this.handleResponse<StudyCopyJob>(res)
+  }
+
+  getStudyNote = async (
+    studyId: number,
+    cacheVersion: string
+  ): Promise<Note> => {
+    const res = await fetch(
+      `${this.baseURL}/api/studies/${studyId}/note?version=${cacheVersion}`
+    )
+    return this.handleResponse<Note>(res)
+  }
+
+  getTrialNote = async (
+    studyId: number,
+    trialId: number,
+    cacheVersion: string
+  ): Promise<Note> => {
+    const res = await fetch(
+      `${this.baseURL}/api/studies/${studyId}/notes/${trialId}?version=${cacheVersion}`
+    )
+    return this.handleResponse<Note>(res)
+  }
+
   saveStudyNote = async (
     studyId: number,
     note: { version: number; body: string }
@@ -211,15 +267,15 @@ export class FetchAPIClient extends APIClient {
   uploadTrialArtifact = async (
     studyId: number,
     trialId: number,
-    fileName: string,
-    dataUrl: string
+    file: File
   ): Promise<UploadArtifactAPIResponse> => {
+    const filename = encodeURIComponent(file.name)
     const res = await fetch(
-      `${this.baseURL}/api/artifacts/${studyId}/${trialId}`,
+      `${this.baseURL}/api/artifacts/${studyId}/${trialId}?filename=${filename}`,
       {
         method: "POST",
-        headers: JSON_HEADERS,
-        body: JSON.stringify({ file: dataUrl, filename: fileName }),
+        headers: ARTIFACT_UPLOAD_HEADERS,
+        body: file,
       }
     )
     return this.handleResponse<UploadArtifactAPIResponse>(res)
@@ -227,14 +283,17 @@ export class FetchAPIClient extends APIClient {
 
   uploadStudyArtifact = async (
     studyId: number,
-    fileName: string,
-    dataUrl: string
+    file: File
   ): Promise<UploadArtifactAPIResponse> => {
-    const res = await fetch(`${this.baseURL}/api/artifacts/${studyId}`, {
-      method: "POST",
-      headers: JSON_HEADERS,
-      body: JSON.stringify({ file: dataUrl, filename: fileName }),
-    })
+    const filename = encodeURIComponent(file.name)
+    const res = await fetch(
+      `${this.baseURL}/api/artifacts/${studyId}?filename=${filename}`,
+      {
+        method: "POST",
+        headers: ARTIFACT_UPLOAD_HEADERS,
+        body: file,
+      }
+    )
     return this.handleResponse<UploadArtifactAPIResponse>(res)
   }
 
@@ -261,6 +320,18 @@ export class FetchAPIClient extends APIClient {
     await this.handleResponse<void>(res)
   }
 
+  listTrials = async (
+    studyId: number,
+    query: ListTrialsQuery
+  ): Promise<TrialPage> => {
+    const params = this.convertListTrialsQuery(query)
+    const res = await fetch(
+      `${this.baseURL}/api/studies/${studyId}/trials?${params}`
+    )
+    const data = await this.handleResponse<ListTrialsResponse>(res)
+    return this.convertTrialPage(data)
+  }
+
   tellTrial = async (
     trialId: number,
     state: Optuna.TrialStateFinished,
@@ -289,6 +360,18 @@ export class FetchAPIClient extends APIClient {
     await this.handleResponse<void>(res)
   }
 
+  batchUpdateTrials = async (
+    updates: TrialUpdate[]
+  ): Promise<TrialUpdateResult[]> => {
+    const res = await fetch(`${this.baseURL}/api/trials/batch`, {
+      method: "POST",
+      headers: JSON_HEADERS,
+      body: JSON.stringify({ updates }),
+    })
+    const data = await this.handleResponse<BatchUpdateTrialsResponse>(res)
+    return data.results
+  }
+
   getParamImportances = async (
     studyId: number
   ): Promise<Optuna.ParamImportance[][]> => {
@@ -377,6 +460,19 @@ export class FetchAPIClient extends APIClient {
     return this.handleResponse<PlotResponse>(res)
   }
 
+  getPlotlyGraphObject = async (
+    studyId: number,
+    graphObjectId: string,
+    version: string
+  ): Promise<PlotResponse> => {
+    const res = await fetch(
+      `${this.baseURL}/api/studies/${studyId}/plotly/${encodeURIComponent(
+        graphObjectId
+      )}?version=${version}`
+    )
+    return this.handleResponse<PlotResponse>(res)
+  }
+
   getCompareStudiesPlot = async (
     studyIds: number[],
     plotType: CompareStudiesPlotType
@@ -0,0 +1,46 @@
+import { useQuery } from "@tanstack/react-query"
+import { FetchAPIClientError } from "../apiClient"
+import { useAPIClient } from "../apiClientProvider"
+import { Note, NoteRef } from "../types/optuna"
+
+export const noteQueryKey = (
+  studyId: number,
+  trialId: number | undefined,
+  noteRef: NoteRef
+) => ["note", studyId, trialId ?? null, noteRef.version, noteRef.digest]
+
+// The study detail API only returns the version and the digest of each note,
+// so the body is fetched separately. The body never changes for the same
+// version and digest.
+export const useNote = (
+  studyId: number,
+  trialId: number | undefined,
+  noteRef: NoteRef
+): Note | undefined => {
+  const { apiClient } = useAPIClient()
+  const { data } = useQuery<Note, FetchAPIClientError>({
+    enabled: !noteRef.is_empty,
+    queryKey: noteQueryKey(studyId, trialId, noteRef),
+    queryFn: () => {
+      const cacheVersion = `${noteRef.version}-${noteRef.digest}`
+      if (trialId === undefined) {
+        return apiClient.getStudyNote(studyId, cacheVersion)
+      }
+      return apiClient.getTrialNote(studyId, trialId, cacheVersion)
+    },
+    // Keep showing the previous version of the same note while fetching the
+    // latest one. Notes of other trials are never shown as placeholders.
+    placeholderData: (previousData, previousQuery) =>
+      previousQuery?.queryKey[1] === studyId &&
+      previousQuery?.queryKey[2] === (trialId ?? null)
+        ? previousData
+        : undefined,
+    staleTime: Infinity,
+    gcTime: 30 * 60 * 1000, // 30 minutes
+  })
+
+  if (noteRef.is_empty) {
+    return { version: noteRef.version, body: "" }
+  }
+  return data
+}
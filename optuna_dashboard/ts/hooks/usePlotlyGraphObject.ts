@@ -0,0 +1,39 @@
+import { useQuery } from "@tanstack/react-query"
+import * as plotly from "plotly.js-dist-min"
+import { FetchAPIClientError } from "../apiClient"
+import { useAPIClient } from "../apiClientProvider"
+import { PlotlyGraphObject } from "../types/optuna"
+
+export const usePlotlyGraphObject = (
+  studyId: number,
+  graphObject: PlotlyGraphObject
+) => {
+  const { apiClient } = useAPIClient()
+  const { data, isLoading, error } = useQuery<
+    { data: plotly.Data[]; layout: plotly.Layout },
+    FetchAPIClientError
+  >({
+    // The version changes whenever the graph object is overwritten.
+    queryKey: [
+      "plotlyGraphObject",
+      studyId,
+      graphObject.id,
+      graphObject.version,
+    ],
+    queryFn: () =>
+      apiClient.getPlotlyGraphObject(
+        studyId,
+        graphObject.id,
+        graphObject.version
+      ),
+    staleTime: Infinity,
+    gcTime: 30 * 60 * 1000, // 30 minutes
+  })
+
+  return {
+    data: data?.data,
+    layout: data?.layout,
+    isLoading,
+    error,
+  }
+}
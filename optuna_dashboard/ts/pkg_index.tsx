@@ -1,10 +1,15 @@
 import {
   APIClient,
   APIMeta,
+  ArtifactDeletionJob,
+  BatchUpdateTrialsResponse,
   CompareStudiesPlotType,
   CreateNewStudyResponse,
+  DeleteStudyResponse,
   GeneratePlotlyGraphQueryRequest,
   GeneratePlotlyGraphQueryResponse,
+  ListTrialsQuery,
+  ListTrialsResponse,
   ParamImportancesResponse,
   PlotResponse,
   PlotType,
@@ -12,11 +17,17 @@ import {
   ReGeneratePlotlyGraphQueryRequest,
   ReGeneratePlotlyGraphQueryResponse,
   RenameStudyResponse,
+  RenamedStudy,
+  StudyCopyJob,
   StudyDetailResponse,
   StudySummariesResponse,
+  TrialFilter,
   TrialFilterQueryRequest,
   TrialFilterQueryResponse,
+  TrialPage,
   TrialResponse,
+  TrialUpdate,
+  TrialUpdateResult,
   UploadArtifactAPIResponse,
 } from "./apiClient"
 import { APIClientProvider } from "./apiClientProvider"
@@ -28,6 +39,7 @@ import {
   FeedbackComponentType,
   FormWidgets,
   Note,
+  NoteRef,
   PlotlyGraphObject,
   PreferenceFeedbackMode,
   PreferenceHistory,
@@ -46,6 +58,7 @@ export {
   FeedbackComponentType,
   FormWidgets,
   Note,
+  NoteRef,
   PlotlyGraphObject,
   PreferenceFeedbackMode,
   PreferenceHistory,
@@ -55,7 +68,18 @@ export {
   StudySummariesResponse,
   CreateNewStudyResponse,
   RenameStudyResponse,
+  RenamedStudy,
+  StudyCopyJob,
   UploadArtifactAPIResponse,
+  ArtifactDeletionJob,
+  DeleteStudyResponse,
+  TrialUpdate,
+  TrialUpdateResult,
+  BatchUpdateTrialsResponse,
+  TrialFilter,
+  ListTrialsQuery,
+  ListTrialsResponse,
+  TrialPage,
   ParamImportancesResponse,
   APIMeta,
   StudyDetail,
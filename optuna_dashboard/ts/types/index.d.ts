@@ -0,0 +1,4 @@
+declare module "*.css"
+declare module "*.png"
+declare module "*.jpg"
+declare module "*.svg"
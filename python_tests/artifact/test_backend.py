@@ -1,10 +1,16 @@
 from __future__ import annotations
 
 import base64
+import io
 import json
+import os
 import tempfile
+from typing import BinaryIO
+from typing import TYPE_CHECKING
 from unittest.mock import MagicMock
+from unittest.mock import patch
 
+from bottle import Bottle
 import optuna
 from packaging import version
 import pytest
@@ -17,14 +23,27 @@ from optuna.artifacts import FileSystemArtifactStore
 from optuna.artifacts import upload_artifact
 from optuna.storages import BaseStorage
 from optuna_dashboard._app import create_app
+from optuna_dashboard._inmemory_cache import InMemoryCache
 from optuna_dashboard.artifact import _backend
 from optuna_dashboard.artifact import upload_artifact as dashboard_upload_artifact
 from optuna_dashboard.artifact._backend_to_store import to_artifact_store
+from optuna_dashboard.artifact._deletion import remove_artifacts
+from optuna_dashboard.artifact._index import get_artifact_index
+from optuna_dashboard.artifact._index import invalidate_artifact_index
+from optuna_dashboard.artifact._index import lookup_study_artifact_meta
+from optuna_dashboard.artifact._index import lookup_trial_artifact_meta
 from optuna_dashboard.artifact.file_system import FileSystemBackend
 
+from ..wsgi_client import create_wsgi_env
 from ..wsgi_client import send_request
 
 
+if TYPE_CHECKING:
+    from typing import Any
+
+    from optuna.artifacts._protocol import ArtifactStore
+
+
 def test_get_artifact_path() -> None:
     study = MagicMock(_study_id=0)
     trial = MagicMock(_trial_id=0, study=study)
@@ -82,7 +101,8 @@ def test_delete_all_artifacts(init_storage_with_artifact_meta: MagicMock) -> Non
     storage = init_storage_with_artifact_meta
     _backend.delete_all_artifacts(backend, storage, study_id=0)
 
-    assert backend.remove.call_args_list == [
+    # The artifacts are removed concurrently.
+    assert sorted(backend.remove.call_args_list) == [
         (("id0",),),
         (("id1",),),
         (("id2",),),
@@ -90,6 +110,101 @@ def test_delete_all_artifacts(init_storage_with_artifact_meta: MagicMock) -> Non
     ]
 
 
+def test_remove_artifacts_with_s3_batches() -> None:
+    artifact_store = MagicMock(bucket="my-bucket")
+    artifact_store.client.delete_objects.side_effect = lambda Bucket, Delete: {
+        "Errors": [{"Key": o["Key"]} for o in Delete["Objects"] if o["Key"] == "id1500"]
+    }
+    artifact_ids = [f"id{i}" for i in range(2500)]
+    progress = []
+
+    remove_artifacts(
+        artifact_store,
+        artifact_ids,
+        callback=lambda n_removed, n_failed: progress.append((n_removed, n_failed)),
+    )
+
+    artifact_store.remove.assert_not_called()
+    calls = artifact_store.client.delete_objects.call_args_list
+    assert [len(c.kwargs["Delete"]["Objects"]) for c in calls] == [1000, 1000, 500]
+    assert all(c.kwargs["Bucket"] == "my-bucket" for c in calls)
+    assert progress == [(1000, 0), (999, 1), (500, 0)]
+
+
+def test_remove_artifacts_in_thread_pool() -> None:
+    from optuna.artifacts.exceptions import ArtifactNotFound
+
+    def remove(artifact_id: str) -> None:
+        if artifact_id == "id1":
+            raise ArtifactNotFound
+        if artifact_id == "id2":
+            raise RuntimeError
+
+    artifact_store = MagicMock(bucket=None)
+    artifact_store.remove.side_effect = remove
+    progress = []
+
+    remove_artifacts(
+        artifact_store,
+        ["id0", "id1", "id2"],
+        callback=lambda n_removed, n_failed: progress.append((n_removed, n_failed)),
+    )
+
+    # Artifacts that are already removed are counted as removed.
+    assert progress == [(1, 0), (1, 0), (0, 1)]
+
+
+def test_artifact_index(init_storage_with_artifact_meta: MagicMock) -> None:
+    storage = init_storage_with_artifact_meta
+    in_memory_cache = InMemoryCache()
+
+    index = get_artifact_index(in_memory_cache, storage, study_id=0)
+    assert index.get_trial_artifact(0, "id0") == {"artifact_id": "id0", "filename": "foo.txt"}
+    assert index.get_trial_artifact(1, "id3") == {"artifact_id": "id3", "filename": "qux.txt"}
+    # The artifact is owned by another trial.
+    assert index.get_trial_artifact(0, "id3") is None
+    assert index.study_artifacts == []
+
+    with patch.object(storage, "get_study_system_attrs") as get_study_system_attrs:
+        assert lookup_trial_artifact_meta(in_memory_cache, storage, 0, 0, "id1") == {
+            "artifact_id": "id1",
+            "filename": "bar.txt",
+        }
+        get_study_system_attrs.assert_not_called()
+
+    # The artifacts uploaded after the index is built are looked up from the storage.
+    storage.set_study_system_attr(0, "artifacts:id4", '{"artifact_id": "id4"}')
+    assert lookup_study_artifact_meta(in_memory_cache, storage, 0, "id4") == {"artifact_id": "id4"}
+    assert index.get_study_artifact("id4") == {"artifact_id": "id4"}
+
+    invalidate_artifact_index(in_memory_cache, study_id=0)
+    assert get_artifact_index(in_memory_cache, storage, study_id=0) is not index
+
+
+def test_artifact_index_invalidated_while_built(
+    init_storage_with_artifact_meta: MagicMock,
+) -> None:
+    storage = init_storage_with_artifact_meta
+    in_memory_cache = InMemoryCache()
+    get_study_system_attrs = storage.get_study_system_attrs
+
+    def invalidate_and_get_study_system_attrs(study_id: int) -> dict[str, Any]:
+        system_attrs = get_study_system_attrs(study_id)
+        # e.g. an artifact is deleted by another request after the storage is read.
+        invalidate_artifact_index(in_memory_cache, study_id)
+        return system_attrs
+
+    with patch.object(
+        storage, "get_study_system_attrs", side_effect=invalidate_and_get_study_system_attrs
+    ):
+        stale_index = get_artifact_index(in_memory_cache, storage, study_id=0)
+    assert stale_index.get_trial_artifact(0, "id0") is not None
+    # The stale index is not stored in the cache.
+    index = get_artifact_index(in_memory_cache, storage, study_id=0)
+    assert index is not stale_index
+    assert get_artifact_index(in_memory_cache, storage, study_id=0) is index
+
+
 def test_list_trial_artifacts(init_storage_with_artifact_meta: MagicMock) -> None:
     storage = init_storage_with_artifact_meta
     trial_system_attrs = storage.get_trial_system_attrs(0)
@@ -203,6 +318,227 @@ def test_successful_trial_artifact_retrieval() -> None:
         assert body == b"dummy_content"
 
 
+@pytest.mark.parametrize(
+    "range_header,expected_status,expected_body,expected_content_range",
+    [
+        ("bytes=0-4", 206, b"dummy", "bytes 0-4/13"),
+        ("bytes=6-", 206, b"content", "bytes 6-12/13"),
+        ("bytes=-7", 206, b"content", "bytes 6-12/13"),
+        ("bytes=6-100", 206, b"content", "bytes 6-12/13"),
+        ("bytes=13-", 416, b"", "bytes */13"),
+        # Multiple ranges are not supported, so the whole content is returned.
+        ("bytes=0-1,3-4", 200, b"dummy_content", None),
+    ],
+)
+def test_trial_artifact_range_request(
+    range_header: str,
+    expected_status: int,
+    expected_body: bytes,
+    expected_content_range: str | None,
+) -> None:
+    storage = optuna.storages.InMemoryStorage()
+    study = optuna.create_study(storage=storage)
+    trial = study.ask()
+    with tempfile.TemporaryDirectory() as tmpdir:
+        artifact_store = FileSystemArtifactStore(tmpdir)
+        with tempfile.NamedTemporaryFile() as f:
+            f.write(b"dummy_content")
+            f.flush()
+            artifact_id = upload_artifact(
+                study_or_trial=trial, file_path=f.name, artifact_store=artifact_store
+            )
+        app = create_app(storage, artifact_store)
+        status, headers, body = send_request(
+            app,
+            f"/artifacts/{study._study_id}/{trial._trial_id}/{artifact_id}",
+            "GET",
+            headers={"Range": range_header},
+        )
+        assert status == expected_status
+        assert body == expected_body
+        assert dict(headers).get("Content-Range") == expected_content_range
+        if expected_status != 416:
+            assert dict(headers)["Content-Length"] == str(len(expected_body))
+
+
+def test_trial_artifact_cache_headers() -> None:
+    storage = optuna.storages.InMemoryStorage()
+    study = optuna.create_study(storage=storage)
+    trial = study.ask()
+    with tempfile.TemporaryDirectory() as tmpdir:
+        artifact_store = FileSystemArtifactStore(tmpdir)
+        with tempfile.NamedTemporaryFile(suffix=".csv.gz") as f:
+            f.write(b"dummy_content")
+            f.flush()
+            artifact_id = upload_artifact(
+                study_or_trial=trial, file_path=f.name, artifact_store=artifact_store
+            )
+        app = create_app(storage, artifact_store)
+        path = f"/artifacts/{study._study_id}/{trial._trial_id}/{artifact_id}"
+        status, headers, _ = send_request(app, path, "GET")
+        assert status == 200
+        headers_dict = dict(headers)
+        assert headers_dict["Etag"] == f'"{artifact_id}"'
+        assert headers_dict["Cache-Control"] == "public, max-age=31536000, immutable"
+        assert headers_dict["Content-Encoding"] == "gzip"
+        assert headers_dict["Accept-Ranges"] == "bytes"
+
+        # The artifact store is not accessed if the client already has the artifact.
+        with patch.object(artifact_store, "open_reader") as open_reader:
+            status, headers, body = send_request(
+                app, path, "GET", headers={"If_None_Match": f'"{artifact_id}"'}
+            )
+        assert status == 304
+        assert body == b""
+        assert dict(headers)["Etag"] == f'"{artifact_id}"'
+        open_reader.assert_not_called()
+
+
+def test_trial_artifact_with_file_wrapper() -> None:
+    storage = optuna.storages.InMemoryStorage()
+    study = optuna.create_study(storage=storage)
+    trial = study.ask()
+    with tempfile.TemporaryDirectory() as tmpdir:
+        artifact_store = FileSystemArtifactStore(tmpdir)
+        with tempfile.NamedTemporaryFile() as f:
+            f.write(b"dummy_content")
+            f.flush()
+            artifact_id = upload_artifact(
+                study_or_trial=trial, file_path=f.name, artifact_store=artifact_store
+            )
+        app = create_app(storage, artifact_store)
+        env = create_wsgi_env(
+            f"/artifacts/{study._study_id}/{trial._trial_id}/{artifact_id}", "GET", "", b"", {}, {}
+        )
+        wrapped = []
+
+        def file_wrapper(fp: BinaryIO) -> list[bytes]:
+            wrapped.append(fp)
+            with fp:
+                return [fp.read()]
+
+        env["wsgi.file_wrapper"] = file_wrapper
+        body = b"".join(app(env, lambda *_: None))
+        assert body == b"dummy_content"
+        # The file is passed to the WSGI server, which may send it with sendfile().
+        assert len(wrapped) == 1
+
+
+@pytest.mark.parametrize(
+    "x_sendfile,x_accel_redirect,header",
+    [
+        (True, None, "X-Sendfile"),
+        (False, "/internal/", "X-Accel-Redirect"),
+    ],
+)
+def test_study_artifact_offloaded_to_reverse_proxy(
+    x_sendfile: bool, x_accel_redirect: str | None, header: str
+) -> None:
+    storage = optuna.storages.InMemoryStorage()
+    study = optuna.create_study(storage=storage)
+    with tempfile.TemporaryDirectory() as tmpdir:
+        artifact_store = FileSystemArtifactStore(tmpdir)
+        with tempfile.NamedTemporaryFile() as f:
+            f.write(b"dummy_content")
+            f.flush()
+            artifact_id = upload_artifact(
+                study_or_trial=study, file_path=f.name, artifact_store=artifact_store
+            )
+        app = Bottle()
+        app._inmemory_cache = InMemoryCache()  # type: ignore
+        _backend.register_artifact_route(
+            app,
+            storage,
+            artifact_store,
+            x_sendfile=x_sendfile,
+            x_accel_redirect=x_accel_redirect,
+        )
+
+        status, headers, body = send_request(
+            app, f"/artifacts/{study._study_id}/{artifact_id}", "GET"
+        )
+        assert status == 200
+        assert body == b""
+        if header == "X-Sendfile":
+            expected = os.path.join(os.path.realpath(tmpdir), artifact_id)
+        else:
+            expected = f"/internal/{artifact_id}"
+        assert dict(headers)[header] == expected
+        assert dict(headers)["Etag"] == f'"{artifact_id}"'
+
+
+class _StreamingBody(io.RawIOBase):
+    """Mimics botocore's StreamingBody, which is not seekable but knows its size."""
+
+    def __init__(self, data: bytes, report_size: bool) -> None:
+        self._buf = io.BytesIO(data)
+        self.read_sizes: list[int] = []
+        if report_size:
+            self._content_length = str(len(data))
+
+    def readable(self) -> bool:
+        return True
+
+    def read(self, size: int = -1) -> bytes:
+        self.read_sizes.append(size)
+        return self._buf.read(size)
+
+
+class _StreamingArtifactStore:
+    def __init__(self, report_size: bool) -> None:
+        self.report_size = report_size
+        self.bodies: list[_StreamingBody] = []
+
+    def open_reader(self, artifact_id: str) -> BinaryIO:
+        body = _StreamingBody(b"dummy_content", self.report_size)
+        self.bodies.append(body)
+        return body  # type: ignore
+
+    def write(self, artifact_id: str, content_body: BinaryIO) -> None:
+        raise NotImplementedError
+
+    def remove(self, artifact_id: str) -> None:
+        raise NotImplementedError
+
+
+def _create_streaming_app(
+    storage: BaseStorage, artifact_store: ArtifactStore, buffer_size: int
+) -> Bottle:
+    app = Bottle()
+    app._inmemory_cache = InMemoryCache()  # type: ignore
+    _backend.register_artifact_route(app, storage, artifact_store, buffer_size=buffer_size)
+    return app
+
+
+@pytest.mark.parametrize("report_size", [True, False])
+def test_study_artifact_with_streaming_body(report_size: bool) -> None:
+    storage = optuna.storages.InMemoryStorage()
+    study = optuna.create_study(storage=storage)
+    artifact_id = "0d7c1a4e-2f6e-4c7b-9d8a-6f0e1b2c3d4e"
+    meta = {"artifact_id": artifact_id, "filename": "a.txt", "mimetype": "text/plain"}
+    study.set_system_attr(f"artifacts:{artifact_id}", json.dumps(meta))
+    artifact_store = _StreamingArtifactStore(report_size)
+    app = _create_streaming_app(storage, artifact_store, buffer_size=4)
+
+    status, headers, body = send_request(
+        app,
+        f"/artifacts/{study._study_id}/{artifact_id}",
+        "GET",
+        headers={"Range": "bytes=6-"},
+    )
+    if report_size:
+        assert status == 206
+        assert body == b"content"
+        assert dict(headers)["Content-Length"] == "7"
+    else:
+        # The range cannot be resolved without knowing the size.
+        assert status == 200
+        assert body == b"dummy_content"
+        assert "Content-Length" not in dict(headers)
+    assert max(artifact_store.bodies[0].read_sizes) <= 4
+    assert artifact_store.bodies[0].closed
+
+
 DUMMY_DATA_URL = (
     f"data:text/plain; charset=utf-8,{base64.b64encode(b'dummy_content').decode('utf-8')}"
 )
@@ -273,6 +609,138 @@ def test_upload_artifact() -> None:
             assert data == "dummy_content"
 
 
+def test_upload_trial_artifact_raw_body() -> None:
+    storage = optuna.storages.InMemoryStorage()
+
+    study = optuna.create_study(storage=storage)
+    with tempfile.TemporaryDirectory() as tmpdir:
+        artifact_store = FileSystemArtifactStore(tmpdir)
+
+        app = create_app(storage, artifact_store)
+
+        study.add_trial(optuna.create_trial(state=optuna.trial.TrialState.RUNNING))
+        trial = study.trials[-1]
+        status, _, body = send_request(
+            app,
+            f"/api/artifacts/{study._study_id}/{trial._trial_id}",
+            "POST",
+            body=b"a,b\n1,2\n",
+            queries={"filename": "dummy.csv"},
+            content_type="application/octet-stream",
+        )
+        assert status == 201
+        res = json.loads(body)
+        assert res["artifacts"] == [
+            {
+                "artifact_id": res["artifact_id"],
+                "filename": "dummy.csv",
+                "mimetype": "text/csv",
+                "encoding": None,
+            }
+        ]
+        with open(f"{tmpdir}/{res['artifact_id']}", "rb") as f:
+            assert f.read() == b"a,b\n1,2\n"
+
+
+def test_upload_study_artifact_raw_body() -> None:
+    storage = optuna.storages.InMemoryStorage()
+
+    study = optuna.create_study(storage=storage)
+    with tempfile.TemporaryDirectory() as tmpdir:
+        artifact_store = FileSystemArtifactStore(tmpdir)
+
+        app = _create_streaming_app(storage, artifact_store, buffer_size=4)
+        # A JSON file must not be confused with the legacy upload of data URIs.
+        content = json.dumps({"file": "foo"}).encode()
+        status, _, body = send_request(
+            app,
+            f"/api/artifacts/{study._study_id}",
+            "POST",
+            body=content,
+            queries={"filename": "dummy.json"},
+            content_type="application/octet-stream",
+        )
+        assert status == 201
+        res = json.loads(body)
+        assert [a["filename"] for a in res["artifacts"]] == ["dummy.json"]
+        with open(f"{tmpdir}/{res['artifact_id']}", "rb") as f:
+            assert f.read() == content
+
+
+def test_upload_artifact_incomplete_body() -> None:
+    storage = optuna.storages.InMemoryStorage()
+
+    study = optuna.create_study(storage=storage)
+    with tempfile.TemporaryDirectory() as tmpdir:
+        artifact_store = FileSystemArtifactStore(tmpdir)
+
+        app = _create_streaming_app(storage, artifact_store, buffer_size=4)
+        env = create_wsgi_env(
+            f"/api/artifacts/{study._study_id}",
+            "POST",
+            "application/octet-stream",
+            b"truncated",
+            {"filename": "dummy.txt"},
+            {},
+        )
+        # The client disconnected before sending the whole body.
+        env["CONTENT_LENGTH"] = "100"
+        statuses = []
+        body = b"".join(app(env, lambda status, *_: statuses.append(status)))
+        assert statuses[0].startswith("400")
+        assert "missing" in json.loads(body)["reason"]
+        assert os.listdir(tmpdir) == []
+        assert _backend.list_study_artifacts(storage.get_study_system_attrs(study._study_id)) == []
+
+
+def test_upload_artifact_rejects_simple_content_types() -> None:
+    storage = optuna.storages.InMemoryStorage()
+
+    study = optuna.create_study(storage=storage)
+    with tempfile.TemporaryDirectory() as tmpdir:
+        artifact_store = FileSystemArtifactStore(tmpdir)
+
+        app = create_app(storage, artifact_store)
+        # Cross-site forms can send these content types without a CORS preflight.
+        for content_type in ["text/plain", "application/x-www-form-urlencoded"]:
+            status, _, _ = send_request(
+                app,
+                f"/api/artifacts/{study._study_id}",
+                "POST",
+                body=b"<script>alert(1)</script>",
+                queries={"filename": "dummy.html"},
+                content_type=content_type,
+            )
+            assert status == 415
+        assert os.listdir(tmpdir) == []
+        assert _backend.list_study_artifacts(storage.get_study_system_attrs(study._study_id)) == []
+
+
+def test_upload_artifact_removes_partial_file_on_failure() -> None:
+    class FailingArtifactStore(FileSystemArtifactStore):
+        def write(self, artifact_id: str, content_body: BinaryIO) -> None:
+            with open(os.path.join(tmpdir, artifact_id), "wb") as f:
+                f.write(content_body.read(2))
+            raise OSError("No space left on device")
+
+    storage = optuna.storages.InMemoryStorage()
+
+    study = optuna.create_study(storage=storage)
+    with tempfile.TemporaryDirectory() as tmpdir:
+        app = _create_streaming_app(storage, FailingArtifactStore(tmpdir), buffer_size=4)
+        status, _, _ = send_request(
+            app,
+            f"/api/artifacts/{study._study_id}",
+            "POST",
+            body=b"a,b\n1,2\n",
+            queries={"filename": "dummy.csv"},
+            content_type="application/octet-stream",
+        )
+        assert status == 500
+        assert os.listdir(tmpdir) == []
+        assert _backend.list_study_artifacts(storage.get_study_system_attrs(study._study_id)) == []
+
+
 @pytest.mark.skipif(
     version.parse(optuna.__version__) < version.parse("3.4.0"),
     reason="upload_artiract needs storage",
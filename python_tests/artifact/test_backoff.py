@@ -1,9 +1,16 @@
 from __future__ import annotations
 
 import io
+import tempfile
+import time
+from unittest.mock import patch
 import uuid
 
 from optuna_dashboard.artifact.backoff import Backoff
+from optuna_dashboard.artifact.backoff import BackoffArtifactStore
+from optuna_dashboard.artifact.backoff import CircuitOpenError
+from optuna_dashboard.artifact.backoff import DEFAULT_DEADLINE
+import pytest
 
 from .stubs import FailBackend
 from .stubs import InMemoryBackend
@@ -35,3 +42,115 @@ def test_read_and_write() -> None:
     with backend.open(artifact_id) as f:
         actual = f.read()
     assert actual == dummy_content
+
+
+class _FlakyBackend(InMemoryBackend):
+    def __init__(self, n_failures: int) -> None:
+        super().__init__()
+        self.n_failures = n_failures
+        self.n_removed = 0
+
+    def remove(self, artifact_id: str) -> None:
+        if self.n_failures > 0:
+            self.n_failures -= 1
+            raise Exception("something error raised")
+        self.n_removed += 1
+
+
+def test_remove_stops_after_success() -> None:
+    backend = _FlakyBackend(n_failures=2)
+    with patch("optuna_dashboard.artifact.backoff.time.sleep"):
+        Backoff(backend=backend).remove("id")
+    assert backend.n_removed == 1
+
+
+def test_full_jitter() -> None:
+    backend = Backoff(backend=_FlakyBackend(n_failures=3), min_delay=0.1, multiplier=10)
+    with patch("optuna_dashboard.artifact.backoff.time.sleep") as sleep:
+        backend.remove("id")
+    assert [c.args[0] <= cap for c, cap in zip(sleep.call_args_list, [0.1, 1, 10])] == [
+        True,
+        True,
+        True,
+    ]
+    assert backend.metrics["retries"] == 3
+
+
+def test_deadline() -> None:
+    backend = Backoff(backend=FailBackend(), min_delay=1, max_delay=2, deadline=0.5)
+    with patch("optuna_dashboard.artifact.backoff.random.uniform", return_value=1):
+        with patch("optuna_dashboard.artifact.backoff.time.sleep") as sleep:
+            with pytest.raises(Exception, match="something error raised"):
+                backend.remove("id")
+    # The first sleep would exceed the deadline.
+    sleep.assert_not_called()
+
+
+def test_default_deadline() -> None:
+    backend = Backoff(backend=FailBackend())
+    clock = [0.0]
+
+    def sleep(secs: float) -> None:
+        clock[0] += secs
+
+    with patch("optuna_dashboard.artifact.backoff.random.uniform", side_effect=lambda a, b: b):
+        with patch("optuna_dashboard.artifact.backoff.time.sleep", side_effect=sleep):
+            with patch("optuna_dashboard.artifact.backoff.time.monotonic", lambda: clock[0]):
+                with pytest.raises(Exception, match="something error raised"):
+                    backend.remove("id")
+    # The longest backoffs of all retries would take longer than the deadline.
+    assert clock[0] <= DEFAULT_DEADLINE
+    assert backend.metrics["retries"] == 8
+
+
+def test_circuit_breaker() -> None:
+    backend = Backoff(backend=FailBackend(), failure_threshold=3, recovery_timeout=60)
+    with patch("optuna_dashboard.artifact.backoff.time.sleep") as sleep:
+        with pytest.raises(Exception, match="something error raised"):
+            backend.remove("id")
+        assert sleep.call_count == 2
+        with pytest.raises(CircuitOpenError):
+            backend.remove("id")
+    assert backend.metrics == {
+        "calls": 2,
+        "retries": 2,
+        "failures": 1,
+        "rejections": 1,
+        "circuit_state": "open",
+    }
+
+    # A half-open circuit is closed if the next operation succeeds.
+    with patch(
+        "optuna_dashboard.artifact.backoff.time.monotonic", return_value=time.monotonic() + 60
+    ):
+        backend._backend = InMemoryBackend()
+        backend.write("id", io.BytesIO(b"Hello World"))
+    assert backend.metrics["circuit_state"] == "closed"
+
+
+def test_not_seekable_body_is_not_retried() -> None:
+    class _Body(io.RawIOBase):
+        def seekable(self) -> bool:
+            return False
+
+    backend = Backoff(backend=FailBackend())
+    with patch("optuna_dashboard.artifact.backoff.time.sleep") as sleep:
+        with pytest.raises(Exception, match="something error raised"):
+            backend.write("id", _Body())  # type: ignore[arg-type]
+    sleep.assert_not_called()
+
+
+def test_artifact_store() -> None:
+    from optuna.artifacts import FileSystemArtifactStore
+    from optuna.artifacts.exceptions import ArtifactNotFound
+
+    artifact_id = f"test-{uuid.uuid4()}"
+    with tempfile.TemporaryDirectory() as tmpdir:
+        store = BackoffArtifactStore(FileSystemArtifactStore(tmpdir))
+        store.write(artifact_id, io.BytesIO(b"Hello World"))
+        with store.open_reader(artifact_id) as f:
+            assert f.read() == b"Hello World"
+        store.remove(artifact_id)
+        with pytest.raises(ArtifactNotFound):
+            store.open_reader(artifact_id)
+    assert store.metrics["retries"] == 0
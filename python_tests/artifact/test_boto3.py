@@ -61,3 +61,35 @@ class Boto3BackendTestCase(TestCase):
         backend = Boto3Backend(self.bucket_name)
         with self.assertRaises(ArtifactNotFound):
             backend.open("not-found-id")
+
+    def test_streaming_multipart_upload(self) -> None:
+        class _NonSeekableStream(io.RawIOBase):
+            def __init__(self, data: bytes) -> None:
+                self._buf = io.BytesIO(data)
+
+            def readable(self) -> bool:
+                return True
+
+            def readinto(self, b: bytearray) -> int:  # type: ignore[override]
+                return self._buf.readinto(b)
+
+        artifact_id = "dummy-uuid"
+        # S3 requires each part except the last one to be at least 5MB.
+        chunksize = 5 * 1024 * 1024
+        dummy_content = b"0123456789" * (chunksize // 10 * 2 + 1)
+        stream = _NonSeekableStream(dummy_content)
+
+        backend = Boto3Backend(
+            self.bucket_name,
+            streaming=True,
+            multipart_threshold=chunksize,
+            multipart_chunksize=chunksize,
+            max_concurrency=2,
+        )
+        backend.write(artifact_id, stream)  # type: ignore[arg-type]
+        self.assertFalse(stream.closed)
+
+        obj = self.s3_client.get_object(Bucket=self.bucket_name, Key=artifact_id)
+        self.assertEqual(obj["Body"].read(), dummy_content)
+        # The ETag of a multipart upload ends with the number of parts.
+        self.assertTrue(obj["ETag"].strip('"').endswith("-3"))
@@ -0,0 +1,80 @@
+from __future__ import annotations
+
+import io
+import os
+import tempfile
+
+from optuna.artifacts import FileSystemArtifactStore
+from optuna.artifacts.exceptions import ArtifactNotFound
+from optuna_dashboard.artifact.dedup import Deduplicate
+import pytest
+
+from .stubs import InMemoryBackend
+
+
+def test_store_same_content_once() -> None:
+    with tempfile.TemporaryDirectory() as tmpdir:
+        store = Deduplicate(FileSystemArtifactStore(tmpdir))
+        store.write("id0", io.BytesIO(b"Hello World"))
+        store.write("id1", io.BytesIO(b"Hello World"))
+        store.write("id2", io.BytesIO(b"Good Bye"))
+
+        for artifact_id, expected in [
+            ("id0", b"Hello World"),
+            ("id1", b"Hello World"),
+            ("id2", b"Good Bye"),
+        ]:
+            with store.open_reader(artifact_id) as f:
+                assert f.read() == expected
+        blobs = [name for name in os.listdir(tmpdir) if name.startswith("sha256-")]
+        assert len(blobs) == 2
+
+        store.remove("id0")
+        with store.open_reader("id1") as f:
+            assert f.read() == b"Hello World"
+
+        store.remove("id1")
+        with pytest.raises(ArtifactNotFound):
+            store.open_reader("id0")
+        # Blobs are only removed explicitly.
+        assert sorted(os.listdir(tmpdir)) == sorted(blobs + ["id2"])
+
+
+def test_remove_unreferenced_blobs() -> None:
+    with tempfile.TemporaryDirectory() as tmpdir:
+        backend = FileSystemArtifactStore(tmpdir)
+        store = Deduplicate(backend)
+        store.write("id0", io.BytesIO(b"Hello World"))
+        store.write("id1", io.BytesIO(b"Hello World"))
+        hello_blobs = set(os.listdir(tmpdir)) - {"id0", "id1"}
+        store.write("id2", io.BytesIO(b"Good Bye"))
+        backend.write("sha256-legacy", io.BytesIO(b"Not a blob"))
+        store.remove("id0")
+        store.remove("id2")
+
+        removed = store.remove_unreferenced_blobs(["id0", "id1", "id2"], os.listdir(tmpdir))
+        assert len(removed) == 1
+        assert set(os.listdir(tmpdir)) == {"id1", "sha256-legacy"} | hello_blobs
+        with store.open_reader("id1") as f:
+            assert f.read() == b"Hello World"
+
+
+def test_read_pointer_with_invalid_digest_as_artifact() -> None:
+    backend = InMemoryBackend()
+    content = b'optuna-dashboard-dedup:{"digest": "../id0"}'
+    backend.write("id1", io.BytesIO(content))
+
+    store = Deduplicate(backend)
+    with store.open_reader("id1") as f:
+        assert f.read() == content
+
+
+def test_read_artifacts_written_without_dedup() -> None:
+    backend = InMemoryBackend()
+    backend.write("legacy", io.BytesIO(b"Hello World"))
+
+    store = Deduplicate(backend)
+    with store.open_reader("legacy") as f:
+        assert f.read() == b"Hello World"
+    store.remove("legacy")
+    assert backend._data == {}
@@ -0,0 +1,101 @@
+from __future__ import annotations
+
+import io
+import os
+import tempfile
+import time
+from typing import TYPE_CHECKING
+import uuid
+
+from optuna.artifacts.exceptions import ArtifactNotFound
+from optuna_dashboard.artifact.disk_cache import DiskCache
+import pytest
+
+from .stubs import InMemoryBackend
+
+
+if TYPE_CHECKING:
+    from typing import BinaryIO
+
+
+class _CountingBackend(InMemoryBackend):
+    def __init__(self) -> None:
+        super().__init__()
+        self.n_opened = 0
+
+    def open(self, artifact_id: str) -> BinaryIO:
+        self.n_opened += 1
+        return super().open(artifact_id)
+
+
+def test_read_through() -> None:
+    artifact_id = str(uuid.uuid4())
+    backend = _CountingBackend()
+    with tempfile.TemporaryDirectory() as cache_dir:
+        store = DiskCache(backend, cache_dir=cache_dir)
+        store.write(artifact_id, io.BytesIO(b"Hello World"))
+
+        for _ in range(3):
+            with store.open_reader(artifact_id) as f:
+                assert f.read() == b"Hello World"
+        assert backend.n_opened == 1
+        assert len(os.listdir(cache_dir)) == 1
+
+        store.remove(artifact_id)
+        assert os.listdir(cache_dir) == []
+        with pytest.raises(ArtifactNotFound):
+            store.open_reader(artifact_id)
+
+
+def test_evict_least_recently_used() -> None:
+    backend = _CountingBackend()
+    for artifact_id in ["a", "b", "c"]:
+        backend.write(artifact_id, io.BytesIO(b"0123456789"))
+
+    with tempfile.TemporaryDirectory() as cache_dir:
+        store = DiskCache(backend, cache_dir=cache_dir, max_bytes=25)
+        for artifact_id in ["a", "b", "a", "c"]:
+            store.open_reader(artifact_id).close()
+        assert backend.n_opened == 3
+        assert len(os.listdir(cache_dir)) == 2
+
+        # "b" is evicted since "a" was read recently.
+        store.open_reader("a").close()
+        assert backend.n_opened == 3
+        store.open_reader("b").close()
+        assert backend.n_opened == 4
+
+
+def test_skip_large_artifact() -> None:
+    backend = _CountingBackend()
+    backend.write("large", io.BytesIO(b"0123456789"))
+
+    with tempfile.TemporaryDirectory() as cache_dir:
+        store = DiskCache(backend, cache_dir=cache_dir, max_bytes=5)
+        with store.open_reader("large") as f:
+            assert f.read() == b"0123456789"
+        assert os.listdir(cache_dir) == []
+
+
+def test_reuse_cache_files() -> None:
+    backend = _CountingBackend()
+    backend.write("a", io.BytesIO(b"Hello World"))
+
+    with tempfile.TemporaryDirectory() as cache_dir:
+        DiskCache(backend, cache_dir=cache_dir).open_reader("a").close()
+        # A temporary file left by a killed process is removed.
+        stale_tmp_path = os.path.join(cache_dir, ".tmp-stale")
+        with open(stale_tmp_path, "wb") as f:
+            f.write(b"Hello")
+        mtime = time.time() - 2 * 60 * 60
+        os.utime(stale_tmp_path, (mtime, mtime))
+        # A temporary file being written by another process is left as it is.
+        with open(os.path.join(cache_dir, ".tmp-writing"), "wb") as f:
+            f.write(b"Hello")
+
+        store = DiskCache(backend, cache_dir=cache_dir)
+        with store.open_reader("a") as f:
+            assert f.read() == b"Hello World"
+        assert backend.n_opened == 1
+        assert len(os.listdir(cache_dir)) == 2
+        assert not os.path.exists(stale_tmp_path)
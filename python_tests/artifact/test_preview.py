@@ -0,0 +1,252 @@
+from __future__ import annotations
+
+import io
+import os
+import tempfile
+from unittest.mock import patch
+
+from bottle import Bottle
+import optuna
+from optuna.artifacts import FileSystemArtifactStore
+from optuna.artifacts import upload_artifact
+from optuna.storages import BaseStorage
+from optuna_dashboard._inmemory_cache import InMemoryCache
+from optuna_dashboard.artifact import _backend
+from optuna_dashboard.artifact import _preview
+from optuna_dashboard.artifact._preview import generate_text_preview
+from optuna_dashboard.artifact._preview import generate_thumbnail
+from optuna_dashboard.artifact._preview import get_preview_kind
+from optuna_dashboard.artifact._preview import MAX_TEXT_PREVIEW_BYTES
+from optuna_dashboard.artifact._preview import PreviewNotSupported
+import pytest
+
+from ..wsgi_client import send_request
+
+
+def _create_app(
+    storage: BaseStorage, artifact_store: FileSystemArtifactStore, preview_cache_dir: str
+) -> Bottle:
+    app = Bottle()
+    app._inmemory_cache = InMemoryCache()  # type: ignore
+    _backend.register_artifact_route(
+        app, storage, artifact_store, preview_cache_dir=preview_cache_dir
+    )
+    return app
+
+
+def _upload(
+    trial: optuna.Trial, artifact_store: FileSystemArtifactStore, suffix: str, body: bytes
+) -> str:
+    with tempfile.NamedTemporaryFile(suffix=suffix) as f:
+        f.write(body)
+        f.flush()
+        return upload_artifact(
+            study_or_trial=trial, file_path=f.name, artifact_store=artifact_store
+        )
+
+
+@pytest.mark.parametrize(
+    "filename,mimetype,encoding,expected",
+    [
+        ("a.png", "image/png", None, "image"),
+        ("a.svg", "image/svg+xml", None, None),
+        ("a.csv", "text/csv", None, "text"),
+        ("a.csv.gz", "text/csv", "gzip", None),
+        ("a.jsonl", "application/octet-stream", None, "text"),
+        ("a.bin", "application/octet-stream", None, None),
+    ],
+)
+def test_get_preview_kind(
+    filename: str, mimetype: str, encoding: str | None, expected: str | None
+) -> None:
+    artifact_meta = {
+        "artifact_id": "id",
+        "filename": filename,
+        "mimetype": mimetype,
+        "encoding": encoding,
+    }
+    assert get_preview_kind(artifact_meta) == expected  # type: ignore
+
+
+def test_generate_text_preview() -> None:
+    assert generate_text_preview(io.BytesIO(b"a\nb\nc\n"), 2) == b"a\nb\n"
+    assert generate_text_preview(io.BytesIO(b"a\nb"), 5) == b"a\nb"
+    # Very long lines are truncated.
+    long_line = b"x" * (MAX_TEXT_PREVIEW_BYTES * 2)
+    assert len(generate_text_preview(io.BytesIO(long_line), 1)) == MAX_TEXT_PREVIEW_BYTES
+
+
+def test_text_preview_is_cached_on_disk() -> None:
+    storage = optuna.storages.InMemoryStorage()
+    study = optuna.create_study(storage=storage)
+    trial = study.ask()
+    with tempfile.TemporaryDirectory() as tmpdir, tempfile.TemporaryDirectory() as cache_dir:
+        artifact_store = FileSystemArtifactStore(tmpdir)
+        body = b"".join(f"{i},{i * i}\n".encode() for i in range(100))
+        artifact_id = _upload(trial, artifact_store, ".csv", body)
+        app = _create_app(storage, artifact_store, cache_dir)
+
+        path = f"/artifacts/{study._study_id}/{trial._trial_id}/{artifact_id}/preview"
+        status, headers, preview = send_request(app, path, "GET", queries={"lines": "3"})
+        assert status == 200
+        assert preview == b"0,0\n1,1\n2,4\n"
+        assert dict(headers)["Content-Type"] == "text/csv"
+        assert dict(headers)["Etag"] == f'"{artifact_id}-text-3"'
+        assert len(os.listdir(cache_dir)) == 1
+
+        # The preview is served from the disk cache without reading the artifact.
+        os.remove(os.path.join(tmpdir, artifact_id))
+        status, _, preview = send_request(app, path, "GET", queries={"lines": "3"})
+        assert status == 200
+        assert preview == b"0,0\n1,1\n2,4\n"
+
+        status, _, _ = send_request(
+            app, path, "GET", headers={"If_None_Match": f'"{artifact_id}-text-20"'}
+        )
+        assert status == 304
+
+
+def test_preview_of_study_artifact() -> None:
+    storage = optuna.storages.InMemoryStorage()
+    study = optuna.create_study(storage=storage)
+    with tempfile.TemporaryDirectory() as tmpdir, tempfile.TemporaryDirectory() as cache_dir:
+        artifact_store = FileSystemArtifactStore(tmpdir)
+        with tempfile.NamedTemporaryFile(suffix=".txt") as f:
+            f.write(b"hello\nworld\n")
+            f.flush()
+            artifact_id = upload_artifact(
+                study_or_trial=study, file_path=f.name, artifact_store=artifact_store
+            )
+        app = _create_app(storage, artifact_store, cache_dir)
+
+        status, _, preview = send_request(
+            app, f"/artifacts/{study._study_id}/{artifact_id}/preview", "GET"
+        )
+        assert status == 200
+        assert preview == b"hello\nworld\n"
+
+
+@pytest.mark.parametrize(
+    "suffix,queries,expected_status",
+    [
+        (".bin", {}, 415),
+        (".csv", {"lines": "0"}, 400),
+        (".csv", {"lines": "abc"}, 400),
+    ],
+)
+def test_invalid_preview_request(
+    suffix: str, queries: dict[str, str], expected_status: int
+) -> None:
+    storage = optuna.storages.InMemoryStorage()
+    study = optuna.create_study(storage=storage)
+    trial = study.ask()
+    with tempfile.TemporaryDirectory() as tmpdir, tempfile.TemporaryDirectory() as cache_dir:
+        artifact_store = FileSystemArtifactStore(tmpdir)
+        artifact_id = _upload(trial, artifact_store, suffix, b"dummy_content")
+        app = _create_app(storage, artifact_store, cache_dir)
+
+        status, _, _ = send_request(
+            app,
+            f"/artifacts/{study._study_id}/{trial._trial_id}/{artifact_id}/preview",
+            "GET",
+            queries=queries,
+        )
+        assert status == expected_status
+
+
+def test_image_preview_without_pillow() -> None:
+    storage = optuna.storages.InMemoryStorage()
+    study = optuna.create_study(storage=storage)
+    trial = study.ask()
+    with tempfile.TemporaryDirectory() as tmpdir, tempfile.TemporaryDirectory() as cache_dir:
+        artifact_store = FileSystemArtifactStore(tmpdir)
+        artifact_id = _upload(trial, artifact_store, ".png", b"dummy_image")
+        app = _create_app(storage, artifact_store, cache_dir)
+
+        with patch.object(_backend, "is_pillow_available", return_value=False):
+            status, headers, body = send_request(
+                app,
+                f"/artifacts/{study._study_id}/{trial._trial_id}/{artifact_id}/preview",
+                "GET",
+            )
+        # The original image is served instead.
+        assert status == 200
+        assert body == b"dummy_image"
+        assert dict(headers)["Etag"] == f'"{artifact_id}"'
+
+
+def test_image_thumbnail() -> None:
+    Image = pytest.importorskip("PIL.Image")
+
+    storage = optuna.storages.InMemoryStorage()
+    study = optuna.create_study(storage=storage)
+    trial = study.ask()
+    with tempfile.TemporaryDirectory() as tmpdir, tempfile.TemporaryDirectory() as cache_dir:
+        artifact_store = FileSystemArtifactStore(tmpdir)
+        buf = io.BytesIO()
+        Image.new("RGBA", (800, 400), (255, 0, 0, 128)).save(buf, format="PNG")
+        artifact_id = _upload(trial, artifact_store, ".png", buf.getvalue())
+        app = _create_app(storage, artifact_store, cache_dir)
+
+        path = f"/artifacts/{study._study_id}/{trial._trial_id}/{artifact_id}/preview"
+        status, headers, body = send_request(app, path, "GET", queries={"size": "100"})
+        assert status == 200
+        assert dict(headers)["Content-Type"] == "image/png"
+        with Image.open(io.BytesIO(body)) as img:
+            assert img.size == (100, 50)
+            assert img.mode == "RGBA"
+
+        status, _, _ = send_request(app, path, "GET", queries={"size": "4096"})
+        assert status == 400
+
+
+def test_image_thumbnail_too_large() -> None:
+    Image = pytest.importorskip("PIL.Image")
+
+    buf = io.BytesIO()
+    Image.new("L", (400, 300)).save(buf, format="PNG")
+    max_image_pixels = Image.MAX_IMAGE_PIXELS
+    with patch.object(_preview, "MAX_IMAGE_PIXELS", 400 * 300 - 1):
+        with pytest.raises(PreviewNotSupported):
+            generate_thumbnail(io.BytesIO(buf.getvalue()), 100, "PNG")
+    assert len(generate_thumbnail(io.BytesIO(buf.getvalue()), 100, "PNG")) > 0
+    # Pillow's global limit is left as it is.
+    assert Image.MAX_IMAGE_PIXELS == max_image_pixels
+
+
+class _UnseekableReader(io.RawIOBase):
+    def __init__(self, data: bytes) -> None:
+        self._buf = io.BytesIO(data)
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, b: bytearray) -> int:  # type: ignore[override]
+        return self._buf.readinto(b)
+
+
+def test_image_thumbnail_too_many_bytes() -> None:
+    Image = pytest.importorskip("PIL.Image")
+
+    buf = io.BytesIO()
+    Image.new("L", (400, 300)).save(buf, format="PNG")
+    data = buf.getvalue()
+    with patch.object(_preview, "MAX_IMAGE_BYTES", len(data) - 1):
+        with pytest.raises(PreviewNotSupported):
+            generate_thumbnail(io.BytesIO(data), 100, "PNG")
+        # The size of unseekable streams is checked while they are spooled.
+        with pytest.raises(PreviewNotSupported):
+            generate_thumbnail(_UnseekableReader(data), 100, "PNG")  # type: ignore[arg-type]
+    with patch.object(_preview, "_SPOOL_MAX_BYTES", 16):
+        thumbnail = generate_thumbnail(_UnseekableReader(data), 100, "PNG")  # type: ignore[arg-type]
+    with Image.open(io.BytesIO(thumbnail)) as img:
+        assert img.size == (100, 75)
+
+
+def test_temporary_preview_cache_dir_is_removed_at_exit() -> None:
+    with tempfile.TemporaryDirectory() as tmpdir:
+        preview_cache = _preview.PreviewCache(FileSystemArtifactStore(tmpdir), cache_dir=None)
+        with patch.object(_preview.atexit, "register") as register:
+            cache_dir = preview_cache._get_cache()._cache_dir
+        register.assert_called_once_with(_preview.shutil.rmtree, cache_dir, ignore_errors=True)
+        _preview.shutil.rmtree(cache_dir)
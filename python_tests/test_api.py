@@ -3,13 +3,19 @@ from __future__ import annotations
 import importlib.util
 import json
 import tempfile
+import time
 from unittest import TestCase
+from unittest.mock import ANY
+from unittest.mock import patch
 
 import optuna
 from optuna import get_all_study_summaries
 from optuna.study import StudyDirection
+from optuna_dashboard import save_note
+from optuna_dashboard import save_plotly_graph_object
 from optuna_dashboard._app import create_app
 from optuna_dashboard._app import create_new_study
+from optuna_dashboard._note import get_note_from_system_attrs
 from optuna_dashboard._note import note_str_key_prefix
 from optuna_dashboard._note import note_ver_key
 from optuna_dashboard._preference_setting import register_preference_feedback_component
@@ -17,12 +23,15 @@ from optuna_dashboard._preferential_history import NewHistory
 from optuna_dashboard._preferential_history import remove_history
 from optuna_dashboard._preferential_history import report_history
 from optuna_dashboard._serializer import serialize_preference_history
+from optuna_dashboard._storage import ConcurrentWriteError
 from packaging import version
 import pytest
 
+from .storage_supplier import StorageSupplier
 from .wsgi_client import send_request
 
 botorch_is_available = importlib.util.find_spec("botorch") is not None
+plotly_is_available = importlib.util.find_spec("plotly") is not None
 
 
 def objective(trial: optuna.trial.Trial) -> float:
@@ -348,11 +357,133 @@ class APITestCase(TestCase):
         assert status == 409
         assert note_ver_key(0) not in study.system_attrs
 
+    @patch(
+        "optuna_dashboard._note.set_study_system_attrs",
+        side_effect=ConcurrentWriteError("written by another process"),
+    )
+    def test_save_trial_note_written_by_another_process(self, _: object) -> None:
+        request_body: dict[str, int | str] = {"body": "Test note.", "version": 1}
+        status, study = self._save_trial_note(request_body)
+        assert status == 409
+        assert note_ver_key(0) not in study.system_attrs
+
     def test_save_trial_note_empty(self) -> None:
         status, study = self._save_trial_note(request_body={})
         assert status == 400
         assert note_ver_key(0) not in study.system_attrs
 
+    def test_get_study_detail_lists_note_versions(self) -> None:
+        study = optuna.create_study()
+        trial = study.ask()
+        save_note(study, "Study note.")
+        save_note(trial, "Trial note.")
+        save_note(trial, "Trial note v2.")
+        app = create_app(study._storage)
+
+        status, _, body = send_request(app, f"/api/studies/{study._study_id}", "GET")
+        self.assertEqual(status, 200)
+        study_detail = json.loads(body)
+        self.assertEqual(study_detail["note"], {"version": 1, "is_empty": False, "digest": ANY})
+        trial_note_ref = study_detail["trials"][0]["note"]
+        self.assertEqual(trial_note_ref, {"version": 2, "is_empty": False, "digest": ANY})
+
+        cache_version = f"2-{trial_note_ref['digest']}"
+        status, headers, body = send_request(
+            app,
+            f"/api/studies/{study._study_id}/notes/{trial._trial_id}",
+            "GET",
+            queries={"version": cache_version},
+        )
+        self.assertEqual(status, 200)
+        self.assertEqual(json.loads(body), {"version": 2, "body": "Trial note v2."})
+        self.assertIn(("Cache-Control", "public, max-age=31536000, immutable"), headers)
+        self.assertEqual(dict(headers)["Etag"], f'"{cache_version}"')
+
+        status, _, body = send_request(app, f"/api/studies/{study._study_id}/note", "GET")
+        self.assertEqual(status, 200)
+        self.assertEqual(json.loads(body), {"version": 1, "body": "Study note."})
+
+    def test_get_note_not_modified(self) -> None:
+        study = optuna.create_study()
+        save_note(study, "Study note.")
+        app = create_app(study._storage)
+        _, headers, _ = send_request(app, f"/api/studies/{study._study_id}/note", "GET")
+
+        status, headers, _ = send_request(
+            app,
+            f"/api/studies/{study._study_id}/note",
+            "GET",
+            headers={"If_None_Match": dict(headers)["Etag"]},
+        )
+        self.assertEqual(status, 304)
+        # The version is not specified, so the client must revalidate it.
+        self.assertIn(("Cache-Control", "no-cache"), headers)
+
+        status, _, _ = send_request(app, "/api/studies/-1/note", "GET")
+        self.assertEqual(status, 404)
+
+    def test_get_note_with_same_version_and_other_body(self) -> None:
+        storage = optuna.storages.InMemoryStorage()
+        study = optuna.create_study(storage=storage)
+        other_study = optuna.create_study(storage=storage)
+        save_note(study, "Study note.")
+        save_note(other_study, "Other study note.")
+        other_trial = other_study.ask()
+        app = create_app(storage)
+
+        # IDs can be reused, so the notes with the same version must not share the cache.
+        etags = []
+        for s in [study, other_study]:
+            _, headers, _ = send_request(app, f"/api/studies/{s._study_id}/note", "GET")
+            etags.append(dict(headers)["Etag"])
+        self.assertNotEqual(etags[0], etags[1])
+
+        status, _, _ = send_request(
+            app, f"/api/studies/{study._study_id}/notes/{other_trial._trial_id}", "GET"
+        )
+        self.assertEqual(status, 404)
+        status, _, _ = send_request(app, f"/api/studies/{study._study_id}/notes/999", "GET")
+        self.assertEqual(status, 404)
+
+    @pytest.mark.skipif(not plotly_is_available, reason="plotly is not installed")
+    def test_get_plotly_graph_object(self) -> None:
+        import plotly.graph_objects as go
+
+        study = optuna.create_study()
+        figure = go.Figure(data=[go.Bar(x=["a", "b"], y=[1, 2])])
+        graph_object_id = save_plotly_graph_object(study, figure, graph_object_id="bar")
+        app = create_app(study._storage)
+
+        status, _, body = send_request(app, f"/api/studies/{study._study_id}", "GET")
+        self.assertEqual(status, 200)
+        graph_objects = json.loads(body)["plotly_graph_objects"]
+        self.assertEqual(len(graph_objects), 1)
+        self.assertEqual(graph_objects[0]["id"], graph_object_id)
+        self.assertNotIn("graph_object", graph_objects[0])
+        graph_object_version = graph_objects[0]["version"]
+
+        status, headers, body = send_request(
+            app,
+            f"/api/studies/{study._study_id}/plotly/{graph_object_id}",
+            "GET",
+            queries={"version": graph_object_version},
+        )
+        self.assertEqual(status, 200)
+        self.assertEqual(json.loads(body), json.loads(figure.to_json()))
+        self.assertEqual(dict(headers)["Etag"], f'"{graph_object_version}"')
+        self.assertIn(("Cache-Control", "public, max-age=31536000, immutable"), headers)
+
+        # Overwriting the graph object changes its version.
+        figure.update_layout(title="updated")
+        save_plotly_graph_object(study, figure, graph_object_id="bar")
+        status, _, body = send_request(app, f"/api/studies/{study._study_id}", "GET")
+        self.assertNotEqual(
+            json.loads(body)["plotly_graph_objects"][0]["version"], graph_object_version
+        )
+
+        status, _, _ = send_request(app, f"/api/studies/{study._study_id}/plotly/not-found", "GET")
+        self.assertEqual(status, 404)
+
     @pytest.mark.skipif(not botorch_is_available, reason="botorch is not installed")
     @pytest.mark.skipif(
         version.parse(optuna.__version__) < version.parse("3.2.0"),
@@ -543,7 +674,8 @@ class APITestCase(TestCase):
         version.parse(optuna.__version__) < version.parse("3.4.0"),
         reason="Needs optuna.artifacts",
     )
-    def test_delete_study_with_removing_artifacts(self) -> None:
+    @patch("optuna_dashboard._app.MAX_SYNC_DELETION_SIZE", 0)
+    def test_delete_study_with_removing_artifacts_in_background(self) -> None:
         from optuna.artifacts import upload_artifact
         from optuna.artifacts.exceptions import ArtifactNotFound
 
@@ -563,14 +695,29 @@ class APITestCase(TestCase):
             with artifact_store.open_reader(artifact_id) as reader:
                 self.assertEqual(reader.read(), b"dummy")
 
-            status, _, _ = send_request(
+            status, _, body = send_request(
                 app,
                 f"/api/studies/{study._study_id}",
                 "DELETE",
                 body=json.dumps({"remove_associated_artifacts": True}),
                 content_type="application/json",
             )
-            self.assertEqual(status, 204)
+            self.assertEqual(status, 202)
+            job = json.loads(body)["artifact_deletion_job"]
+            self.assertEqual(job["total"], 1)
+
+            # The artifacts are removed in the background.
+            for _ in range(100):
+                status, _, body = send_request(
+                    app, f"/api/artifact_deletion_jobs/{job['job_id']}", "GET"
+                )
+                self.assertEqual(status, 200)
+                job = json.loads(body)
+                if job["finished"]:
+                    break
+                time.sleep(0.05)
+            self.assertEqual(job["n_removed"], 1)
+            self.assertEqual(job["n_failed"], 0)
 
             with self.assertRaises(ArtifactNotFound):
                 with artifact_store.open_reader(artifact_id) as reader:
@@ -578,6 +725,40 @@ class APITestCase(TestCase):
 
         self.assertEqual(len(get_all_study_summaries(storage)), 0)
 
+    @pytest.mark.skipif(
+        version.parse(optuna.__version__) < version.parse("3.4.0"),
+        reason="Needs optuna.artifacts",
+    )
+    def test_delete_study_with_removing_artifacts(self) -> None:
+        from optuna.artifacts import upload_artifact
+        from optuna.artifacts.exceptions import ArtifactNotFound
+
+        storage = optuna.storages.InMemoryStorage()
+        study = optuna.create_study(storage=storage)
+        with tempfile.TemporaryDirectory() as tmpdir_name:
+            artifact_store = optuna.artifacts.FileSystemArtifactStore(base_path=tmpdir_name)
+            with tempfile.NamedTemporaryFile() as f:
+                f.write(b"dummy")
+                f.flush()
+                artifact_id = upload_artifact(
+                    study_or_trial=study, file_path=f.name, artifact_store=artifact_store
+                )
+
+            app = create_app(storage, artifact_store)
+            status, _, _ = send_request(
+                app,
+                f"/api/studies/{study._study_id}",
+                "DELETE",
+                body=json.dumps({"remove_associated_artifacts": True}),
+                content_type="application/json",
+            )
+            # A few artifacts are removed without a background job.
+            self.assertEqual(status, 204)
+            with self.assertRaises(ArtifactNotFound):
+                artifact_store.open_reader(artifact_id)
+
+        self.assertEqual(len(get_all_study_summaries(storage)), 0)
+
     @pytest.mark.skipif(
         version.parse(optuna.__version__) < version.parse("3.4.0"),
         reason="Needs optuna.artifacts",
@@ -745,6 +926,205 @@ class APITestCase(TestCase):
                 )
                 self.assertEqual(status, 400)
 
+    def test_batch_update_trials(self) -> None:
+        for storage_specifier in ["inmemory", "sqlite", "cached_sqlite", "journal"]:
+            with self.subTest(storage=storage_specifier), StorageSupplier(
+                storage_specifier
+            ) as storage:
+                study = optuna.create_study(storage=storage)
+                trial_ids = [study.ask()._trial_id for _ in range(3)]
+                finished_trial = study.ask()
+                study.tell(finished_trial, 0)
+                finished_trial_id = finished_trial._trial_id
+
+                app = create_app(storage)
+                status, _, body = send_request(
+                    app,
+                    "/api/trials/batch",
+                    "POST",
+                    body=json.dumps(
+                        {
+                            "updates": [
+                                {"trial_id": trial_ids[0], "user_attrs": {"label": "cat"}},
+                                {
+                                    "trial_id": trial_ids[1],
+                                    "user_attrs": {"label": "dog"},
+                                    "state": "Complete",
+                                    "values": [1.0],
+                                },
+                                {"trial_id": trial_ids[2], "state": "Fail"},
+                                {"trial_id": finished_trial_id, "user_attrs": {"label": "x"}},
+                                {"trial_id": 999, "user_attrs": {"label": "x"}},
+                                {"trial_id": trial_ids[0], "state": "Pruned"},
+                            ]
+                        }
+                    ),
+                    content_type="application/json",
+                )
+                self.assertEqual(status, 200)
+                results = json.loads(body)["results"]
+                self.assertEqual(
+                    [r["trial_id"] for r in results],
+                    trial_ids + [finished_trial_id, 999, trial_ids[0]],
+                )
+                self.assertEqual([r["error"] is None for r in results], [True] * 3 + [False] * 3)
+
+                trials = storage.get_all_trials(study._study_id)
+                self.assertEqual(trials[0].user_attrs, {"label": "cat"})
+                self.assertEqual(trials[0].state, optuna.trial.TrialState.RUNNING)
+                self.assertEqual(trials[1].user_attrs, {"label": "dog"})
+                self.assertEqual(trials[1].state, optuna.trial.TrialState.COMPLETE)
+                self.assertEqual(trials[1].values, [1.0])
+                self.assertEqual(trials[2].state, optuna.trial.TrialState.FAIL)
+                self.assertEqual(trials[3].user_attrs, {})
+
+    # Optuna 3.x does not have the private helpers used by the transaction.
+    @patch("optuna_dashboard._storage._supports_trial_updates_in_transaction", return_value=False)
+    def test_batch_update_trials_without_transaction(self, _: object) -> None:
+        with StorageSupplier("sqlite") as storage:
+            study = optuna.create_study(storage=storage)
+            trial_id = study.ask()._trial_id
+            app = create_app(storage)
+            status, _, body = send_request(
+                app,
+                "/api/trials/batch",
+                "POST",
+                body=json.dumps(
+                    {
+                        "updates": [
+                            {"trial_id": trial_id, "user_attrs": {"label": "cat"}},
+                            {"trial_id": 999, "user_attrs": {"label": "x"}},
+                        ]
+                    }
+                ),
+                content_type="application/json",
+            )
+            self.assertEqual(status, 200)
+            results = json.loads(body)["results"]
+            self.assertEqual([r["error"] is None for r in results], [True, False])
+            self.assertEqual(storage.get_trial(trial_id).user_attrs, {"label": "cat"})
+
+    def test_batch_update_trials_with_storage_failure(self) -> None:
+        with StorageSupplier("sqlite") as storage:
+            study = optuna.create_study(storage=storage)
+            trial_id = study.ask()._trial_id
+            app = create_app(storage)
+            with patch(
+                "optuna.storages._rdb.models.TrialModel.find_or_raise_by_id",
+                side_effect=optuna.exceptions.StorageInternalError("connection lost"),
+            ):
+                status, _, _ = send_request(
+                    app,
+                    "/api/trials/batch",
+                    "POST",
+                    body=json.dumps({"updates": [{"trial_id": trial_id, "state": "Fail"}]}),
+                    content_type="application/json",
+                )
+            self.assertEqual(status, 500)
+
+    def test_batch_update_trials_with_invalid_body(self) -> None:
+        storage = optuna.storages.InMemoryStorage()
+        app = create_app(storage)
+        for body in [{}, {"updates": []}, {"updates": {"trial_id": 0}}]:
+            with self.subTest(body=body):
+                status, _, _ = send_request(
+                    app,
+                    "/api/trials/batch",
+                    "POST",
+                    body=json.dumps(body),
+                    content_type="application/json",
+                )
+                self.assertEqual(status, 400)
+
+    def test_list_trials(self) -> None:
+        storage = optuna.storages.InMemoryStorage()
+        study = optuna.create_study(storage=storage)
+        for i in range(10):
+            trial = study.ask()
+            trial.suggest_categorical("y", ["a", "b"])
+            trial.set_user_attr("group", i % 3)
+            if i == 9:
+                study.tell(trial, state=optuna.trial.TrialState.PRUNED)
+            else:
+                study.tell(trial, (i - 4) ** 2)
+
+        app = create_app(storage)
+        path = f"/api/studies/{study._study_id}/trials"
+
+        status, _, body = send_request(app, path, "GET", queries={"limit": "4"})
+        self.assertEqual(status, 200)
+        page = json.loads(body)
+        self.assertEqual([t["number"] for t in page["trials"]], [0, 1, 2, 3])
+        self.assertEqual(page["n_trials"], 10)
+        self.assertIsNotNone(page["next_cursor"])
+
+        numbers = []
+        cursor = None
+        while True:
+            queries = {"limit": "3", "sort_by": "value:0", "order": "desc"}
+            if cursor is not None:
+                queries["cursor"] = cursor
+            status, _, body = send_request(app, path, "GET", queries=queries)
+            self.assertEqual(status, 200)
+            page = json.loads(body)
+            numbers += [t["number"] for t in page["trials"]]
+            cursor = page["next_cursor"]
+            if cursor is None:
+                break
+        # The trial without values comes last.
+        self.assertEqual(numbers, [0, 8, 1, 7, 2, 6, 3, 5, 4, 9])
+
+        filters = [
+            {"type": "value", "objective": 0, "max": 4},
+            {"type": "user_attr", "key": "group", "op": "ne", "value": 0},
+        ]
+        status, _, body = send_request(
+            app,
+            path,
+            "GET",
+            queries={"filters": json.dumps(filters), "states": "Complete", "sort_by": "value:0"},
+        )
+        self.assertEqual(status, 200)
+        self.assertEqual([t["number"] for t in json.loads(body)["trials"]], [4, 5, 2])
+
+        filters = [{"type": "param", "name": "y", "in": ["a"]}]
+        status, _, body = send_request(
+            app, path, "GET", queries={"filters": json.dumps(filters), "sort_by": "param:y"}
+        )
+        self.assertEqual(status, 200)
+        self.assertEqual(
+            [t["number"] for t in json.loads(body)["trials"]],
+            [t.number for t in study.trials if t.params["y"] == "a"],
+        )
+
+    def test_list_trials_with_invalid_query(self) -> None:
+        storage = optuna.storages.InMemoryStorage()
+        study = optuna.create_study(storage=storage)
+        study.optimize(objective, n_trials=3)
+        app = create_app(storage)
+        path = f"/api/studies/{study._study_id}/trials"
+
+        status, _, body = send_request(app, path, "GET", queries={"limit": "1"})
+        cursor = json.loads(body)["next_cursor"]
+        for queries in [
+            {"limit": "0"},
+            {"limit": "abc"},
+            {"order": "random"},
+            {"sort_by": "foo"},
+            {"states": "Unknown"},
+            {"filters": "not json"},
+            {"filters": json.dumps([{"type": "value", "min": "a"}])},
+            {"filters": json.dumps([{"type": "user_attr", "key": "k", "op": "like"}])},
+            {"cursor": "invalid"},
+            {"cursor": cursor, "order": "desc"},
+        ]:
+            with self.subTest(queries=queries):
+                status, _, _ = send_request(app, path, "GET", queries=queries)
+                self.assertEqual(status, 400)
+
+        status, _, _ = send_request(app, "/api/studies/999/trials", "GET")
+        self.assertEqual(status, 404)
+
     def test_rename_study(self) -> None:
         storage = optuna.storages.InMemoryStorage()
         study = optuna.create_study(study_name="foo", storage=storage)
@@ -767,6 +1147,143 @@ class APITestCase(TestCase):
         self.assertEqual(renamed_study.user_attrs, {"key1": "value1"})
         self.assertEqual(len(get_all_study_summaries(storage)), 1)
 
+    def test_rename_study_in_place(self) -> None:
+        for storage_specifier in ["sqlite", "cached_sqlite"]:
+            with self.subTest(storage=storage_specifier), StorageSupplier(
+                storage_specifier
+            ) as storage:
+                study = optuna.create_study(study_name="foo", storage=storage)
+                study.optimize(objective, n_trials=2)
+                save_note(optuna.Trial(study, study.trials[0]._trial_id), "note")
+                optuna.create_study(study_name="baz", storage=storage)
+
+                app = create_app(storage)
+                status, _, _ = send_request(
+                    app,
+                    f"/api/studies/{study._study_id}/rename",
+                    "POST",
+                    body=json.dumps({"study_name": "baz"}),
+                    content_type="application/json",
+                )
+                self.assertEqual(status, 400)
+
+                status, _, body = send_request(
+                    app,
+                    f"/api/studies/{study._study_id}/rename",
+                    "POST",
+                    body=json.dumps({"study_name": "bar"}),
+                    content_type="application/json",
+                )
+                self.assertEqual(status, 201)
+                self.assertEqual(json.loads(body)["study_id"], study._study_id)
+                self.assertEqual(storage.get_study_name_from_id(study._study_id), "bar")
+
+                renamed_study = optuna.load_study(study_name="bar", storage=storage)
+                self.assertEqual(renamed_study._study_id, study._study_id)
+                self.assertEqual(len(renamed_study.trials), 2)
+                system_attrs = storage.get_study_system_attrs(study._study_id)
+                trial_note = get_note_from_system_attrs(system_attrs, study.trials[0]._trial_id)
+                self.assertEqual(trial_note["body"], "note")
+
+    @patch("optuna_dashboard._study_copy.COPY_BATCH_SIZE", 2)
+    def test_rename_study_copies_trials_in_batches(self) -> None:
+        for storage_specifier in ["inmemory", "journal"]:
+            with self.subTest(storage=storage_specifier), StorageSupplier(
+                storage_specifier
+            ) as storage:
+                study = optuna.create_study(study_name="foo", storage=storage)
+                study.optimize(objective, n_trials=5)
+                for trial, note_body in zip(study.trials, ["a", "b", "c", "d", "e"]):
+                    save_note(optuna.Trial(study, trial._trial_id), note_body)
+                params = [t.params for t in study.trials]
+
+                app = create_app(storage)
+                status, _, _ = send_request(
+                    app,
+                    f"/api/studies/{study._study_id}/rename",
+                    "POST",
+                    body=json.dumps({"study_name": "bar"}),
+                    content_type="application/json",
+                )
+                self.assertEqual(status, 201)
+
+                renamed_study = optuna.load_study(study_name="bar", storage=storage)
+                self.assertEqual([t.params for t in renamed_study.trials], params)
+                system_attrs = storage.get_study_system_attrs(renamed_study._study_id)
+                self.assertEqual(
+                    [
+                        get_note_from_system_attrs(system_attrs, t._trial_id)["body"]
+                        for t in renamed_study.trials
+                    ],
+                    ["a", "b", "c", "d", "e"],
+                )
+                self.assertEqual(len(get_all_study_summaries(storage)), 1)
+
+    @patch("optuna_dashboard._study_copy.COPY_BATCH_SIZE", 2)
+    @patch("optuna_dashboard._app.COPY_BATCH_SIZE", 2)
+    def test_rename_study_in_background(self) -> None:
+        storage = optuna.storages.InMemoryStorage()
+        study = optuna.create_study(study_name="foo", storage=storage)
+        study.optimize(objective, n_trials=5)
+        for trial, note_body in zip(study.trials, ["a", "b", "c", "d", "e"]):
+            save_note(optuna.Trial(study, trial._trial_id), note_body)
+
+        app = create_app(storage)
+        status, _, body = send_request(
+            app,
+            f"/api/studies/{study._study_id}/rename",
+            "POST",
+            body=json.dumps({"study_name": "bar"}),
+            content_type="application/json",
+        )
+        self.assertEqual(status, 202)
+        self.assertEqual(json.loads(body)["study_name"], "bar")
+        job_id = json.loads(body)["study_copy_job"]["job_id"]
+
+        for _ in range(100):
+            status, _, body = send_request(app, f"/api/study_copy_jobs/{job_id}", "GET")
+            self.assertEqual(status, 200)
+            if json.loads(body)["finished"]:
+                break
+            time.sleep(0.01)
+        job = json.loads(body)
+        self.assertEqual(job["total"], 5)
+        self.assertEqual(job["n_copied"], 5)
+        self.assertIsNone(job["error"])
+
+        renamed_study = optuna.load_study(study_name="bar", storage=storage)
+        system_attrs = storage.get_study_system_attrs(renamed_study._study_id)
+        self.assertEqual(
+            [
+                get_note_from_system_attrs(system_attrs, t._trial_id)["body"]
+                for t in renamed_study.trials
+            ],
+            ["a", "b", "c", "d", "e"],
+        )
+        self.assertEqual(len(get_all_study_summaries(storage)), 1)
+
+        status, _, _ = send_request(app, "/api/study_copy_jobs/unknown", "GET")
+        self.assertEqual(status, 404)
+
+    def test_rename_study_failed_to_copy(self) -> None:
+        storage = optuna.storages.InMemoryStorage()
+        study = optuna.create_study(study_name="foo", storage=storage)
+        study.optimize(objective, n_trials=2)
+
+        app = create_app(storage)
+        with patch.object(storage, "create_new_trial", side_effect=RuntimeError("failed")):
+            status, _, _ = send_request(
+                app,
+                f"/api/studies/{study._study_id}/rename",
+                "POST",
+                body=json.dumps({"study_name": "bar"}),
+                content_type="application/json",
+            )
+        self.assertEqual(status, 500)
+        # The partially copied study is removed, and the original one is left as it is.
+        self.assertEqual([s.study_name for s in get_all_study_summaries(storage)], ["foo"])
+        self.assertEqual(len(study.trials), 2)
+
 
 class BottleRequestHookTestCase(TestCase):
     def test_ignore_trailing_slashes(self) -> None:
@@ -0,0 +1,104 @@
+from __future__ import annotations
+
+from unittest.mock import MagicMock
+from unittest.mock import patch
+
+import optuna
+from optuna.trial import TrialState
+import pytest
+
+from optuna_dashboard._cached_study import CachedStudy
+from optuna_dashboard._compact_trial import CompactTrial
+from optuna_dashboard._compact_trial import TrialCompactor
+from optuna_dashboard._storage import get_study
+
+
+def _create_study() -> optuna.Study:
+    optuna.logging.set_verbosity(optuna.logging.ERROR)
+    study = optuna.create_study(study_name="foo")
+    study.set_user_attr("key", "value")
+    study.set_metric_names(["loss"])
+    study.optimize(lambda t: t.suggest_float("x", -10, 10) ** 2, n_trials=10)
+    study.ask()
+    return study
+
+
+def test_cached_study_does_not_access_storage() -> None:
+    study = _create_study()
+    frozen_study = get_study(study._storage, study._study_id)
+    assert frozen_study is not None
+    trials = study.get_trials(deepcopy=False)
+
+    cached_study = CachedStudy.from_frozen_study(frozen_study, trials)
+    cached_study._storage = MagicMock(side_effect=AssertionError("storage must not be used"))
+
+    assert cached_study.study_name == "foo"
+    assert cached_study.directions == study.directions
+    assert cached_study.user_attrs == {"key": "value"}
+    assert cached_study.metric_names == ["loss"]
+    assert cached_study.trials == trials
+    assert len(cached_study.get_trials(states=(TrialState.COMPLETE,))) == 10
+    assert cached_study.best_trial.number == study.best_trial.number
+    assert cached_study._storage.mock_calls == []
+
+
+def test_cached_study_best_trial() -> None:
+    study = _create_study()
+    frozen_study = get_study(study._storage, study._study_id)
+    assert frozen_study is not None
+    cached_study = CachedStudy.from_frozen_study(frozen_study, study.get_trials(deepcopy=False))
+
+    # Study.best_trial of Optuna 3.x reads the best trial from the storage.
+    assert not hasattr(cached_study, "_storage")
+    assert cached_study.best_trial == study.best_trial
+    assert cached_study.best_value == study.best_value
+    assert cached_study.best_params == study.best_params
+
+
+def test_get_study_not_found() -> None:
+    study = _create_study()
+    assert get_study(study._storage, study._study_id + 1) is None
+
+
+def test_cached_study_without_completed_trials() -> None:
+    study = CachedStudy(0, "foo", [optuna.study.StudyDirection.MINIMIZE], [])
+    with pytest.raises(ValueError):
+        study.best_trial
+
+
+def test_cached_study_with_optuna_visualization() -> None:
+    pytest.importorskip("plotly")
+    study = _create_study()
+    frozen_study = get_study(study._storage, study._study_id)
+    assert frozen_study is not None
+    cached_study = CachedStudy.from_frozen_study(frozen_study, study.get_trials(deepcopy=False))
+    figure = optuna.visualization.plot_slice(cached_study)
+    assert len(figure.data[0].x) == 10
+
+
+def test_cached_study_converts_compact_trials_on_read() -> None:
+    study = _create_study()
+    frozen_study = get_study(study._storage, study._study_id)
+    assert frozen_study is not None
+    trials = TrialCompactor().compact(study.get_trials(deepcopy=False))
+    cached_study = CachedStudy.from_frozen_study(frozen_study, trials)
+
+    with patch.object(
+        CompactTrial, "to_frozen_trial", autospec=True, side_effect=CompactTrial.to_frozen_trial
+    ) as to_frozen_trial:
+        assert cached_study.best_trial == study.best_trial
+        assert to_frozen_trial.call_count == 1
+
+        running_trials = cached_study.get_trials(deepcopy=False, states=(TrialState.RUNNING,))
+        assert running_trials == study.get_trials(states=(TrialState.RUNNING,))
+        assert to_frozen_trial.call_count == 2
+
+        # The converted trials are reused by the following reads.
+        assert cached_study.get_trials(deepcopy=False, states=(TrialState.RUNNING,)) == (
+            running_trials
+        )
+        assert cached_study.trials == study.trials
+        assert cached_study.get_trials(states=(TrialState.COMPLETE,)) == study.get_trials(
+            states=(TrialState.COMPLETE,)
+        )
+        assert to_frozen_trial.call_count == 2 + len(trials)
@@ -0,0 +1,109 @@
+from __future__ import annotations
+
+import json
+
+import optuna
+from optuna.trial import TrialState
+from optuna_dashboard._app import create_app
+from optuna_dashboard._compact_trial import CompactTrial
+from optuna_dashboard._compact_trial import to_frozen_trials
+from optuna_dashboard._compact_trial import TrialCompactor
+from optuna_dashboard._serializer import serialize_frozen_trial
+
+from .wsgi_client import send_request
+
+
+def objective(trial: optuna.Trial) -> float:
+    x = trial.suggest_float("x", -1, 1)
+    y = trial.suggest_int("y", 0, 10)
+    z = trial.suggest_categorical("z", ["a", None, 1.5])
+    trial.report(x, step=0)
+    trial.report(y, step=3)
+    trial.set_user_attr("z", z)
+    return x + y
+
+
+def test_compact_trial_has_same_attributes() -> None:
+    study = optuna.create_study()
+    study.optimize(objective, n_trials=5)
+    study.ask()
+    trials = study.get_trials(deepcopy=False)
+
+    compacted = TrialCompactor().compact(trials)
+    assert all(isinstance(t, CompactTrial) for t in compacted)
+    for expected, actual in zip(trials, to_frozen_trials(compacted)):
+        assert actual == expected
+        assert actual.params == expected.params
+        assert actual.distributions == expected.distributions
+        assert actual.intermediate_values == expected.intermediate_values
+        assert actual.system_attrs == expected.system_attrs
+
+    for expected, compact in zip(trials, compacted):
+        assert compact.values == expected.values
+        assert compact.last_step == expected.last_step
+        assert compact.duration == expected.duration
+        assert serialize_frozen_trial(0, compact, {}) == serialize_frozen_trial(0, expected, {})
+
+
+def test_trial_compactor_shares_objects() -> None:
+    study = optuna.create_study()
+    study.optimize(objective, n_trials=3)
+    running = study.ask()
+
+    compactor = TrialCompactor()
+    compacted = compactor.compact(study.get_trials(deepcopy=False))
+    first, second = compacted[0], compacted[1]
+    assert isinstance(first, CompactTrial) and isinstance(second, CompactTrial)
+    assert first._param_names is second._param_names
+    assert all(d1 is d2 for d1, d2 in zip(first._distributions, second._distributions))
+
+    study.tell(running, 1.0)
+    recompacted = compactor.compact(study.get_trials(deepcopy=False))
+    # Records of finished trials are reused, and the running trial is compacted again.
+    assert recompacted[:3] == compacted[:3]
+    assert all(t1 is t2 for t1, t2 in zip(recompacted[:3], compacted[:3]))
+    assert recompacted[3] is not compacted[3]
+    assert recompacted[3].state == TrialState.COMPLETE
+
+
+def test_trial_compactor_distinguishes_types_of_choices() -> None:
+    study = optuna.create_study()
+
+    def objective(trial: optuna.Trial) -> float:
+        trial.suggest_categorical("flag", [False, True])
+        return trial.suggest_categorical("n", [0, 1])
+
+    study.optimize(objective, n_trials=10)
+    trials = study.get_trials(deepcopy=False)
+
+    compacted = TrialCompactor().compact(trials)
+    for expected, actual in zip(trials, to_frozen_trials(compacted)):
+        assert actual.params == expected.params
+        assert [type(v) for v in actual.params.values()] == [bool, int]
+        for name in ["flag", "n"]:
+            assert repr(actual.distributions[name]) == repr(expected.distributions[name])
+    for expected, compact in zip(trials, compacted):
+        assert serialize_frozen_trial(0, compact, {}) == serialize_frozen_trial(0, expected, {})
+
+
+def test_api_with_compact_trials() -> None:
+    storage = optuna.storages.InMemoryStorage()
+    study = optuna.create_study(storage=storage)
+    study.optimize(objective, n_trials=5)
+
+    expected_status, _, expected_body = send_request(
+        create_app(storage), f"/api/studies/{study._study_id}", "GET"
+    )
+    app = create_app(storage, compact_trials=True)
+    for path in [
+        f"/api/studies/{study._study_id}",
+        f"/api/studies/{study._study_id}/trials",
+        f"/api/studies/{study._study_id}/param_importances",
+        f"/csv/{study._study_id}",
+    ]:
+        status, _, _ = send_request(app, path, "GET")
+        assert status == 200, path
+
+    status, _, body = send_request(app, f"/api/studies/{study._study_id}", "GET")
+    assert status == expected_status
+    assert json.loads(body)["trials"] == json.loads(expected_body)["trials"]
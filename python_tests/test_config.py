@@ -5,9 +5,11 @@ from optuna.artifacts import FileSystemArtifactStore
 import pytest
 
 from optuna_dashboard._config import create_artifact_store_from_config
+from optuna_dashboard._config import create_importance_config_from_config
 from optuna_dashboard._config import create_llm_provider_from_config
 from optuna_dashboard._config import DashboardConfig
 from optuna_dashboard._config import load_config_from_toml
+from optuna_dashboard._importance import ImportanceConfig
 from optuna_dashboard.llm.openai import OpenAI
 
 
@@ -161,3 +163,15 @@ def test_build_from_sources_defaults() -> None:
     assert config.port == 8080
     assert config.host == "127.0.0.1"
     assert config.server == "auto"
+
+
+def test_create_importance_config_from_config() -> None:
+    config = create_importance_config_from_config(
+        {"importance": {"recompute_growth_ratio": 0.2, "recompute_interval_seconds": 5}}
+    )
+    assert config.recompute_growth_ratio == 0.2
+    assert config.recompute_interval_seconds == 5
+
+    assert create_importance_config_from_config({}) == ImportanceConfig()
+    with pytest.raises(ValueError):
+        create_importance_config_from_config({"importance": {"unknown_key": 1}})
@@ -62,6 +62,25 @@ def test_update_plotly_graph_object() -> None:
     assert plot_data_dict[graph_object_id] == plot_data.to_json()
 
 
+def test_save_compressed_plotly_graph_object() -> None:
+    dummy_study = get_dummy_study()
+    plot_data = optuna.visualization.plot_optimization_history(dummy_study)
+    graph_object_id = save_plotly_graph_object(dummy_study, plot_data)
+    study_system_attrs = dummy_study._storage.get_study_system_attrs(dummy_study._study_id)
+    n_uncompressed_attrs = len(study_system_attrs)
+
+    # Overwrite the graph object with the compressed one.
+    save_plotly_graph_object(
+        dummy_study, plot_data, graph_object_id=graph_object_id, compress=True
+    )
+    study_system_attrs = dummy_study._storage.get_study_system_attrs(dummy_study._study_id)
+    plot_data_dict = custom_plot_data.get_plotly_graph_objects(study_system_attrs)
+    assert plot_data_dict[graph_object_id] == plot_data.to_json()
+
+    non_empty_attrs = [v for v in study_system_attrs.values() if v != ""]
+    assert len(non_empty_attrs) < n_uncompressed_attrs
+
+
 @pytest.mark.parametrize(
     "name",
     [
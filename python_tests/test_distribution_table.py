@@ -0,0 +1,100 @@
+from __future__ import annotations
+
+import optuna
+from optuna.distributions import CategoricalDistribution
+from optuna.distributions import FloatDistribution
+from optuna.distributions import IntDistribution
+from optuna.trial import FrozenTrial
+from optuna_dashboard._distribution_table import DistributionTable
+from optuna_dashboard._distribution_table import get_distribution_table
+from optuna_dashboard._inmemory_cache import InMemoryCache
+from optuna_dashboard._serializer import serialize_distribution
+from optuna_dashboard._serializer import serialize_frozen_trial
+from optuna_dashboard._storage import get_trials
+
+from .storage_supplier import StorageSupplier
+
+
+def test_intern_distribution() -> None:
+    table = DistributionTable()
+    d1 = FloatDistribution(0, 1)
+    d2 = FloatDistribution(0, 1)
+    d3 = CategoricalDistribution(["a", "b"])
+
+    assert table.intern(d1) is d1
+    assert table.intern(d2) is d1
+    assert table.intern(d3) is d3
+    assert len(table) == 2
+
+    assert table.to_json(d1) == serialize_distribution(d1)
+    assert table.to_json(d1) is table.to_json(d1)
+    # Distributions that are not interned are serialized every time.
+    assert table.to_json(d2) == serialize_distribution(d2)
+    assert table.to_json(d2) is not table.to_json(d2)
+
+
+def test_intern_distinguishes_types_of_choices() -> None:
+    table = DistributionTable()
+    int_choices = CategoricalDistribution([0, 1])
+    bool_choices = CategoricalDistribution([False, True])
+    float_choices = CategoricalDistribution([0.0, 1.0])
+    # These distributions are equal in Python, but their choices are different.
+    assert int_choices == bool_choices
+
+    assert table.intern(int_choices) is int_choices
+    assert table.intern(bool_choices) is bool_choices
+    assert table.intern(float_choices) is float_choices
+    assert table.intern(CategoricalDistribution([0, 1])) is int_choices
+    assert table.intern(FloatDistribution(0, 1)) is not table.intern(IntDistribution(0, 1))
+    assert len(table) == 5
+
+
+def test_get_trials_does_not_modify_storage() -> None:
+    storage = optuna.storages.InMemoryStorage()
+    study = optuna.create_study(storage=storage)
+
+    def objective(trial: optuna.Trial) -> float:
+        trial.suggest_categorical("flag", [False, True])
+        return trial.suggest_categorical("n", [0, 1])
+
+    study.optimize(objective, n_trials=5)
+    cache = InMemoryCache()
+    trials = get_trials(cache, storage, study._study_id)
+    table = get_distribution_table(cache, study._study_id)
+    for trial, expected in zip(trials, storage.get_all_trials(study._study_id)):
+        assert trial.params == expected.params
+        assert [type(v) for v in trial.params.values()] == [bool, int]
+        assert _choice_types(trial, "n") == [int, int]
+        serialized = serialize_frozen_trial(study._study_id, trial, {}, table)
+        assert serialized["params"][1]["distribution"]["choices"][0]["pytype"] == "<class 'int'>"
+
+    for trial in storage.get_all_trials(study._study_id, deepcopy=False):
+        assert _choice_types(trial, "n") == [int, int]
+        assert _choice_types(trial, "flag") == [bool, bool]
+
+
+def _choice_types(trial: FrozenTrial, name: str) -> list[type]:
+    distribution = trial.distributions[name]
+    assert isinstance(distribution, CategoricalDistribution)
+    return [type(c) for c in distribution.choices]
+
+
+def test_get_trials_interns_distributions() -> None:
+    with StorageSupplier("sqlite") as storage:
+        study = optuna.create_study(storage=storage)
+        study.optimize(
+            lambda t: t.suggest_float("x", 0, 1) + len(t.suggest_categorical("y", ["a", "b"])),
+            n_trials=3,
+        )
+        cache = InMemoryCache()
+        trials = get_trials(cache, storage, study._study_id)
+        table = get_distribution_table(cache, study._study_id)
+        assert len(table) == 2
+        for name in ["x", "y"]:
+            assert trials[0].distributions[name] is trials[1].distributions[name]
+            assert trials[0].distributions[name] is trials[2].distributions[name]
+
+        for trial in trials:
+            assert serialize_frozen_trial(0, trial, {}, table) == serialize_frozen_trial(
+                0, trial, {}
+            )
@@ -0,0 +1,156 @@
+from __future__ import annotations
+
+from datetime import datetime
+from datetime import timedelta
+import random
+from unittest.mock import patch
+
+import optuna
+import pytest
+
+from optuna_dashboard._importance import _reservoir_sample
+from optuna_dashboard._importance import _should_recompute
+from optuna_dashboard._importance import _stratified_sample
+from optuna_dashboard._importance import get_param_importance_from_trials_cache
+from optuna_dashboard._importance import ImportanceConfig
+from optuna_dashboard._inmemory_cache import InMemoryCache
+
+
+def _create_study(n_trials: int) -> optuna.Study:
+    optuna.logging.set_verbosity(optuna.logging.ERROR)
+    study = optuna.create_study(sampler=optuna.samplers.RandomSampler(seed=0))
+    study.optimize(
+        lambda t: t.suggest_float("x", -10, 10) ** 2 + t.suggest_int("y", 0, 10),
+        n_trials=n_trials,
+    )
+    return study
+
+
+def test_should_recompute() -> None:
+    config = ImportanceConfig(recompute_growth_ratio=0.1, recompute_interval_seconds=60)
+    now = datetime.now()
+    assert not _should_recompute(config, 100, now, 100)
+    assert not _should_recompute(config, 100, now, 105)
+    assert _should_recompute(config, 100, now, 110)
+    assert _should_recompute(config, 100, now - timedelta(seconds=61), 101)
+    assert _should_recompute(config, 100, now, 50)
+
+
+def test_importance_cache_hysteresis() -> None:
+    study = _create_study(20)
+    cache = InMemoryCache()
+    config = ImportanceConfig(recompute_growth_ratio=0.5, recompute_interval_seconds=3600)
+    trials = study.get_trials(deepcopy=False)
+
+    importance = get_param_importance_from_trials_cache(
+        cache, study._study_id, study.directions, 0, trials, config
+    )
+    assert {i["name"] for i in importance} == {"x", "y"}
+    assert len(cache._param_importance_cache) == 1
+
+    # A few more trials must not trigger recomputation.
+    _, computed_at, _ = cache._param_importance_cache[(study._study_id, 0, "ped_anova")]
+    study.optimize(lambda t: t.suggest_float("x", -10, 10) + t.suggest_int("y", 0, 10), n_trials=2)
+    get_param_importance_from_trials_cache(
+        cache, study._study_id, study.directions, 0, study.get_trials(deepcopy=False), config
+    )
+    n_cached, cached_at, _ = cache._param_importance_cache[(study._study_id, 0, "ped_anova")]
+    assert n_cached == 20
+    assert cached_at == computed_at
+
+    cache.clear()
+    assert len(cache._param_importance_cache) == 0
+
+
+def test_importance_cache_is_bounded() -> None:
+    cache = InMemoryCache(max_param_importance_cache_size=1)
+    studies = [_create_study(10), _create_study(10)]
+    for study in studies:
+        trials = study.get_trials(deepcopy=False)
+        get_param_importance_from_trials_cache(cache, study._study_id, study.directions, 0, trials)
+    assert list(cache._param_importance_cache) == [(studies[1]._study_id, 0, "ped_anova")]
+
+
+def test_reservoir_sample() -> None:
+    trials = _create_study(50).get_trials(deepcopy=False)
+    sampled = _reservoir_sample(iter(trials), 10, random.Random(0))
+    assert len(sampled) == 10
+    assert len({t.number for t in sampled}) == 10
+    assert [t.number for t in sampled] == sorted(t.number for t in sampled)
+
+    assert _reservoir_sample(iter(trials[:5]), 10, random.Random(0)) == trials[:5]
+
+
+def test_stratified_sample() -> None:
+    trials = _create_study(100).get_trials(deepcopy=False)
+    sampled = _stratified_sample(trials, 0, 20, random.Random(0))
+    assert len(sampled) == 20
+
+    # Every decile of the objective value must be represented.
+    sorted_numbers = [t.number for t in sorted(trials, key=lambda t: t.values[0])]
+    sampled_numbers = {t.number for t in sampled}
+    for i in range(10):
+        assert len(sampled_numbers & set(sorted_numbers[i * 10 : (i + 1) * 10])) == 2
+
+
+@pytest.mark.parametrize("sampling", ["reservoir", "stratified"])
+def test_importance_with_subsampling(sampling: str) -> None:
+    study = _create_study(60)
+    config = ImportanceConfig(max_trials=30, sampling=sampling, n_subsamples=4)
+    importance = get_param_importance_from_trials_cache(
+        InMemoryCache(),
+        study._study_id,
+        study.directions,
+        0,
+        study.get_trials(deepcopy=False),
+        config,
+    )
+    assert {i["name"] for i in importance} == {"x", "y"}
+    assert all(i["importance_std"] >= 0 for i in importance)
+    assert importance[0]["importance"] >= importance[1]["importance"]
+
+
+def test_invalid_sampling_mode() -> None:
+    with pytest.raises(ValueError):
+        ImportanceConfig(sampling="unknown")
+
+
+def test_fanova_evaluator() -> None:
+    pytest.importorskip("sklearn")
+    study = _create_study(20)
+    cache = InMemoryCache()
+    trials = study.get_trials(deepcopy=False)
+    for evaluator in ["ped_anova", "fanova"]:
+        importance = get_param_importance_from_trials_cache(
+            cache,
+            study._study_id,
+            study.directions,
+            0,
+            trials,
+            ImportanceConfig(evaluator=evaluator),
+        )
+        assert {i["name"] for i in importance} == {"x", "y"}
+    assert set(cache._param_importance_cache) == {
+        (study._study_id, 0, "ped_anova"),
+        (study._study_id, 0, "fanova"),
+    }
+
+    with pytest.raises(ValueError):
+        ImportanceConfig(evaluator="unknown")
+
+
+def test_fanova_evaluator_requires_sklearn() -> None:
+    with patch("importlib.util.find_spec", return_value=None):
+        with pytest.raises(ValueError, match="scikit-learn"):
+            ImportanceConfig(evaluator="fanova")
+
+
+def test_importance_distribution_names() -> None:
+    study = _create_study(20)
+    importance = get_param_importance_from_trials_cache(
+        InMemoryCache(), study._study_id, study.directions, 0, study.get_trials(deepcopy=False)
+    )
+    assert {i["name"]: i["distribution"] for i in importance} == {
+        "x": "FloatDistribution",
+        "y": "IntDistribution",
+    }
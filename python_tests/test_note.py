@@ -1,12 +1,21 @@
 from __future__ import annotations
 
+from contextlib import contextmanager
+import tempfile
+from typing import Any
+from typing import Iterator
 from unittest import TestCase
 from unittest.mock import patch
 
 import optuna
+from optuna.storages import RDBStorage
+from optuna.storages._rdb import storage as rdb_storage_module
 from optuna_dashboard import _note as note
+from optuna_dashboard._compression import COMPRESSED_PAYLOAD_PREFIX
 from optuna_dashboard import get_note
 from optuna_dashboard import save_note
+from optuna_dashboard._storage import ConcurrentWriteError
+from sqlalchemy.exc import IntegrityError
 
 
 class NoteTestCase(TestCase):
@@ -69,9 +78,150 @@ class NoteTestCase(TestCase):
         new_study = optuna.create_study(storage=storage, directions=old_study.directions)
         new_study.add_trials(old_study.get_trials(deepcopy=False))
 
+        new_trials = new_study.get_trials()
+        save_note(new_study, "Overwritten")
+        save_note(new_study, "Overwritten again")
+
         note.copy_notes(storage, old_study, new_study)
         system_attrs = new_study._storage.get_study_system_attrs(new_study._study_id)
-        for new_trial, body in zip(new_study.get_trials(), notes):
+        for new_trial, body in zip(new_trials, notes):
             actual = note.get_note_from_system_attrs(system_attrs, new_trial._trial_id)
             self.assertEqual(actual["body"], body)
-        self.assertEqual(get_note(new_study), "Study")
+            # Version 0 is reserved for the trials without notes.
+            self.assertEqual(actual["version"], 1)
+        study_note = note.get_note_from_system_attrs(system_attrs, None)
+        self.assertEqual(study_note, {"version": 3, "body": "Study"})
+
+    def test_copy_notes_without_notes(self) -> None:
+        old_study = optuna.create_study()
+        old_study.ask()
+        new_study = optuna.create_study(storage=old_study._storage)
+        new_study.add_trials(old_study.get_trials(deepcopy=False))
+
+        note.copy_notes(old_study._storage, old_study, new_study)
+        system_attrs = new_study._storage.get_study_system_attrs(new_study._study_id)
+        self.assertEqual(system_attrs, {})
+
+    @patch("optuna_dashboard._note.SYSTEM_ATTR_MAX_LENGTH", 5)
+    def test_save_note_only_writes_changed_chunks(self) -> None:
+        study = optuna.create_study()
+        storage = study._storage
+        save_note(study, "aaaaabbbbbccccc")
+
+        with patch.object(
+            storage, "set_study_system_attr", wraps=storage.set_study_system_attr
+        ) as mock:
+            save_note(study, "aaaaaBBBBB")
+        written_keys = {c.args[1] for c in mock.call_args_list}
+        self.assertEqual(
+            written_keys,
+            {
+                note.note_ver_key(None),
+                f"{note.note_str_key_prefix(None)}1",
+                f"{note.note_str_key_prefix(None)}2",
+            },
+        )
+
+        system_attrs = storage.get_study_system_attrs(study._study_id)
+        self.assertEqual(system_attrs[note.note_chunks_key(None)], 3)
+        self.assertEqual(system_attrs[f"{note.note_str_key_prefix(None)}2"], "")
+        self.assertEqual(get_note(study), "aaaaaBBBBB")
+
+    @patch("optuna_dashboard._note.SYSTEM_ATTR_MAX_LENGTH", 5)
+    def test_save_note_without_chunks_header(self) -> None:
+        # Notes saved by older versions do not have the note_chunks attribute.
+        study = optuna.create_study()
+        study._storage.set_study_system_attr(study._study_id, note.note_ver_key(None), 1)
+        for k, v in note.split_body("aaaaabbbbbccccc", None).items():
+            study._storage.set_study_system_attr(study._study_id, k, v)
+
+        save_note(study, "xyz")
+        self.assertEqual(get_note(study), "xyz")
+        system_attrs = study._storage.get_study_system_attrs(study._study_id)
+        self.assertEqual(system_attrs[note.note_chunks_key(None)], 3)
+
+    @patch("optuna_dashboard._note.SYSTEM_ATTR_MAX_LENGTH", 5)
+    def test_save_note_with_stale_chunks_header(self) -> None:
+        study = optuna.create_study()
+        save_note(study, "aaaaa")
+        # Older versions write more chunks without updating the note_chunks attribute.
+        for k, v in note.split_body("aaaaabbbbbccccc", None).items():
+            study._storage.set_study_system_attr(study._study_id, k, v)
+        self.assertEqual(get_note(study), "aaaaabbbbbccccc")
+
+        save_note(study, "xyz")
+        self.assertEqual(get_note(study), "xyz")
+        system_attrs = study._storage.get_study_system_attrs(study._study_id)
+        self.assertEqual(system_attrs[note.note_chunks_key(None)], 3)
+
+    @patch("optuna_dashboard._note.SYSTEM_ATTR_MAX_LENGTH", 5)
+    def test_note_chunks_are_looked_up_from_header(self) -> None:
+        class _UnscannableDict(dict):
+            def __iter__(self):  # type: ignore[no-untyped-def]
+                raise AssertionError("system attrs must not be scanned")
+
+            def items(self):  # type: ignore[no-untyped-def]
+                raise AssertionError("system attrs must not be scanned")
+
+        study = optuna.create_study()
+        save_note(study, "aaaaabbbbbccccc")
+        for i in range(100):
+            study._storage.set_study_system_attr(study._study_id, f"key{i}", i)
+        system_attrs = _UnscannableDict(study._storage.get_study_system_attrs(study._study_id))
+
+        self.assertEqual(
+            note.get_note_from_system_attrs(system_attrs, None)["body"], "aaaaabbbbbccccc"
+        )
+        attrs = note._diff_note_attrs(system_attrs, None, 2, "xyz")
+        self.assertEqual(attrs[f"{note.note_str_key_prefix(None)}2"], "")
+
+    def test_save_compressed_note(self) -> None:
+        study = optuna.create_study()
+        trial = study.ask()
+        body = "# Title\n" + "Lorem ipsum dolor sit amet. " * 1000
+
+        save_note(trial, body, compress=True)
+        self.assertEqual(get_note(trial), body)
+        system_attrs = study._storage.get_study_system_attrs(study._study_id)
+        self.assertEqual(system_attrs[note.note_chunks_key(trial._trial_id)], 1)
+
+        # Overwrite it without compression.
+        save_note(trial, "uncompressed")
+        self.assertEqual(get_note(trial), "uncompressed")
+
+    def test_save_note_starting_with_compression_marker(self) -> None:
+        study = optuna.create_study()
+        body = COMPRESSED_PAYLOAD_PREFIX + "not a compressed payload"
+        save_note(study, body)
+        self.assertEqual(get_note(study), body)
+
+    def test_save_note_with_rdb_storage(self) -> None:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            storage = RDBStorage(f"sqlite:///{tmpdir}/test.db")
+            study = optuna.create_study(storage=storage)
+            trial = study.ask()
+            for body in ["version 1", "version 2" * 1000, "version 3"]:
+                save_note(trial, body)
+                self.assertEqual(get_note(trial), body)
+            storage.engine.dispose()
+
+    def test_save_note_written_by_another_process(self) -> None:
+        create_scoped_session = rdb_storage_module._create_scoped_session
+
+        @contextmanager
+        def conflicting_session(*args: Any) -> Iterator[Any]:
+            with create_scoped_session(*args) as session:
+                yield session
+                if session.new:
+                    # Another process inserted the same note chunk before the commit.
+                    raise IntegrityError("INSERT", {}, Exception("UNIQUE constraint failed"))
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            storage = RDBStorage(f"sqlite:///{tmpdir}/test.db")
+            study = optuna.create_study(storage=storage)
+            with patch.object(
+                rdb_storage_module, "_create_scoped_session", conflicting_session
+            ), self.assertRaises(ConcurrentWriteError):
+                save_note(study, "conflict")
+            self.assertEqual(get_note(study), "")
+            storage.engine.dispose()
@@ -0,0 +1,65 @@
+from __future__ import annotations
+
+from unittest.mock import ANY
+
+import json
+
+import optuna
+from optuna_dashboard import save_note
+from optuna_dashboard._note import get_note_ref_from_system_attrs
+from optuna_dashboard._system_attrs_view import StudySystemAttrsView
+from optuna_dashboard.artifact._backend import list_trial_artifacts
+from optuna_dashboard.preferential._system_attrs import report_skip
+
+
+def test_partition_trial_attrs() -> None:
+    study = optuna.create_study()
+    trials = [study.ask() for _ in range(12)]
+    save_note(study, "study note")
+    save_note(trials[1], "note of trial 1")
+    save_note(trials[11], "note of trial 11")
+    artifact_meta = {
+        "artifact_id": "id",
+        "filename": "foo.txt",
+        "mimetype": "text/plain",
+        "encoding": None,
+    }
+    study._storage.set_study_system_attr(
+        study._study_id, f"dashboard:artifacts:{trials[1]._trial_id}:id", json.dumps(artifact_meta)
+    )
+
+    system_attrs = study._storage.get_study_system_attrs(study._study_id)
+    view = StudySystemAttrsView(system_attrs)
+
+    for trial in trials:
+        trial_id = trial._trial_id
+        # Keys of trial 1 must not be mixed with the ones of trial 11.
+        assert all(
+            key.startswith((f"dashboard:{trial_id}:", f"dashboard:artifacts:{trial_id}:"))
+            for key in view.trial_attrs(trial_id)
+        )
+        assert view.note_ref(trial_id) == get_note_ref_from_system_attrs(system_attrs, trial_id)
+        frozen_trial = study._storage.get_trial(trial_id)
+        assert list_trial_artifacts(
+            view.trial_attrs(trial_id), {}, frozen_trial
+        ) == list_trial_artifacts(system_attrs, {}, frozen_trial)
+
+    assert view.note_ref(None) == {"version": 1, "is_empty": False, "digest": ANY}
+    assert view.note_ref(trials[1]._trial_id) == {"version": 1, "is_empty": False, "digest": ANY}
+    assert view.note_ref(trials[2]._trial_id) == {"version": 0, "is_empty": True, "digest": ANY}
+
+
+def test_memoized_values() -> None:
+    study = optuna.create_study()
+    trial = study.ask()
+    report_skip(study._study_id, trial._trial_id, study._storage)
+    study.set_metric_names(["loss"])
+
+    view = StudySystemAttrsView(study._storage.get_study_system_attrs(study._study_id))
+    assert view.skipped_trial_ids == [trial._trial_id]
+    assert view.skipped_trial_ids is view.skipped_trial_ids
+    assert view.objective_names == ["loss"]
+    assert view.preferences == []
+    assert view.study_artifacts == []
+    assert view.plotly_graph_object_versions == {}
+    assert view.form_widgets is None
@@ -0,0 +1,166 @@
+from __future__ import annotations
+
+import json
+import math
+
+import numpy as np
+import optuna
+from optuna.study import StudyDirection
+from optuna.trial import TrialState
+from optuna_dashboard._app import create_app
+from optuna_dashboard._inmemory_cache import InMemoryCache
+from optuna_dashboard._pareto_front import get_pareto_front_trials
+from optuna_dashboard._trial_columns import extend_trial_columns
+from optuna_dashboard._trial_columns import get_trial_columns
+from optuna_dashboard._trial_columns import TrialColumns
+import pytest
+
+from .wsgi_client import send_request
+
+
+def test_trial_columns() -> None:
+    study = optuna.create_study()
+    trial = study.ask()
+    trial.suggest_float("x", 0, 1)
+    trial.suggest_categorical("y", ["a", "b"])
+    trial.set_user_attr("loss", 0.5)
+    trial.set_user_attr("label", "foo")
+    study.tell(trial, 1.0)
+    trial = study.ask()
+    trial.suggest_float("x", 0, 1)
+
+    trials = study.get_trials(deepcopy=False)
+    columns = TrialColumns().extend(trials)
+    assert len(columns) == 2
+    assert columns.number.tolist() == [0, 1]
+    assert columns.state.tolist() == [TrialState.COMPLETE.value, TrialState.RUNNING.value]
+    assert columns.values[0, 0] == 1.0 and math.isnan(columns.values[1, 0])
+    assert columns.params["x"].tolist() == [t.params["x"] for t in trials]
+    assert columns.params["y"][0] == trials[0].distributions["y"].to_internal_repr(
+        trials[0].params["y"]
+    )
+    assert math.isnan(columns.params["y"][1])
+    assert columns.user_attrs.keys() == {"loss"}
+    assert not math.isnan(columns.datetime_complete[0])
+    assert math.isnan(columns.datetime_complete[1])
+
+
+def test_extend_reuses_finished_trials() -> None:
+    study = optuna.create_study()
+    study.optimize(lambda t: t.suggest_float("x", 0, 1), n_trials=3)
+    running = study.ask()
+    columns = TrialColumns().extend(study.get_trials(deepcopy=False))
+    assert columns.extend(columns.trials) is columns
+
+    study.tell(running, 2.0)
+    trial = study.ask()
+    trial.set_user_attr("step", 3)
+    extended = columns.extend(study.get_trials(deepcopy=False))
+    assert extended is not columns
+    assert extended.number.tolist() == [0, 1, 2, 3, 4]
+    assert extended.values[3, 0] == 2.0
+    assert np.isnan(extended.user_attrs["step"][:4]).all()
+    assert extended.user_attrs["step"][4] == 3
+    # The original columns are left as they are.
+    assert columns.number.tolist() == [0, 1, 2, 3]
+
+
+@pytest.mark.parametrize(
+    "directions",
+    [
+        [StudyDirection.MINIMIZE, StudyDirection.MAXIMIZE],
+        [StudyDirection.MAXIMIZE, StudyDirection.MAXIMIZE],
+        [StudyDirection.MINIMIZE, StudyDirection.MINIMIZE, StudyDirection.MAXIMIZE],
+    ],
+)
+def test_get_pareto_front_trials(directions: list[StudyDirection]) -> None:
+    rng = np.random.RandomState(0)
+    study = optuna.create_study(directions=directions)
+    for _ in range(200):
+        trial = study.ask()
+        if rng.rand() < 0.1:
+            study.tell(trial, state=TrialState.FAIL)
+        else:
+            # Round the values so that some trials have the same values.
+            study.tell(trial, rng.randint(0, 10, size=len(directions)).tolist())
+
+    trials = study.get_trials(deepcopy=False)
+    columns = TrialColumns().extend(trials)
+    expected = get_pareto_front_trials(trials, directions)
+    assert [t.number for t in columns.get_pareto_front_trials(directions)] == [
+        t.number for t in expected
+    ]
+
+
+@pytest.mark.parametrize(
+    "values",
+    [
+        [[1.0, -math.inf]],
+        [[1.0, -math.inf], [1.0, -math.inf], [0.0, 2.0]],
+        [[math.inf, 0.0], [-math.inf, math.inf], [1.0, 1.0], [math.inf, math.inf]],
+    ],
+)
+def test_get_pareto_front_trials_with_inf(values: list[list[float]]) -> None:
+    directions = [StudyDirection.MAXIMIZE, StudyDirection.MAXIMIZE]
+    study = optuna.create_study(directions=directions)
+    for v in values:
+        study.add_trial(optuna.trial.create_trial(values=v))
+
+    trials = study.get_trials(deepcopy=False)
+    columns = TrialColumns().extend(trials)
+    expected = get_pareto_front_trials(trials, directions)
+    assert len(expected) > 0
+    assert [t.number for t in columns.get_pareto_front_trials(directions)] == [
+        t.number for t in expected
+    ]
+
+
+def test_get_best_trial() -> None:
+    study = optuna.create_study(direction="maximize")
+    columns = TrialColumns().extend(study.get_trials(deepcopy=False))
+    assert columns.get_best_trial(StudyDirection.MAXIMIZE) is None
+
+    for value in [1.0, 3.0, 2.0, 3.0]:
+        study.add_trial(optuna.trial.create_trial(value=value))
+    study.ask()
+    columns = TrialColumns().extend(study.get_trials(deepcopy=False))
+    best_trial = columns.get_best_trial(StudyDirection.MAXIMIZE)
+    assert best_trial is not None and best_trial.number == 1
+    best_trial = columns.get_best_trial(StudyDirection.MINIMIZE)
+    assert best_trial is not None and best_trial.number == 0
+
+
+def test_get_trial_columns_is_disabled_by_default() -> None:
+    study = optuna.create_study()
+    study.optimize(lambda t: t.suggest_float("x", 0, 1), n_trials=2)
+    trials = study.get_trials(deepcopy=False)
+
+    cache = InMemoryCache(enable_trial_columns=True)
+    columns = get_trial_columns(cache, study._study_id, trials)
+    assert columns is not None
+    assert get_trial_columns(cache, study._study_id, trials) is columns
+    assert columns.get_numbers_of_trial_ids([trials[1]._trial_id]) == [1]
+    assert [t.number for t in columns.get_trials_of_numbers([1, 5])] == [1]
+
+    cache = InMemoryCache()
+    assert get_trial_columns(cache, study._study_id, trials) is None
+    # The columns are still built for the features that always need them.
+    columns = extend_trial_columns(cache, study._study_id, trials)
+    assert extend_trial_columns(cache, study._study_id, trials) is columns
+    assert get_trial_columns(cache, study._study_id, trials) is None
+
+
+@pytest.mark.parametrize("n_objectives", [1, 2, 3])
+def test_api_with_trial_columns(n_objectives: int) -> None:
+    storage = optuna.storages.InMemoryStorage()
+    study = optuna.create_study(storage=storage, directions=["minimize"] * n_objectives)
+    study.optimize(
+        lambda t: [t.suggest_int(f"x{i}", 0, 5) for i in range(n_objectives)], n_trials=20
+    )
+    study.ask()
+
+    path = f"/api/studies/{study._study_id}"
+    _, _, expected = send_request(create_app(storage), path, "GET")
+    status, _, actual = send_request(create_app(storage, trial_columns=True), path, "GET")
+    assert status == 200
+    assert json.loads(actual)["best_trials"] == json.loads(expected)["best_trials"]
@@ -0,0 +1,78 @@
+from __future__ import annotations
+
+import numpy as np
+import optuna
+from optuna.trial import TrialState
+from optuna_dashboard._trial_columns import TrialColumns
+from optuna_dashboard._trial_query import query_trials
+from optuna_dashboard._trial_query import TrialColumnIndex
+import pytest
+
+
+SORT_KEYS = [("number", ""), ("value", "0"), ("param_internal", "x"), ("user_attr", "step")]
+
+
+def create_study(n_trials: int, n_running: int) -> optuna.Study:
+    rng = np.random.RandomState(0)
+    study = optuna.create_study()
+    for i in range(n_trials):
+        trial = study.ask()
+        # Round the values so that some trials have the same values.
+        trial.suggest_int("x", 0, 3)
+        if i % 3 == 0:
+            trial.set_user_attr("step", i % 4)
+        if rng.rand() < 0.1:
+            study.tell(trial, state=TrialState.FAIL)
+        else:
+            study.tell(trial, float(rng.randint(0, 5)))
+    for _ in range(n_running):
+        study.ask().suggest_int("x", 0, 3)
+    return study
+
+
+@pytest.mark.parametrize("descending", [False, True])
+def test_extend_merges_sort_orders(descending: bool) -> None:
+    study = create_study(n_trials=30, n_running=5)
+    columns = TrialColumns().extend(study.get_trials(deepcopy=False))
+    index = TrialColumnIndex(columns)
+    for key in SORT_KEYS:
+        index.sort_order(key, descending)
+
+    for i, trial in enumerate(study.get_trials(states=(TrialState.RUNNING,))):
+        study.tell(trial.number, float(i % 2))
+    study.optimize(lambda t: float(t.suggest_int("x", 0, 3)), n_trials=5)
+    study.ask()
+
+    columns = columns.extend(study.get_trials(deepcopy=False))
+    extended = index.extend(columns)
+    expected = TrialColumnIndex(columns)
+    for key in SORT_KEYS:
+        actual_order = extended.sort_order(key, descending)
+        expected_order = expected.sort_order(key, descending)
+        assert actual_order.positions.tolist() == expected_order.positions.tolist()
+        assert actual_order.numbers.tolist() == expected_order.numbers.tolist()
+        np.testing.assert_array_equal(actual_order.keys, expected_order.keys)
+
+
+def test_cursor_is_stable_when_trials_are_updated() -> None:
+    study = create_study(n_trials=20, n_running=3)
+    columns = TrialColumns().extend(study.get_trials(deepcopy=False))
+    index = TrialColumnIndex(columns)
+    first_page, cursor = query_trials(index, sort_by="value:0", limit=5)
+    assert cursor is not None
+
+    # The running trials come last, and are completed with the smallest value after the
+    # first page is fetched.
+    for trial in study.get_trials(states=(TrialState.RUNNING,)):
+        study.tell(trial.number, -1.0)
+    index = index.extend(columns.extend(study.get_trials(deepcopy=False)))
+
+    numbers = [t.number for t in first_page]
+    while cursor is not None:
+        page, cursor = query_trials(index, sort_by="value:0", limit=5, cursor=cursor)
+        numbers += [t.number for t in page]
+    assert len(numbers) == len(set(numbers))
+    # The completed trials come before the first page, so only they are skipped.
+    assert sorted(numbers) == [
+        t.number for t in study.get_trials() if t.values is None or t.values[0] >= 0
+    ]